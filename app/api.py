@@ -0,0 +1,287 @@
+"""JSON API for stored snapshots, mounted on the app's backend.
+
+Every endpoint needs ``?snapshot=<id>`` or ``?project=<name>`` (the newest
+snapshot of a configured project). There is no default: the store holds
+every session's uploads, and snapshot IDs are only handed to the session
+that scanned them. Snapshots never change, so a response is fully
+determined by its snapshot ID and parameters: bodies are serialized once
+into the API's own body cache, ETags come from that key, and gzip is
+applied once per body. ``/api/files`` pages with opaque cursors that stay
+on the cursor's snapshot, and both it and ``/api/dependencies`` stream
+NDJSON (``?format=ndjson`` or ``Accept: application/x-ndjson``) without
+building the whole list.
+"""
+
+import base64
+import binascii
+import hashlib
+import os
+import zlib
+from typing import Any, Callable, Iterator
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+
+from app.scanner.models import Snapshot
+from app.scanner.scheduler import PROJECT_HISTORY
+from app.scanner.serialize import (
+    file_page,
+    iter_edge_lines,
+    iter_file_lines,
+    snapshot_summary,
+    to_json,
+)
+from app.scanner.store import SNAPSHOT_STORE
+from app.scanner.viewcache import ViewCache
+
+API_VERSION = "1"
+JSON_TYPE = "application/json"
+NDJSON_TYPE = "application/x-ndjson"
+GZIP_MIN_BYTES = 1024
+GZIP_LEVEL = 6
+DEFAULT_PAGE_SIZE = 1000
+MAX_PAGE_SIZE = 10000
+NOT_FOUND = "Snapshot not found; it may have been evicted or not scanned yet."
+DEFAULT_MAX_API_BODIES = int(os.environ.get("INDU_MAX_CACHED_API_BODIES", "64"))
+DEFAULT_MAX_API_BYTES = int(os.environ.get("INDU_MAX_CACHED_API_BYTES", str(256_000_000)))
+
+
+class CachedBody:
+    """A serialized response body and, once asked for, its gzipped form."""
+
+    __slots__ = ("body", "_gzipped")
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self._gzipped: bytes | None = None
+
+    def gzipped(self) -> bytes:
+        if self._gzipped is None:
+            compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+            self._gzipped = compressor.compress(self.body) + compressor.flush()
+        return self._gzipped
+
+
+# Kept apart from VIEW_CACHE so large bodies cannot push out the UI's views;
+# bounded by the bodies' uncompressed size (the gzipped copy is smaller).
+API_CACHE = ViewCache(
+    DEFAULT_MAX_API_BODIES, DEFAULT_MAX_API_BYTES, weigh=lambda cached: len(cached.body)
+)
+
+
+def _etag(snapshot_id: str, view: str, params: tuple, gzipped: bool) -> str:
+    key = f"{API_VERSION}:{snapshot_id}:{view}:{params!r}".encode()
+    tag = hashlib.blake2b(key, digest_size=12).hexdigest()
+    return f'"{tag}-gzip"' if gzipped else f'"{tag}"'
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = [tag.strip() for tag in header.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+def _accepts_gzip(request: Request) -> bool:
+    for coding in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = coding.partition(";")
+        if name.strip() == "gzip":
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+def _wants_ndjson(request: Request) -> bool:
+    return (
+        request.query_params.get("format") == "ndjson"
+        or NDJSON_TYPE in request.headers.get("accept", "")
+    )
+
+
+def _error(status_code: int, message: str) -> Response:
+    return Response(to_json({"error": message}), status_code, media_type=JSON_TYPE)
+
+
+def _requested_snapshot(request: Request) -> Snapshot | None:
+    """The ``?snapshot=<id>`` snapshot, or the newest of ``?project=<name>``.
+
+    Raises ValueError when neither is given.
+    """
+    snapshot_id = request.query_params.get("snapshot")
+    if snapshot_id:
+        return SNAPSHOT_STORE.get(snapshot_id)
+    project = request.query_params.get("project")
+    if project:
+        return PROJECT_HISTORY.latest(project)
+    raise ValueError("Pass ?snapshot=<id> or ?project=<name>.")
+
+
+def _json_response(
+    request: Request,
+    snapshot: Snapshot,
+    view: str,
+    params: tuple,
+    build: Callable[[], Any],
+) -> Response:
+    snapshot_id = snapshot["snapshot_id"]
+    cached = API_CACHE.get(snapshot_id, view, params, lambda: CachedBody(to_json(build())))
+    gzipped = _accepts_gzip(request) and len(cached.body) >= GZIP_MIN_BYTES
+    headers = {
+        "ETag": _etag(snapshot_id, view, params, gzipped),
+        "Cache-Control": "no-cache",
+        "Vary": "Accept, Accept-Encoding",
+    }
+    if _not_modified(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    if gzipped:
+        headers["Content-Encoding"] = "gzip"
+        return Response(cached.gzipped(), headers=headers, media_type=JSON_TYPE)
+    return Response(cached.body, headers=headers, media_type=JSON_TYPE)
+
+
+def _gzip_stream(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _ndjson_response(
+    request: Request,
+    snapshot: Snapshot,
+    view: str,
+    params: tuple,
+    lines: Iterator[bytes],
+) -> Response:
+    gzipped = _accepts_gzip(request)
+    headers = {
+        "ETag": _etag(snapshot["snapshot_id"], f"{view}.ndjson", params, gzipped),
+        "Cache-Control": "no-cache",
+        "Vary": "Accept, Accept-Encoding",
+    }
+    if _not_modified(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    if gzipped:
+        headers["Content-Encoding"] = "gzip"
+        lines = _gzip_stream(lines)
+    return StreamingResponse(lines, headers=headers, media_type=NDJSON_TYPE)
+
+
+def encode_cursor(snapshot_id: str, offset: int) -> str:
+    return base64.urlsafe_b64encode(f"{snapshot_id}:{offset}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, int]:
+    """Raises ValueError for anything encode_cursor could not have produced."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    snapshot_id, _, offset = raw.rpartition(":")
+    if not snapshot_id or not offset.isdigit():
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return snapshot_id, int(offset)
+
+
+def latest_snapshot(request: Request) -> Response:
+    try:
+        snapshot = _requested_snapshot(request)
+    except ValueError as e:
+        return _error(400, str(e))
+    if snapshot is None:
+        return _error(404, NOT_FOUND)
+    return _json_response(request, snapshot, "summary", (), lambda: snapshot_summary(snapshot))
+
+
+def files(request: Request) -> Response:
+    cursor = request.query_params.get("cursor")
+    try:
+        limit = int(request.query_params.get("limit", DEFAULT_PAGE_SIZE))
+        if cursor:
+            snapshot_id, offset = decode_cursor(cursor)
+            snapshot = SNAPSHOT_STORE.get(snapshot_id)
+        else:
+            snapshot, offset = _requested_snapshot(request), 0
+    except ValueError as e:
+        return _error(400, str(e))
+    if snapshot is None:
+        return _error(404, NOT_FOUND)
+    if _wants_ndjson(request):
+        return _ndjson_response(
+            request, snapshot, "files", (offset,), iter_file_lines(snapshot, offset)
+        )
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    def build() -> dict:
+        records, next_offset = file_page(snapshot, offset, limit)
+        return {
+            "snapshot_id": snapshot["snapshot_id"],
+            "total": len(snapshot["files"]),
+            "offset": offset,
+            "files": records,
+            "next_cursor": (
+                encode_cursor(snapshot["snapshot_id"], next_offset)
+                if next_offset is not None
+                else None
+            ),
+        }
+
+    return _json_response(request, snapshot, "files", (offset, limit), build)
+
+
+def dependencies(request: Request) -> Response:
+    try:
+        snapshot = _requested_snapshot(request)
+    except ValueError as e:
+        return _error(400, str(e))
+    if snapshot is None:
+        return _error(404, NOT_FOUND)
+    if _wants_ndjson(request):
+        return _ndjson_response(request, snapshot, "edges", (), iter_edge_lines(snapshot))
+    return _json_response(
+        request,
+        snapshot,
+        "dependencies",
+        (),
+        lambda: {
+            "snapshot_id": snapshot["snapshot_id"],
+            "graph": snapshot["resolved_graph"],
+            "external_imports": snapshot["external_imports"],
+            "unresolved_imports": snapshot["unresolved_imports"],
+            "import_cycles": snapshot["import_cycles"],
+        },
+    )
+
+
+def unused(request: Request) -> Response:
+    try:
+        snapshot = _requested_snapshot(request)
+    except ValueError as e:
+        return _error(400, str(e))
+    if snapshot is None:
+        return _error(404, NOT_FOUND)
+    return _json_response(
+        request,
+        snapshot,
+        "unused",
+        (),
+        lambda: {
+            "snapshot_id": snapshot["snapshot_id"],
+            "count": len(snapshot["unused_components"]),
+            "unused_components": snapshot["unused_components"],
+        },
+    )
+
+
+api = Starlette(
+    routes=[
+        Route("/api/snapshot/latest", latest_snapshot),
+        Route("/api/files", files),
+        Route("/api/dependencies", dependencies),
+        Route("/api/unused", unused),
+    ]
+)
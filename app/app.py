@@ -1,4 +1,6 @@
 import reflex as rx
+from app.api import api
+from app.scanner.scheduler import run_configured_scheduler
 from app.components.sidebar import sidebar
 from app.components.metrics import dashboard_view, initial_view
 from app.components.file_browser import file_browser_view
@@ -15,19 +17,19 @@ def main_content() -> rx.Component:
             ("Upload", upload_view()),
             (
                 "Dashboard",
-                rx.cond(InduState.latest_snapshot, dashboard_view(), initial_view()),
+                rx.cond(InduState.has_snapshot, dashboard_view(), initial_view()),
             ),
             (
                 "Components",
-                rx.cond(InduState.latest_snapshot, file_browser_view(), initial_view()),
+                rx.cond(InduState.has_snapshot, file_browser_view(), initial_view()),
             ),
             (
                 "Dependencies",
-                rx.cond(InduState.latest_snapshot, dependencies_view(), initial_view()),
+                rx.cond(InduState.has_snapshot, dependencies_view(), initial_view()),
             ),
             (
                 "Unused",
-                rx.cond(InduState.latest_snapshot, unused_view(), initial_view()),
+                rx.cond(InduState.has_snapshot, unused_view(), initial_view()),
             ),
             upload_view(),
         ),
@@ -45,6 +47,7 @@ def index() -> rx.Component:
 
 app = rx.App(
     theme=rx.theme(appearance="light"),
+    api_transformer=api,
     head_components=[
         rx.el.link(rel="preconnect", href="https://fonts.googleapis.com"),
         rx.el.link(rel="preconnect", href="https://fonts.gstatic.com", cross_origin=""),
@@ -54,4 +57,5 @@ app = rx.App(
         ),
     ],
 )
-app.add_page(index, on_load=InduState.on_app_load)
\ No newline at end of file
+app.add_page(index, on_load=InduState.on_app_load)
+app.register_lifespan_task(run_configured_scheduler)
\ No newline at end of file
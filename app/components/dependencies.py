@@ -1,6 +1,26 @@
 import reflex as rx
+from plotly.graph_objects import Figure
 from app.states.state import InduState
-import plotly.graph_objects as go
+
+
+def graph_breadcrumb_item(item: tuple[str, int]) -> rx.Component:
+    return rx.el.div(
+        rx.el.span(
+            item[0],
+            on_click=lambda: InduState.set_graph_path_to_index(item[1]),
+            class_name="cursor-pointer hover:underline",
+        ),
+        rx.el.span("/", class_name="mx-2 text-gray-400"),
+    )
+
+
+def graph_package_item(name: str) -> rx.Component:
+    return rx.el.button(
+        rx.icon("folder", class_name="h-4 w-4 text-orange-500"),
+        rx.el.span(name, class_name="text-sm font-medium"),
+        on_click=lambda: InduState.drill_into_package(name),
+        class_name="flex items-center gap-2 px-3 py-1 border rounded-lg hover:bg-gray-100",
+    )
 
 
 def dependencies_view() -> rx.Component:
@@ -10,11 +30,46 @@ def dependencies_view() -> rx.Component:
                 "Dependencies",
                 class_name="text-3xl font-bold tracking-tight text-gray-900",
             ),
+            rx.el.label(
+                rx.el.input(
+                    type="checkbox",
+                    checked=InduState.show_all_files,
+                    on_change=InduState.set_show_all_files,
+                    class_name="mr-2",
+                ),
+                "Show every file",
+                class_name="flex items-center text-sm text-gray-600",
+            ),
             class_name="flex items-center justify-between",
         ),
         rx.el.div(
-            rx.plotly(data=InduState.dependency_figure, layout={"height": "800"}),
+            rx.cond(
+                InduState.show_all_files,
+                rx.fragment(),
+                rx.el.div(
+                    rx.el.div(
+                        rx.el.span(
+                            "Root",
+                            on_click=lambda: InduState.set_graph_path_to_index(-1),
+                            class_name="cursor-pointer hover:underline",
+                        ),
+                        rx.el.span("/", class_name="mx-2 text-gray-400"),
+                        rx.foreach(
+                            InduState.graph_path_with_indices, graph_breadcrumb_item
+                        ),
+                        class_name="flex items-center text-sm font-medium text-gray-500",
+                    ),
+                    rx.el.div(
+                        rx.foreach(InduState.graph_packages, graph_package_item),
+                        class_name="mt-3 flex flex-wrap gap-2",
+                    ),
+                    class_name="mb-4",
+                ),
+            ),
+            rx.plotly(
+                data=InduState.dependency_figure.to(Figure), layout={"height": "800"}
+            ),
             class_name="mt-6 bg-white p-6 rounded-xl border border-gray-200 shadow-sm",
         ),
         class_name="flex-1 p-6",
-    )
\ No newline at end of file
+    )
@@ -83,6 +83,50 @@ def architecture_violations_view() -> rx.Component:
     )
 
 
+def scan_progress_view() -> rx.Component:
+    return rx.cond(
+        InduState.is_scanning,
+        rx.el.div(
+            rx.el.div(
+                rx.spinner(class_name="text-orange-500"),
+                rx.el.span(
+                    InduState.scan_progress_label,
+                    class_name="text-sm text-gray-600 font-['JetBrains_Mono']",
+                ),
+                rx.el.span(
+                    f"{InduState.scan_progress['lines_of_code']} LOC",
+                    class_name="text-sm text-gray-500 ml-auto font-['JetBrains_Mono']",
+                ),
+                class_name="flex items-center gap-3",
+            ),
+            rx.el.div(
+                rx.el.div(
+                    class_name="h-2 bg-orange-500 rounded-full transition-all",
+                    style={"width": f"{InduState.scan_progress_percent}%"},
+                ),
+                class_name="mt-3 h-2 w-full bg-gray-100 rounded-full",
+            ),
+            class_name="bg-white p-4 rounded-xl border border-gray-200 shadow-sm mt-6 w-full",
+        ),
+        rx.fragment(),
+    )
+
+
+def partial_scan_banner() -> rx.Component:
+    return rx.cond(
+        InduState.partial_scan_reason != "",
+        rx.el.div(
+            rx.icon("triangle-alert", class_name="h-5 w-5 text-amber-500"),
+            rx.el.span(
+                f"Partial scan: {InduState.partial_scan_reason}.",
+                class_name="text-sm text-amber-800",
+            ),
+            class_name="flex items-center gap-3 mt-6 p-3 bg-amber-50 rounded-lg border border-amber-200",
+        ),
+        rx.fragment(),
+    )
+
+
 def dashboard_view() -> rx.Component:
     return rx.el.main(
         rx.el.div(
@@ -98,6 +142,8 @@ def dashboard_view() -> rx.Component:
             ),
             class_name="flex items-center justify-between",
         ),
+        scan_progress_view(),
+        partial_scan_banner(),
         rx.el.div(
             metric_card("files", "Total Files", InduState.total_files.to_string()),
             metric_card("database", "Total Size (MB)", InduState.total_size_mb),
@@ -122,6 +168,7 @@ def initial_view() -> rx.Component:
                 "Upload a project or run a scan on the local codebase.",
                 class_name="mt-2 text-md text-gray-500",
             ),
+            scan_progress_view(),
             class_name="text-center flex flex-col items-center justify-center",
         ),
         class_name="flex-1 p-6 flex items-center justify-center",
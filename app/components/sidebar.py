@@ -16,6 +16,52 @@ def nav_item(item: dict[str, str]) -> rx.Component:
     )
 
 
+def project_item(project: dict) -> rx.Component:
+    return rx.el.div(
+        rx.el.button(
+            rx.el.span(project["name"], class_name="truncate"),
+            rx.el.span(project["state"], class_name="text-xs text-gray-400"),
+            on_click=lambda: InduState.select_project(project["name"]),
+            class_name=rx.cond(
+                InduState.active_project == project["name"],
+                "flex flex-1 items-center justify-between gap-2 rounded-lg bg-orange-100 px-3 py-1.5 text-sm text-orange-600 font-semibold",
+                "flex flex-1 items-center justify-between gap-2 rounded-lg px-3 py-1.5 text-sm text-gray-500 hover:text-gray-900",
+            ),
+        ),
+        rx.el.button(
+            rx.icon("refresh-cw", class_name="h-3.5 w-3.5"),
+            on_click=lambda: InduState.queue_project_scan(project["name"]),
+            title="Scan now",
+            class_name="p-1 text-gray-400 hover:text-orange-600",
+        ),
+        class_name="flex items-center gap-1",
+    )
+
+
+def project_list() -> rx.Component:
+    return rx.cond(
+        InduState.projects.length() > 0,
+        rx.el.div(
+            rx.el.div(
+                rx.el.span(
+                    "Projects",
+                    class_name="text-xs font-semibold uppercase tracking-wide text-gray-400",
+                ),
+                rx.el.button(
+                    rx.icon("rotate-cw", class_name="h-3.5 w-3.5"),
+                    on_click=InduState.refresh_projects,
+                    title="Refresh",
+                    class_name="p-1 text-gray-400 hover:text-gray-700",
+                ),
+                class_name="flex items-center justify-between px-3",
+            ),
+            rx.foreach(InduState.projects, project_item),
+            class_name="flex flex-col gap-1 px-4 pb-4",
+        ),
+        rx.fragment(),
+    )
+
+
 def sidebar() -> rx.Component:
     return rx.el.div(
         rx.el.div(
@@ -34,6 +80,7 @@ def sidebar() -> rx.Component:
                 rx.foreach(InduState.nav_items, nav_item),
                 class_name="flex flex-col gap-1 p-4",
             ),
+            project_list(),
             class_name="flex-1 overflow-auto",
         ),
         rx.el.div(
@@ -56,6 +103,26 @@ def sidebar() -> rx.Component:
                 class_name="w-full justify-center bg-orange-500 text-white font-semibold py-3 px-4 rounded-lg shadow-sm hover:bg-orange-600 transition-colors disabled:bg-gray-400 disabled:cursor-not-allowed",
                 style={"boxShadow": "0px 1px 3px rgba(0,0,0,0.12)"},
             ),
+            rx.cond(
+                InduState.is_scanning,
+                rx.el.button(
+                    rx.icon("circle-stop", class_name="h-4 w-4"),
+                    "Cancel Scan",
+                    on_click=InduState.cancel_scan,
+                    class_name="mt-2 w-full flex items-center justify-center gap-2 bg-gray-200 text-gray-700 font-semibold py-2 px-4 rounded-lg hover:bg-gray-300 transition-colors text-sm",
+                ),
+                rx.fragment(),
+            ),
+            rx.el.label(
+                rx.el.input(
+                    type="checkbox",
+                    checked=InduState.watch_mode,
+                    on_change=InduState.set_watch_mode,
+                    class_name="mr-2",
+                ),
+                "Watch for changes",
+                class_name="mt-3 flex items-center text-sm text-gray-600",
+            ),
             class_name="border-t p-4 mt-auto",
         ),
         class_name="hidden border-r bg-gray-50/50 md:flex md:flex-col md:w-64",
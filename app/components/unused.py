@@ -10,6 +10,14 @@ def unused_component_item(item: str) -> rx.Component:
     )
 
 
+def import_cycle_item(cycle: str) -> rx.Component:
+    return rx.el.div(
+        rx.icon("refresh-cw", class_name="h-5 w-5 text-amber-500 shrink-0"),
+        rx.el.span(cycle, class_name="font-['JetBrains_Mono'] text-sm break-all"),
+        class_name="flex items-center gap-3 p-3 bg-amber-50 rounded-lg border border-amber-200",
+    )
+
+
 def unused_view() -> rx.Component:
     return rx.el.main(
         rx.el.div(
@@ -19,7 +27,7 @@ def unused_view() -> rx.Component:
                     class_name="text-3xl font-bold tracking-tight text-gray-900",
                 ),
                 rx.el.p(
-                    f"Found {InduState.filtered_unused_components.length()} unused Python files.",
+                    f"Found {InduState.filtered_unused_components.length()} source files unreachable from the app's entry points.",
                     class_name="text-gray-500 mt-1",
                 ),
             ),
@@ -73,5 +81,19 @@ def unused_view() -> rx.Component:
             ),
             class_name="mt-6 bg-white p-6 rounded-xl border border-gray-200 shadow-sm",
         ),
+        rx.cond(
+            InduState.import_cycles.length() > 0,
+            rx.el.div(
+                rx.el.h3(
+                    f"Import Cycles ({InduState.import_cycles.length()})",
+                    class_name="text-lg font-semibold text-gray-800 mb-4",
+                ),
+                rx.el.div(
+                    rx.foreach(InduState.import_cycles, import_cycle_item),
+                    class_name="flex flex-col gap-3",
+                ),
+                class_name="mt-6 bg-white p-6 rounded-xl border border-gray-200 shadow-sm",
+            ),
+        ),
         class_name="flex-1 p-6",
     )
\ No newline at end of file
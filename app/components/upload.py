@@ -40,6 +40,14 @@ def upload_view() -> rx.Component:
                         rx.spinner(class_name="mt-4"),
                         rx.el.div(),
                     ),
+                    rx.cond(
+                        InduState.upload_progress_label != "",
+                        rx.el.p(
+                            InduState.upload_progress_label,
+                            class_name="text-sm text-gray-500 mt-2 font-['JetBrains_Mono']",
+                        ),
+                        rx.el.div(),
+                    ),
                     class_name="flex flex-col items-center justify-center p-12 border-2 border-dashed border-gray-300 rounded-lg bg-gray-50 hover:bg-gray-100 transition-colors",
                 ),
                 id="upload_project",
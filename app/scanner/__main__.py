@@ -0,0 +1,121 @@
+"""Headless scanner: ``python -m app.scanner PATH [-o snapshot.json]``.
+
+Imports neither Reflex nor Plotly, so it starts fast enough to run as a
+pre-commit hook or CI gate. Exits 1 when a ``--fail-on`` check trips.
+"""
+
+import argparse
+import os
+import sys
+
+from app.scanner.control import ScanBudget, ScanControl
+from app.scanner.engine import scan_project
+from app.scanner.modules import DEFAULT_SOURCE_ROOTS
+from app.scanner.reachability import DEFAULT_ENTRY_POINTS
+from app.scanner.serialize import dump_snapshot
+
+FAIL_CHECKS = {
+    "unused": "unused_components",
+    "cycles": "import_cycles",
+    "violations": "architecture_violations",
+    "unresolved": "unresolved_imports",
+}
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.scanner",
+        description="Scan a project directory or zip archive and write its snapshot as JSON.",
+    )
+    parser.add_argument("path", help="project directory or .zip archive")
+    parser.add_argument("-o", "--output", default="-", help="output file ('-' for stdout)")
+    parser.add_argument("--indent", type=int, default=None)
+    parser.add_argument(
+        "--workers", type=int, default=None, help="analysis processes (default: CPUs)"
+    )
+    parser.add_argument(
+        "--cache", action="store_true", help="reuse per-file results from the scan cache"
+    )
+    parser.add_argument("--max-seconds", type=float, default=0)
+    parser.add_argument("--max-files", type=int, default=0)
+    parser.add_argument("--max-bytes", type=int, default=0)
+    parser.add_argument(
+        "--entry-point",
+        action="append",
+        dest="entry_points",
+        help="file, directory or glob that counts as used (repeatable)",
+    )
+    parser.add_argument(
+        "--source-root",
+        action="append",
+        dest="source_roots",
+        help="directory that Python imports resolve from (repeatable)",
+    )
+    parser.add_argument(
+        "--fail-on",
+        action="append",
+        default=[],
+        choices=sorted(FAIL_CHECKS),
+        help="exit 1 if the snapshot reports any of these (repeatable)",
+    )
+    args = parser.parse_args(argv)
+    # A mistyped path would otherwise scan as an empty project and pass.
+    if os.path.isdir(args.path):
+        if not os.access(args.path, os.R_OK | os.X_OK):
+            parser.error(f"cannot read directory: {args.path}")
+    elif os.path.isfile(args.path):
+        import zipfile
+
+        try:
+            is_zip = zipfile.is_zipfile(args.path)
+        except OSError as e:
+            parser.error(f"cannot read {args.path}: {e.strerror}")
+        if not is_zip:
+            parser.error(f"not a directory or zip archive: {args.path}")
+    else:
+        parser.error(f"no such directory or zip archive: {args.path}")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    control = ScanControl(
+        ScanBudget(
+            max_seconds=args.max_seconds,
+            max_files=args.max_files,
+            max_bytes=args.max_bytes,
+        )
+    )
+    cache = None
+    if args.cache:
+        from app.scanner.cache import ScanCache
+
+        cache = ScanCache()
+    try:
+        snapshot = scan_project(
+            args.path,
+            workers=args.workers,
+            cache=cache,
+            control=control,
+            source_roots=args.source_roots or DEFAULT_SOURCE_ROOTS,
+            entry_points=args.entry_points or DEFAULT_ENTRY_POINTS,
+        )
+    finally:
+        if cache is not None:
+            cache.close()
+    if args.output == "-":
+        dump_snapshot(snapshot, sys.stdout, indent=args.indent)
+        sys.stdout.write("\n")
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            dump_snapshot(snapshot, f, indent=args.indent)
+    failed = [check for check in args.fail_on if snapshot[FAIL_CHECKS[check]]]
+    for check in failed:
+        print(
+            f"{check}: {len(snapshot[FAIL_CHECKS[check]])} found", file=sys.stderr
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+import os
+import threading
+from collections import OrderedDict
+
+from app.scanner.filetree import find_folder, tree_for
+from app.scanner.layout import GraphLayout, layered_layout
+from app.scanner.models import Snapshot
+
+MAX_CACHED_VIEWS = 64
+EDGE_WIDTHS = (1, 2, 3, 4)
+
+
+class AggregateView:
+    """The dependency graph collapsed to the children of one folder.
+
+    Nodes are the folder's direct subfolders (keyed ``path/``) and files,
+    plus one node per outside sibling folder that they import from
+    (``kinds`` is ``"external"``). ``edges`` maps node pairs to the number
+    of file-level imports between them.
+    """
+
+    __slots__ = (
+        "path",
+        "nodes",
+        "kinds",
+        "lines_of_code",
+        "file_counts",
+        "edges",
+        "layout",
+        "edge_traces",
+    )
+
+    def __init__(self, path: list[str]):
+        self.path = path
+        self.nodes: list[str] = []
+        self.kinds: list[str] = []
+        self.lines_of_code: list[int] = []
+        self.file_counts: list[int] = []
+        self.edges: dict[tuple[str, str], int] = {}
+        self.layout: GraphLayout | None = None
+        self.edge_traces: list[tuple[int, list, list]] = []
+
+
+def _group_key(path: str, prefix: str, depth: int) -> tuple[str, bool]:
+    """The node ``path`` collapses into when viewing the folder ``prefix``.
+
+    Returns the key and whether it lies inside ``prefix``. Outside paths
+    collapse to the first folder where they diverge from ``prefix``.
+    """
+    parts = path.split(os.sep)
+    inside = not prefix or path.startswith(prefix + os.sep)
+    if not inside:
+        prefix_parts = prefix.split(os.sep)
+        depth = 0
+        while depth < len(prefix_parts) and parts[depth] == prefix_parts[depth]:
+            depth += 1
+    if depth == len(parts) - 1:
+        return path, inside
+    return os.sep.join(parts[: depth + 1]) + os.sep, inside
+
+
+def aggregate_graph(snapshot: Snapshot, path: list[str]) -> AggregateView:
+    """Collapse the resolved graph to one folder level.
+
+    Only the folder's own subtree is walked, so drilling into a package
+    costs time proportional to that package, not the whole repository.
+    """
+    view = AggregateView(path)
+    folder = find_folder(tree_for(snapshot), path)
+    if folder is None:
+        return view
+    graph = snapshot.get("resolved_graph", {})
+    prefix = os.sep.join(path)
+    depth = len(path)
+    index: dict[str, int] = {}
+
+    def node_for(key: str, kind: str) -> int:
+        i = index.get(key)
+        if i is None:
+            i = index[key] = len(view.nodes)
+            view.nodes.append(key)
+            view.kinds.append(kind)
+            view.lines_of_code.append(0)
+            view.file_counts.append(0)
+        return i
+
+    edges = view.edges
+    for name in folder.folders:
+        node_for(os.path.join(prefix, name) + os.sep if prefix else name + os.sep, "folder")
+    stack = [(folder, prefix)]
+    while stack:
+        node, directory = stack.pop()
+        for name, child in node.folders.items():
+            stack.append((child, os.path.join(directory, name) if directory else name))
+        for name, lines_of_code in node.files:
+            file_path = os.path.join(directory, name) if directory else name
+            source, _ = _group_key(file_path, prefix, depth)
+            i = node_for(source, "file" if source == file_path else "folder")
+            view.lines_of_code[i] += lines_of_code
+            view.file_counts[i] += 1
+            for target_path in graph.get(file_path, ()):
+                target, inside = _group_key(target_path, prefix, depth)
+                if target == source:
+                    continue
+                if inside:
+                    node_for(target, "file" if target == target_path else "folder")
+                else:
+                    node_for(target, "external")
+                edges[source, target] = edges.get((source, target), 0) + 1
+
+    adjacency: dict[str, list[str]] = {key: [] for key in view.nodes}
+    for source, target in edges:
+        adjacency[source].append(target)
+    layout = view.layout = layered_layout(adjacency)
+    positions = {node: i for i, node in enumerate(layout.nodes)}
+    heaviest = max(edges.values(), default=1)
+    buckets: list[tuple[list, list]] = [([], []) for _ in EDGE_WIDTHS]
+    for (source, target), weight in edges.items():
+        s = positions[source]
+        t = positions[target]
+        bucket_x, bucket_y = buckets[(weight - 1) * len(EDGE_WIDTHS) // heaviest]
+        bucket_x += (layout.x[s], layout.x[t], None)
+        bucket_y += (layout.y[s], layout.y[t], None)
+    view.edge_traces = [
+        (width, xs, ys) for width, (xs, ys) in zip(EDGE_WIDTHS, buckets) if xs
+    ]
+    return view
+
+
+_views: OrderedDict[tuple[str, tuple[str, ...]], AggregateView] = OrderedDict()
+_views_lock = threading.Lock()
+
+
+def aggregate_view_for(snapshot: Snapshot, path: list[str]) -> AggregateView:
+    """Return the cached aggregate view of ``path``, building it on first use."""
+    key = (snapshot["snapshot_id"], tuple(path))
+    with _views_lock:
+        view = _views.get(key)
+        if view is not None:
+            _views.move_to_end(key)
+            return view
+    view = aggregate_graph(snapshot, path)
+    with _views_lock:
+        _views[key] = view
+        while len(_views) > MAX_CACHED_VIEWS:
+            _views.popitem(last=False)
+    return view
@@ -0,0 +1,174 @@
+import ast
+import logging
+import os
+
+from app.scanner.javascript import (
+    JS_EXTENSIONS,
+    TSCONFIG_NAMES,
+    scan_js_imports,
+    tsconfig_options,
+)
+from app.scanner.models import FileResult
+from app.scanner.parse_cache import PARSE_CACHE, RawImport, content_digest
+
+
+class FileContext:
+    """A file's bytes, read once and shared by every analyzer in the pipeline."""
+
+    def __init__(self, base_path: str, rel_path: str, extension: str, data: bytes):
+        self.base_path = base_path
+        self.rel_path = rel_path
+        self.full_path = os.path.join(base_path, rel_path)
+        self.extension = extension
+        self.data = data
+        self._text: str | None = None
+        self._python_tree: ast.AST | None = None
+        self._python_parsed = False
+        self._digest: bytes | None = None
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self.data.decode("utf-8", errors="ignore")
+        return self._text
+
+    @property
+    def digest(self) -> bytes:
+        if self._digest is None:
+            self._digest = content_digest(self.data)
+        return self._digest
+
+    @property
+    def python_tree(self) -> ast.AST | None:
+        """The parsed module, or None if the source has a syntax error."""
+        if not self._python_parsed:
+            self._python_parsed = True
+            try:
+                self._python_tree = ast.parse(self.text)
+            except SyntaxError as e:
+                logging.exception(f"Could not parse Python file {self.full_path}: {e}")
+        return self._python_tree
+
+
+class Analyzer:
+    """Base class for per-file analyzers; subclasses fill in fields of the result."""
+
+    def analyze(self, ctx: FileContext, result: FileResult) -> None:
+        raise NotImplementedError
+
+
+def count_lines(data: bytes) -> int:
+    """Count lines the way universal-newline text iteration does (\\n, \\r, \\r\\n)."""
+    if not data:
+        return 0
+    lines = data.count(b"\n") + data.count(b"\r") - data.count(b"\r\n")
+    if not data.endswith((b"\n", b"\r")):
+        lines += 1
+    return lines
+
+
+def raw_python_imports(tree: ast.AST) -> tuple[RawImport, ...]:
+    imports = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imports.append(RawImport(alias.name, 0, None))
+        elif isinstance(node, ast.ImportFrom):
+            imports.append(
+                RawImport(
+                    node.module,
+                    node.level,
+                    tuple(alias.name for alias in node.names),
+                )
+            )
+    return tuple(imports)
+
+
+def _relative_module(
+    module: str | None, level: int, file_path: str, base_path: str
+) -> str:
+    rel_path_base = os.path.dirname(file_path)
+    for _ in range(level - 1):
+        rel_path_base = os.path.dirname(rel_path_base)
+    module_path_parts = module.split(".") if module else []
+    abs_path = os.path.abspath(os.path.join(rel_path_base, *module_path_parts))
+    rel_to_scan_root = os.path.relpath(abs_path, base_path)
+    return os.path.normpath(rel_to_scan_root).replace(os.sep, ".")
+
+
+def resolve_python_imports(
+    raw_imports: tuple[RawImport, ...], file_path: str, base_path: str
+) -> tuple[list[str], list[str]]:
+    """Turn raw import nodes into dotted module names relative to the scan root.
+
+    Returns the imported modules, plus ``module.name`` candidates for every
+    ``from module import name`` so a resolver can tell when ``name`` is itself
+    a submodule.
+    """
+    imports = set()
+    submodules = set()
+    for item in raw_imports:
+        if item.level > 0:
+            module = _relative_module(item.module, item.level, file_path, base_path)
+            if item.module:
+                imports.add(module)
+        elif item.module:
+            module = item.module
+            imports.add(module)
+        else:
+            continue
+        if item.names and not module.startswith(".."):
+            prefix = "" if module == "." else f"{module}."
+            for name in item.names:
+                if name != "*":
+                    submodules.add(prefix + name)
+    return sorted(imports), sorted(submodules)
+
+
+class LinesOfCodeAnalyzer(Analyzer):
+    def analyze(self, ctx: FileContext, result: FileResult) -> None:
+        result["metrics"]["lines_of_code"] = count_lines(ctx.data)
+
+
+class PythonImportAnalyzer(Analyzer):
+    def analyze(self, ctx: FileContext, result: FileResult) -> None:
+        if ctx.extension != ".py":
+            return
+        raw_imports = PARSE_CACHE.get_or_parse(ctx.digest, lambda: _parse_raw(ctx))
+        result["imports"], result["submodule_imports"] = resolve_python_imports(
+            raw_imports, ctx.full_path, ctx.base_path
+        )
+
+
+def _parse_raw(ctx: FileContext) -> tuple[RawImport, ...]:
+    tree = ctx.python_tree
+    return raw_python_imports(tree) if tree is not None else ()
+
+
+class JavaScriptImportAnalyzer(Analyzer):
+    """Records JS/TS module specifiers as written; resolution happens per snapshot."""
+
+    def analyze(self, ctx: FileContext, result: FileResult) -> None:
+        if ctx.extension not in JS_EXTENSIONS:
+            return
+        raw_imports = PARSE_CACHE.get_or_parse(
+            b"js:" + ctx.digest,
+            lambda: tuple(
+                RawImport(specifier, 0, None) for specifier in scan_js_imports(ctx.text)
+            ),
+        )
+        result["imports"] = sorted({item.module for item in raw_imports})
+
+
+class TsConfigAnalyzer(Analyzer):
+    def analyze(self, ctx: FileContext, result: FileResult) -> None:
+        if os.path.basename(ctx.rel_path) in TSCONFIG_NAMES:
+            result["js_config"] = tsconfig_options(ctx.rel_path, ctx.text)
+
+
+DEFAULT_ANALYZERS: tuple[Analyzer, ...] = (
+    LinesOfCodeAnalyzer(),
+    PythonImportAnalyzer(),
+    JavaScriptImportAnalyzer(),
+    TsConfigAnalyzer(),
+)
@@ -0,0 +1,147 @@
+import json
+import logging
+import os
+import time
+from typing import NamedTuple, Sequence
+
+from app.scanner.analyzers import DEFAULT_ANALYZERS, Analyzer
+from app.scanner.models import FileResult
+from app.scanner.parse_cache import DEFAULT_CACHE_DIR
+
+SCAN_CACHE_VERSION = 2
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class FileSignature(NamedTuple):
+    size: int
+    mtime_ns: int
+    inode: int
+
+
+def file_signature(file_path: str) -> FileSignature | None:
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return FileSignature(st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+def cache_version(analyzers: Sequence[Analyzer]) -> str:
+    """Version stamp for cached results; changes whenever the analyzer set does."""
+    names = ",".join(
+        f"{type(a).__module__}.{type(a).__qualname__}" for a in analyzers
+    )
+    return f"{SCAN_CACHE_VERSION}:{names}"
+
+
+class ScanCache:
+    """On-disk cache of per-file analyzer results keyed by stat signature.
+
+    Entries live in a SQLite database under the cache dir. Each row is keyed on
+    (scan root, relative path) and is only a hit while the file's
+    (size, mtime_ns, inode) still match. A version mismatch drops every row,
+    and once the stored payloads exceed ``max_bytes`` the least recently used
+    rows are evicted.
+    """
+
+    def __init__(
+        self,
+        version: str | None = None,
+        path: str | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        import sqlite3
+
+        if version is None:
+            version = cache_version(DEFAULT_ANALYZERS)
+        if path is None:
+            os.makedirs(DEFAULT_CACHE_DIR, exist_ok=True)
+            path = os.path.join(DEFAULT_CACHE_DIR, "scan_cache.sqlite3")
+        self.path = path
+        self.max_bytes = max_bytes
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "root TEXT, path TEXT, size INTEGER, mtime_ns INTEGER, "
+                "inode INTEGER, payload TEXT, last_used REAL, "
+                "PRIMARY KEY (root, path))"
+            )
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used)"
+            )
+            row = self.conn.execute(
+                "SELECT value FROM meta WHERE key = 'version'"
+            ).fetchone()
+            if row is None or row[0] != version:
+                self.conn.execute("DELETE FROM entries")
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)",
+                    (version,),
+                )
+
+    def get_many(
+        self, root: str, signatures: dict[str, FileSignature]
+    ) -> dict[str, FileResult]:
+        hits: dict[str, FileResult] = {}
+        rows = self.conn.execute(
+            "SELECT path, size, mtime_ns, inode, payload FROM entries WHERE root = ?",
+            (root,),
+        )
+        for path, size, mtime_ns, inode, payload in rows:
+            if signatures.get(path) == (size, mtime_ns, inode):
+                hits[path] = json.loads(payload)
+        if hits:
+            now = time.time()
+            with self.conn:
+                self.conn.executemany(
+                    "UPDATE entries SET last_used = ? WHERE root = ? AND path = ?",
+                    [(now, root, path) for path in hits],
+                )
+        return hits
+
+    def put_many(
+        self, root: str, entries: list[tuple[str, FileSignature, FileResult]]
+    ) -> None:
+        if not entries:
+            return
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO entries "
+                "(root, path, size, mtime_ns, inode, payload, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (root, path, *signature, json.dumps(result), now)
+                    for path, signature, result in entries
+                ],
+            )
+        self._evict()
+
+    def _evict(self) -> None:
+        (total,) = self.conn.execute(
+            "SELECT COALESCE(SUM(LENGTH(payload)), 0) FROM entries"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        target = int(self.max_bytes * 0.9)
+        rows = self.conn.execute(
+            "SELECT rowid, LENGTH(payload) FROM entries ORDER BY last_used"
+        ).fetchall()
+        evict = []
+        for rowid, length in rows:
+            if total <= target:
+                break
+            evict.append((rowid,))
+            total -= length
+        with self.conn:
+            self.conn.executemany("DELETE FROM entries WHERE rowid = ?", evict)
+        logging.info(f"Evicted {len(evict)} scan cache entries from {self.path}")
+
+    def close(self) -> None:
+        self.conn.close()
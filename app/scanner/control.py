@@ -0,0 +1,69 @@
+import os
+import threading
+import time
+from typing import TypedDict
+
+
+class ScanBudget(TypedDict, total=False):
+    max_seconds: float
+    max_files: int
+    max_bytes: int
+
+
+# Limits for scans started from the UI; 0 disables a limit.
+DEFAULT_SCAN_BUDGET = ScanBudget(
+    max_seconds=float(os.environ.get("INDU_SCAN_MAX_SECONDS", "600")),
+    max_files=int(os.environ.get("INDU_SCAN_MAX_FILES", "200000")),
+    max_bytes=int(os.environ.get("INDU_SCAN_MAX_BYTES", str(2_000_000_000))),
+)
+
+
+class ScanControl:
+    """Cancellation flag and optional budgets, checked by the engine between batches.
+
+    Once a check trips, ``stop_reason`` records why and the scan finishes
+    early with whatever it has processed so far.
+    """
+
+    def __init__(self, budget: ScanBudget | None = None):
+        self.budget = budget or {}
+        self.started = time.monotonic()
+        self.stop_reason = ""
+        self._stopped = False
+        self._cancelled = threading.Event()
+
+    @property
+    def max_files(self) -> int | None:
+        return self.budget.get("max_files") or None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def should_stop(self, bytes_read: int = 0) -> bool:
+        """True once the scan is cancelled or out of time or bytes."""
+        if self._stopped:
+            return True
+        max_seconds = self.budget.get("max_seconds")
+        max_bytes = self.budget.get("max_bytes")
+        if self._cancelled.is_set():
+            self.stop_reason = "cancelled"
+        elif max_seconds and time.monotonic() - self.started >= max_seconds:
+            self.stop_reason = f"time budget of {max_seconds:g}s exceeded"
+        elif max_bytes and bytes_read >= max_bytes:
+            self.stop_reason = f"byte budget of {max_bytes:,} bytes reached"
+        else:
+            return False
+        self._stopped = True
+        return True
+
+    def over_file_budget(self, files: int) -> bool:
+        """True if more than ``max_files`` files were found; the rest are dropped."""
+        if not self.max_files or files <= self.max_files:
+            return False
+        if not self.stop_reason:
+            self.stop_reason = f"file budget of {self.max_files:,} files exceeded"
+        return True
@@ -0,0 +1,151 @@
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from app.scanner.control import ScanBudget, ScanControl
+from app.scanner.progress import ProgressCallback, ScanProgress
+from app.scanner.vfs import as_filesystem
+
+DEFAULT_TTL_SECONDS = float(os.environ.get("INDU_SCAN_TTL", "15"))
+DEFAULT_MAX_RESULTS = 16
+POLL_SECONDS = 0.1
+
+ScanFn = Callable[[ProgressCallback, ScanControl], Any]
+
+
+def tree_fingerprint(scan_path: str) -> str:
+    """Cheap fingerprint of a directory or archive; see FileSystem.fingerprint."""
+    fs = as_filesystem(scan_path)
+    try:
+        return fs.fingerprint()
+    finally:
+        fs.close()
+
+
+def scan_key(
+    scan_path: str, budget: ScanBudget | None = None, options: tuple = ()
+) -> tuple:
+    return (
+        os.path.realpath(scan_path),
+        tree_fingerprint(scan_path),
+        tuple(sorted((budget or {}).items())),
+        options,
+    )
+
+
+class _Flight:
+    def __init__(self, budget: ScanBudget | None):
+        self.control = ScanControl(budget)
+        self.subscribers: list[ProgressCallback] = []
+        self.waiters = 0
+        self.last_progress: ScanProgress | None = None
+        self.future: asyncio.Future | None = None
+
+    def publish(self, progress: ScanProgress) -> None:
+        self.last_progress = progress
+        for callback in list(self.subscribers):
+            callback(progress)
+
+
+class ScanCoordinator:
+    """Process-wide single-flight scanning with a short-lived result cache.
+
+    Requests for the same resolved path, tree fingerprint, budget and options
+    (anything else that changes the result, e.g. entry points) share one
+    in-flight scan, and a completed full scan is served to later requests for
+    ``ttl_seconds``. A subscriber that cancels only detaches itself; the
+    underlying scan is cancelled once nobody is waiting on it.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_results: int = DEFAULT_MAX_RESULTS,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_results = max_results
+        self._flights: dict[tuple, _Flight] = {}
+        self._results: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+
+    def _cached(self, key: tuple) -> Any:
+        entry = self._results.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if time.monotonic() >= expires_at:
+            del self._results[key]
+            return None
+        self._results.move_to_end(key)
+        return result
+
+    def _finish(self, key: tuple, flight: _Flight, future: asyncio.Future) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if future.cancelled() or future.exception() is not None:
+            return
+        if flight.control.stop_reason or self.ttl_seconds <= 0:
+            return
+        self._results[key] = (time.monotonic() + self.ttl_seconds, future.result())
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_results:
+            self._results.popitem(last=False)
+
+    def invalidate(self, scan_path: str | None = None) -> None:
+        if scan_path is None:
+            self._results.clear()
+            return
+        root = os.path.realpath(scan_path)
+        for key in [k for k in self._results if k[0] == root]:
+            del self._results[key]
+
+    async def run(
+        self,
+        scan_path: str,
+        scan_fn: ScanFn,
+        budget: ScanBudget | None = None,
+        progress: ProgressCallback | None = None,
+        control: ScanControl | None = None,
+        options: tuple = (),
+    ) -> Any:
+        """Run ``scan_fn`` in a thread, or join an identical scan already running.
+
+        ``scan_fn(progress, control)`` does the blocking work. Returns its
+        result, or None if ``control`` was cancelled before the scan finished.
+        """
+        key = await asyncio.to_thread(scan_key, scan_path, budget, options)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+        flight = self._flights.get(key)
+        if flight is None or flight.control.cancelled:
+            flight = _Flight(budget)
+            flight.future = asyncio.ensure_future(
+                asyncio.to_thread(scan_fn, flight.publish, flight.control)
+            )
+            flight.future.add_done_callback(
+                lambda future: self._finish(key, flight, future)
+            )
+            self._flights[key] = flight
+        flight.waiters += 1
+        if progress is not None:
+            flight.subscribers.append(progress)
+            if flight.last_progress is not None:
+                progress(flight.last_progress)
+        try:
+            while True:
+                done, _ = await asyncio.wait({flight.future}, timeout=POLL_SECONDS)
+                if done:
+                    return flight.future.result()
+                if control is not None and control.cancelled:
+                    return None
+        finally:
+            flight.waiters -= 1
+            if progress is not None:
+                flight.subscribers.remove(progress)
+            if not flight.waiters and not flight.future.done():
+                flight.control.cancel()
+
+
+SCAN_COORDINATOR = ScanCoordinator()
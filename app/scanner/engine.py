@@ -0,0 +1,427 @@
+import itertools
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from typing import TYPE_CHECKING, Iterator, Sequence
+
+from app.scanner.analyzers import DEFAULT_ANALYZERS, Analyzer, FileContext
+from app.scanner.cache import ScanCache
+from app.scanner.control import ScanControl
+from app.scanner.filetable import FileTable
+from app.scanner.javascript import JS_EXTENSIONS, JsResolver
+from app.scanner.models import FileMetrics, FileResult, FolderMetrics, Snapshot
+from app.scanner.modules import DEFAULT_SOURCE_ROOTS, ModuleIndex, resolve_import_graph
+from app.scanner.parse_cache import PARSE_CACHE
+from app.scanner.progress import ProgressCallback, ProgressReporter
+from app.scanner.reachability import DEFAULT_ENTRY_POINTS, analyze_reachability
+from app.scanner.vfs import FileSystem, as_filesystem
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ProcessPoolExecutor
+
+IGNORE_DIRS = {".git", "__pycache__", "node_modules", ".web", "assets"}
+IGNORE_FILES = {".DS_Store"}
+DEFAULT_BATCH_SIZE = 256
+
+
+def walk_project(
+    scan_path: str | FileSystem,
+    reporter: ProgressReporter | None = None,
+    control: ScanControl | None = None,
+) -> list[str]:
+    """Return the scan-root-relative paths of every file that should be analyzed.
+
+    With a control, the walk stops early once it is cancelled, runs out of
+    time or has found ``max_files`` files.
+    """
+    paths = []
+    for root, dirs, files in as_filesystem(scan_path).walk():
+        if control is not None and (
+            control.should_stop() or control.over_file_budget(len(paths))
+        ):
+            break
+        dirs[:] = [d for d in dirs if d not in IGNORE_DIRS]
+        found = 0
+        for file in files:
+            if file in IGNORE_FILES:
+                continue
+            paths.append(os.path.join(root, file) if root else file)
+            found += 1
+        if reporter is not None and found:
+            reporter.discover(found)
+    if control is not None and control.over_file_budget(len(paths)):
+        del paths[control.max_files :]
+    return paths
+
+
+def analyze_file(
+    fs: FileSystem,
+    rel_path: str,
+    analyzers: Sequence[Analyzer] = DEFAULT_ANALYZERS,
+) -> FileResult | None:
+    """Stat and read a file once, then run every analyzer over the shared bytes.
+
+    Returns None if the file vanished mid-scan.
+    """
+    file_path = os.path.join(fs.root, rel_path)
+    try:
+        size = fs.size(rel_path)
+    except FileNotFoundError as e:
+        logging.exception(f"File not found during scan: {file_path} - {e}")
+        return None
+    _, ext = os.path.splitext(rel_path)
+    ext = ext if ext else "Other"
+    result = FileResult(
+        metrics=FileMetrics(path=rel_path, size=size, lines_of_code=0, extension=ext),
+        imports=[] if ext == ".py" or ext in JS_EXTENSIONS else None,
+        submodule_imports=[] if ext == ".py" else None,
+        js_config=None,
+    )
+    try:
+        data = fs.read(rel_path)
+    except Exception as e:
+        logging.exception(f"Could not read file {file_path}: {e}")
+        return result
+    ctx = FileContext(fs.root, rel_path, ext, data)
+    for analyzer in analyzers:
+        analyzer.analyze(ctx, result)
+    return result
+
+
+def analyze_batch(
+    fs: FileSystem,
+    rel_paths: list[str],
+    analyzers: Sequence[Analyzer] = DEFAULT_ANALYZERS,
+) -> list[FileResult]:
+    results = []
+    for rel_path in rel_paths:
+        result = analyze_file(fs, rel_path, analyzers)
+        if result is not None:
+            results.append(result)
+    PARSE_CACHE.flush()
+    return results
+
+
+def _init_worker(workers: int) -> None:
+    # Workers share parses through the parse store; their in-memory caches
+    # split one budget instead of each taking the whole of it.
+    PARSE_CACHE.max_bytes //= workers
+
+
+_executors: "dict[int, ProcessPoolExecutor]" = {}
+_executor_lock = threading.Lock()
+
+
+def _get_executor(workers: int) -> "ProcessPoolExecutor":
+    """Return the shared pool for this worker count, so parse caches survive scans.
+
+    Pools are kept per worker count rather than replaced: a scan asking for a
+    different count must not shut down a pool another scan is still using.
+
+    multiprocessing is imported here rather than at module load: it is the
+    largest part of the scanner's import time and serial scans never need it.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    with _executor_lock:
+        executor = _executors.get(workers)
+        if executor is None:
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(workers,),
+            )
+            _executors[workers] = executor
+        return executor
+
+
+def _discard_executor(executor: "ProcessPoolExecutor") -> None:
+    with _executor_lock:
+        for workers, shared in list(_executors.items()):
+            if shared is executor:
+                del _executors[workers]
+    executor.shutdown(wait=False)
+
+
+def shutdown_executors() -> None:
+    """Shut down every shared worker pool, waiting for running batches."""
+    with _executor_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown()
+
+
+def _batches(items: list[str], size: int) -> list[list[str]]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _iter_batch_results(
+    fs: FileSystem,
+    rel_paths: list[str],
+    workers: int | None,
+    batch_size: int,
+    analyzers: Sequence[Analyzer],
+) -> Iterator[list[FileResult]]:
+    if workers is None:
+        workers = os.cpu_count() or 1
+    batches = _batches(rel_paths, batch_size)
+    if workers <= 1 or len(batches) <= 1:
+        for batch in batches:
+            yield analyze_batch(fs, batch, analyzers)
+        return
+    from concurrent.futures.process import BrokenProcessPool
+
+    executor = _get_executor(workers)
+    remaining = iter(batches)
+    pending: "deque[Future]" = deque()
+    try:
+        for batch in itertools.islice(remaining, workers * 2):
+            pending.append(executor.submit(analyze_batch, fs, batch, analyzers))
+        while pending:
+            batch_results = pending.popleft().result()
+            batch = next(remaining, None)
+            if batch is not None:
+                pending.append(
+                    executor.submit(analyze_batch, fs, batch, analyzers)
+                )
+            yield batch_results
+    except BrokenProcessPool:
+        _discard_executor(executor)
+        raise
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def analyze_files(
+    base_path: str | FileSystem,
+    rel_paths: list[str],
+    workers: int | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    analyzers: Sequence[Analyzer] = DEFAULT_ANALYZERS,
+    reporter: ProgressReporter | None = None,
+    control: ScanControl | None = None,
+) -> list[FileResult]:
+    """Analyze files in walk order, fanning batches out to a process pool.
+
+    ``workers=None`` uses one process per CPU; ``workers <= 1`` (or a tree
+    small enough to fit in one batch) runs serially in the calling process.
+    Results are returned in the same order either way, and the reporter is
+    advanced after every batch. The control is checked between batches; at
+    most ``2 * workers`` batches are in flight, so a stop takes effect quickly.
+    """
+    results: list[FileResult] = []
+    bytes_read = 0
+    batch_iter = _iter_batch_results(
+        as_filesystem(base_path), rel_paths, workers, batch_size, analyzers
+    )
+    try:
+        for batch_results in batch_iter:
+            results.extend(batch_results)
+            batch_bytes = sum(r["metrics"]["size"] for r in batch_results)
+            bytes_read += batch_bytes
+            if reporter is not None:
+                reporter.advance(
+                    len(batch_results),
+                    bytes_read=batch_bytes,
+                    lines_of_code=sum(
+                        r["metrics"]["lines_of_code"] for r in batch_results
+                    ),
+                )
+            if control is not None and control.should_stop(bytes_read=bytes_read):
+                break
+    finally:
+        batch_iter.close()
+    return results
+
+
+def build_dependency_graph(results: list[FileResult]) -> dict[str, list[str]]:
+    graph = {}
+    for result in results:
+        if result["imports"] is not None:
+            graph[result["metrics"]["path"]] = result["imports"]
+    return graph
+
+
+def validate_architecture(graph: dict[str, list[str]]) -> list[str]:
+    violations = []
+    for file, deps in graph.items():
+        if "components" in file:
+            for dep in deps:
+                if "states" in dep:
+                    violations.append(
+                        f"Violation: Component '{file}' imports state '{dep}'"
+                    )
+    return violations
+
+
+def find_unused_components(resolved_graph: dict[str, list[str]]) -> list[str]:
+    """Python files (other than package ``__init__``s) that no scanned file imports."""
+    imported = {target for targets in resolved_graph.values() for target in targets}
+    return sorted(
+        path
+        for path in resolved_graph
+        if path not in imported and not path.endswith("__init__.py")
+    )
+
+
+def build_snapshot(
+    results: list[FileResult],
+    reporter: ProgressReporter | None = None,
+    source_roots: Sequence[str] = DEFAULT_SOURCE_ROOTS,
+    entry_points: Sequence[str] = DEFAULT_ENTRY_POINTS,
+) -> Snapshot:
+    files_data = FileTable(result["metrics"] for result in results)
+    folders_data: dict[str, FolderMetrics] = {}
+    if reporter is not None:
+        reporter.set_phase("graph")
+    dependency_graph = build_dependency_graph(results)
+    architecture_violations = validate_architecture(dependency_graph)
+    module_index = ModuleIndex(
+        files_data.paths_with_extension(".py"), source_roots=source_roots
+    )
+    js_resolver = JsResolver(
+        files_data.paths(),
+        {
+            result["metrics"]["path"]: result["js_config"]
+            for result in results
+            if result.get("js_config")
+        },
+    )
+    resolved_graph, external_imports, unresolved_imports, adjacency = (
+        resolve_import_graph(results, module_index, js_resolver)
+    )
+    if reporter is not None:
+        reporter.set_phase("unused")
+    unreachable, import_cycles = analyze_reachability(
+        resolved_graph, entry_points, adjacency
+    )
+    if unreachable is None:
+        unused_components = find_unused_components(resolved_graph)
+    else:
+        unused_components = unreachable
+    return Snapshot(
+        snapshot_id=uuid.uuid4().hex,
+        timestamp=time.time(),
+        total_files=len(files_data),
+        total_size=files_data.total_size(),
+        total_lines_of_code=files_data.total_lines_of_code(),
+        files=files_data,
+        folders=folders_data,
+        file_type_distribution=files_data.extension_counts(),
+        dependency_graph=dependency_graph,
+        resolved_graph=resolved_graph,
+        external_imports=external_imports,
+        unresolved_imports=unresolved_imports,
+        architecture_violations=architecture_violations,
+        unused_components=unused_components,
+        import_cycles=import_cycles,
+        partial=False,
+        stop_reason="",
+    )
+
+
+def analyze_files_incremental(
+    base_path: str | FileSystem,
+    rel_paths: list[str],
+    cache: ScanCache,
+    workers: int | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    analyzers: Sequence[Analyzer] = DEFAULT_ANALYZERS,
+    reporter: ProgressReporter | None = None,
+    control: ScanControl | None = None,
+) -> list[FileResult]:
+    """Like analyze_files, but only re-reads files whose stat signature changed."""
+    fs = as_filesystem(base_path)
+    root = fs.cache_root
+    signatures = {}
+    for rel_path in rel_paths:
+        signature = fs.signature(rel_path)
+        if signature is not None:
+            signatures[rel_path] = signature
+    cached = cache.get_many(root, signatures)
+    if reporter is not None and cached:
+        reporter.advance(
+            len(cached),
+            lines_of_code=sum(r["metrics"]["lines_of_code"] for r in cached.values()),
+        )
+    stale = [p for p in rel_paths if p in signatures and p not in cached]
+    fresh = analyze_files(
+        fs,
+        stale,
+        workers=workers,
+        batch_size=batch_size,
+        analyzers=analyzers,
+        reporter=reporter,
+        control=control,
+    )
+    cache.put_many(
+        root, [(r["metrics"]["path"], signatures[r["metrics"]["path"]], r) for r in fresh]
+    )
+    fresh_by_path = {r["metrics"]["path"]: r for r in fresh}
+    results = []
+    for rel_path in rel_paths:
+        result = cached.get(rel_path) or fresh_by_path.get(rel_path)
+        if result is not None:
+            results.append(result)
+    return results
+
+
+def scan_project(
+    scan_path: str | FileSystem,
+    workers: int | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    analyzers: Sequence[Analyzer] = DEFAULT_ANALYZERS,
+    cache: ScanCache | None = None,
+    progress: ProgressCallback | None = None,
+    control: ScanControl | None = None,
+    source_roots: Sequence[str] = DEFAULT_SOURCE_ROOTS,
+    entry_points: Sequence[str] = DEFAULT_ENTRY_POINTS,
+) -> Snapshot:
+    """Walk, analyze and summarize a project tree.
+
+    ``scan_path`` may be a directory, a zip archive (read in place) or any
+    FileSystem. If the control is cancelled or a budget trips, the returned
+    snapshot covers only the files processed so far and is marked ``partial``.
+    """
+    fs = as_filesystem(scan_path)
+    try:
+        reporter = ProgressReporter(progress)
+        reporter.set_phase("walk")
+        rel_paths = walk_project(fs, reporter, control)
+        reporter.set_phase("analyze", files_total=len(rel_paths))
+        if cache is not None:
+            results = analyze_files_incremental(
+                fs,
+                rel_paths,
+                cache,
+                workers=workers,
+                batch_size=batch_size,
+                analyzers=analyzers,
+                reporter=reporter,
+                control=control,
+            )
+        else:
+            results = analyze_files(
+                fs,
+                rel_paths,
+                workers=workers,
+                batch_size=batch_size,
+                analyzers=analyzers,
+                reporter=reporter,
+                control=control,
+            )
+    finally:
+        if fs is not scan_path:
+            fs.close()
+    snapshot = build_snapshot(results, reporter, source_roots, entry_points)
+    if control is not None and control.stop_reason:
+        snapshot["partial"] = True
+        snapshot["stop_reason"] = control.stop_reason
+    return snapshot
@@ -0,0 +1,183 @@
+import heapq
+import os
+from array import array
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from typing import Iterable, Iterator
+
+from app.scanner.models import FileMetrics
+
+FIELDS = ("path", "size", "lines_of_code", "extension")
+
+
+class FileRow(Mapping):
+    """Lazy, read-only FileMetrics view of one row of a FileTable."""
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "FileTable", index: int):
+        self._table = table
+        self._index = index
+
+    def __getitem__(self, key: str):
+        table = self._table
+        i = self._index
+        if key == "path":
+            return table.path(i)
+        if key == "size":
+            return table.sizes[i]
+        if key == "lines_of_code":
+            return table.lines_of_code[i]
+        if key == "extension":
+            return table.extensions[table.extension_ids[i]]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(FIELDS)
+
+    def __len__(self) -> int:
+        return len(FIELDS)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class FileTable(Sequence):
+    """Columnar, array-backed replacement for a list of FileMetrics dicts.
+
+    Directory and extension strings are interned into lookup tables; each row
+    costs one basename string plus a few machine integers. Indexing returns
+    a lazy FileRow, so code written against ``list[FileMetrics]`` keeps
+    working, while aggregates run over the raw columns.
+    """
+
+    def __init__(self, rows: Iterable[FileMetrics] = ()):
+        self.directories: list[str] = []
+        self._directory_ids: dict[str, int] = {}
+        self.extensions: list[str] = []
+        self._extension_ids: dict[str, int] = {}
+        self.directory_ids = array("I")
+        self.names: list[str] = []
+        self.extension_ids = array("I")
+        self.sizes = array("q")
+        self.lines_of_code = array("q")
+        for row in rows:
+            self.append(row["path"], row["size"], row["lines_of_code"], row["extension"])
+
+    def append(self, path: str, size: int, lines_of_code: int, extension: str) -> None:
+        directory, name = os.path.split(path)
+        directory_id = self._directory_ids.get(directory)
+        if directory_id is None:
+            directory_id = self._directory_ids[directory] = len(self.directories)
+            self.directories.append(directory)
+        extension_id = self._extension_ids.get(extension)
+        if extension_id is None:
+            extension_id = self._extension_ids[extension] = len(self.extensions)
+            self.extensions.append(extension)
+        self.directory_ids.append(directory_id)
+        self.names.append(name)
+        self.extension_ids.append(extension_id)
+        self.sizes.append(size)
+        self.lines_of_code.append(lines_of_code)
+
+    def copy(self) -> "FileTable":
+        """An independent copy; the columns are copied wholesale, not row by row."""
+        table = FileTable()
+        table.directories = list(self.directories)
+        table._directory_ids = dict(self._directory_ids)
+        table.extensions = list(self.extensions)
+        table._extension_ids = dict(self._extension_ids)
+        table.directory_ids = array("I", self.directory_ids)
+        table.names = list(self.names)
+        table.extension_ids = array("I", self.extension_ids)
+        table.sizes = array("q", self.sizes)
+        table.lines_of_code = array("q", self.lines_of_code)
+        return table
+
+    def update(self, index: int, size: int, lines_of_code: int) -> None:
+        self.sizes[index] = size
+        self.lines_of_code[index] = lines_of_code
+
+    def delete(self, indices: set[int]) -> None:
+        """Drop rows in place; later rows move up to close the gaps."""
+        keep = [i for i in range(len(self.names)) if i not in indices]
+        self.directory_ids = array("I", (self.directory_ids[i] for i in keep))
+        self.names = [self.names[i] for i in keep]
+        self.extension_ids = array("I", (self.extension_ids[i] for i in keep))
+        self.sizes = array("q", (self.sizes[i] for i in keep))
+        self.lines_of_code = array("q", (self.lines_of_code[i] for i in keep))
+
+    def path(self, index: int) -> str:
+        directory = self.directories[self.directory_ids[index]]
+        name = self.names[index]
+        return os.path.join(directory, name) if directory else name
+
+    def paths(self) -> Iterator[str]:
+        for i in range(len(self.names)):
+            yield self.path(i)
+
+    def paths_with_extension(self, extension: str) -> Iterator[str]:
+        extension_id = self._extension_ids.get(extension)
+        if extension_id is None:
+            return
+        for i, row_extension in enumerate(self.extension_ids):
+            if row_extension == extension_id:
+                yield self.path(i)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [FileRow(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("FileTable index out of range")
+        return FileRow(self, index)
+
+    def __iter__(self) -> Iterator[FileRow]:
+        for i in range(len(self.names)):
+            yield FileRow(self, i)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, FileTable):
+            return (
+                list(self.paths()) == list(other.paths())
+                and self.sizes == other.sizes
+                and self.lines_of_code == other.lines_of_code
+                and [self.extensions[i] for i in self.extension_ids]
+                == [other.extensions[i] for i in other.extension_ids]
+            )
+        if isinstance(other, list):
+            return len(self) == len(other) and all(
+                row == other_row for row, other_row in zip(self, other)
+            )
+        return NotImplemented
+
+    def total_size(self) -> int:
+        return sum(self.sizes)
+
+    def total_lines_of_code(self) -> int:
+        return sum(self.lines_of_code)
+
+    def extension_counts(self) -> dict[str, int]:
+        """Files per extension, in order of each extension's first appearance."""
+        counts = Counter(self.extension_ids)
+        return {self.extensions[i]: counts[i] for i in range(len(self.extensions))}
+
+    def top_n(self, n: int, by: str = "size") -> list[FileRow]:
+        column = self.sizes if by == "size" else self.lines_of_code
+        indices = heapq.nlargest(n, range(len(column)), key=column.__getitem__)
+        return [FileRow(self, i) for i in indices]
+
+    def record(self, index: int) -> FileMetrics:
+        return FileMetrics(
+            path=self.path(index),
+            size=self.sizes[index],
+            lines_of_code=self.lines_of_code[index],
+            extension=self.extensions[self.extension_ids[index]],
+        )
+
+    def to_records(self) -> list[FileMetrics]:
+        return [self.record(i) for i in range(len(self))]
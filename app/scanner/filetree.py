@@ -0,0 +1,155 @@
+import os
+import threading
+from collections import OrderedDict
+
+from app.scanner.filetable import FileTable
+from app.scanner.models import FileNode, FolderNode, Snapshot
+
+MAX_CACHED_TREES = 16
+
+
+class TreeNode:
+    """A folder in the path trie; child folders are indexed by name."""
+
+    __slots__ = ("name", "folders", "files", "file_count")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.folders: dict[str, TreeNode] = {}
+        self.files: list[tuple[str, int]] = []
+        self.file_count = 0
+
+
+def build_file_tree(files_data: FileTable) -> TreeNode:
+    """Build the trie in one pass over the table, then roll up subtree counts.
+
+    Files sharing a directory share one walk down the trie, so the cost is
+    one dict lookup per path segment per distinct directory.
+    """
+    root = TreeNode("root")
+    directory_nodes: dict[int, list[TreeNode]] = {}
+    for name, directory_id, lines_of_code in zip(
+        files_data.names, files_data.directory_ids, files_data.lines_of_code
+    ):
+        nodes = directory_nodes.get(directory_id)
+        if nodes is None:
+            nodes = [root]
+            directory = files_data.directories[directory_id]
+            if directory:
+                current = root
+                for part in directory.split(os.sep):
+                    child = current.folders.get(part)
+                    if child is None:
+                        child = current.folders[part] = TreeNode(part)
+                    current = child
+                    nodes.append(current)
+            directory_nodes[directory_id] = nodes
+        nodes[-1].files.append((name, lines_of_code))
+    for nodes in directory_nodes.values():
+        count = len(nodes[-1].files)
+        for node in nodes:
+            node.file_count += count
+    return root
+
+
+def _clone(node: TreeNode) -> TreeNode:
+    clone = TreeNode(node.name)
+    clone.folders = dict(node.folders)
+    clone.files = list(node.files)
+    clone.file_count = node.file_count
+    return clone
+
+
+def patch_tree(root: TreeNode, changes: dict[str, int | None]) -> TreeNode:
+    """A new trie with ``changes`` (path -> lines of code, None if deleted) applied.
+
+    Copy-on-write: only the folders on a changed path are copied; every
+    other subtree is shared with ``root``, which is left untouched.
+    Folders left empty by deletions are removed.
+    """
+    root = _clone(root)
+    copied = {id(root)}
+    for path, lines_of_code in changes.items():
+        directory, name = os.path.split(path)
+        nodes = [root]
+        for part in directory.split(os.sep) if directory else ():
+            parent = nodes[-1]
+            child = parent.folders.get(part)
+            if child is None:
+                if lines_of_code is None:
+                    break
+                child = TreeNode(part)
+            elif id(child) not in copied:
+                child = _clone(child)
+            copied.add(id(child))
+            parent.folders[part] = child
+            nodes.append(child)
+        else:
+            files = nodes[-1].files
+            position = next((i for i, (n, _) in enumerate(files) if n == name), None)
+            delta = 0
+            if lines_of_code is None:
+                if position is not None:
+                    del files[position]
+                    delta = -1
+            elif position is None:
+                files.append((name, lines_of_code))
+                delta = 1
+            else:
+                files[position] = (name, lines_of_code)
+            for node in nodes:
+                node.file_count += delta
+            for parent, child in zip(reversed(nodes[:-1]), reversed(nodes[1:])):
+                if child.file_count == 0:
+                    del parent.folders[child.name]
+    return root
+
+
+def find_folder(root: TreeNode, path: list[str]) -> TreeNode | None:
+    node = root
+    for part in path:
+        node = node.folders.get(part)
+        if node is None:
+            return None
+    return node
+
+
+def folder_view(node: TreeNode | None) -> FolderNode:
+    """Materialize one level of the trie in the shape the file browser renders."""
+    if node is None:
+        return FolderNode(name="root", folders=[], files=[], file_count=0)
+    return FolderNode(
+        name=node.name,
+        folders=[
+            FolderNode(name=child.name, folders=[], files=[], file_count=child.file_count)
+            for child in node.folders.values()
+        ],
+        files=[FileNode(name=name, lines_of_code=loc) for name, loc in node.files],
+        file_count=node.file_count,
+    )
+
+
+_trees: OrderedDict[str, TreeNode] = OrderedDict()
+_trees_lock = threading.Lock()
+
+
+def tree_for(snapshot: Snapshot) -> TreeNode:
+    """Return the snapshot's trie, building and caching it on first use."""
+    snapshot_id = snapshot["snapshot_id"]
+    with _trees_lock:
+        tree = _trees.get(snapshot_id)
+        if tree is not None:
+            _trees.move_to_end(snapshot_id)
+            return tree
+    tree = build_file_tree(snapshot["files"])
+    remember_tree(snapshot_id, tree)
+    return tree
+
+
+def remember_tree(snapshot_id: str, tree: TreeNode) -> None:
+    """Cache a trie built some other way (e.g. patched) for ``tree_for``."""
+    with _trees_lock:
+        _trees[snapshot_id] = tree
+        _trees.move_to_end(snapshot_id)
+        while len(_trees) > MAX_CACHED_TREES:
+            _trees.popitem(last=False)
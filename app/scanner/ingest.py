@@ -0,0 +1,215 @@
+import asyncio
+import hashlib
+import os
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from typing import Any, TypedDict
+
+from app.scanner.progress import ProgressCallback, ProgressReporter
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+DEFAULT_MAX_UPLOAD_BYTES = int(os.environ.get("INDU_MAX_UPLOAD_BYTES", str(100_000_000)))
+
+
+class UploadLimitExceeded(ValueError):
+    pass
+
+
+class StoredUpload(TypedDict):
+    name: str
+    path: str
+    size: int
+    digest: str
+
+
+def safe_join(root: str, name: str) -> str:
+    """Join an untrusted relative name onto ``root``, refusing to escape it."""
+    parts = [p for p in name.replace("\\", "/").split("/") if p not in ("", ".")]
+    if not parts or ".." in parts:
+        raise ValueError(f"Unsafe path: {name!r}")
+    return os.path.join(root, *parts)
+
+
+async def stream_upload(
+    upload: Any,
+    dest_dir: str,
+    max_bytes: int = DEFAULT_MAX_UPLOAD_BYTES,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> StoredUpload:
+    """Copy an upload to ``dest_dir`` chunk by chunk, hashing as it goes.
+
+    ``upload`` is anything with an async ``read(size)`` (Reflex/Starlette
+    upload files). At most one chunk is held in memory, and writes run in a
+    worker thread. Raises UploadLimitExceeded, after deleting the partial
+    file, as soon as more than ``max_bytes`` have arrived.
+    """
+    name = upload.name
+    path = safe_join(dest_dir, name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    digest = hashlib.blake2b(digest_size=16)
+    size = 0
+    try:
+        with open(path, "wb") as f:
+            while True:
+                chunk = await upload.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadLimitExceeded(
+                        f"{name} is larger than the {max_bytes:,} byte upload limit"
+                    )
+                digest.update(chunk)
+                await asyncio.to_thread(f.write, chunk)
+    except BaseException:
+        if os.path.exists(path):
+            os.remove(path)
+        raise
+    return StoredUpload(name=name, path=path, size=size, digest=digest.hexdigest())
+
+
+DEFAULT_MAX_UNCOMPRESSED_BYTES = int(
+    os.environ.get("INDU_MAX_UNCOMPRESSED_BYTES", str(1_000_000_000))
+)
+DEFAULT_MAX_COMPRESSION_RATIO = float(os.environ.get("INDU_MAX_COMPRESSION_RATIO", "200"))
+DEFAULT_MAX_NESTING = 3
+# Small members compress absurdly well (runs of zeros, empty files) without
+# being a threat, so the ratio limit only applies above this size.
+RATIO_CHECK_MIN_BYTES = 1024 * 1024
+
+
+class ArchiveLimitExceeded(ValueError):
+    pass
+
+
+class _ByteBudget:
+    """Running total of bytes written, shared by every extraction thread."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def charge(self, amount: int) -> None:
+        with self._lock:
+            self.used += amount
+            if self.used > self.limit:
+                raise ArchiveLimitExceeded(
+                    f"Archives expand past the {self.limit:,} byte uncompressed limit"
+                )
+
+
+def check_archive(
+    archive: zipfile.ZipFile,
+    name: str,
+    max_bytes: int = DEFAULT_MAX_UNCOMPRESSED_BYTES,
+    max_ratio: float = DEFAULT_MAX_COMPRESSION_RATIO,
+) -> list[zipfile.ZipInfo]:
+    """Validate an archive from its central directory alone; return its files.
+
+    Rejects unsafe member names, declared totals over ``max_bytes`` and
+    members (above 1 MiB) that claim to expand more than ``max_ratio`` times.
+    Declared sizes are binding: zipfile stops reading a member at its
+    declared size, and the streaming byte budget catches the rest.
+    """
+    members = [info for info in archive.infolist() if not info.is_dir()]
+    total = 0
+    for info in members:
+        parts = info.filename.replace("\\", "/").split("/")
+        if info.filename.startswith("/") or ".." in parts:
+            raise ArchiveLimitExceeded(f"{name} contains an unsafe path: {info.filename}")
+        total += info.file_size
+        if (
+            info.file_size > RATIO_CHECK_MIN_BYTES
+            and info.file_size > max_ratio * max(info.compress_size, 1)
+        ):
+            raise ArchiveLimitExceeded(
+                f"{name}: {info.filename} exceeds the {max_ratio:g}x compression ratio limit"
+            )
+    if total > max_bytes:
+        raise ArchiveLimitExceeded(
+            f"{name} expands to {total:,} bytes, over the {max_bytes:,} byte limit"
+        )
+    return members
+
+
+def _extract_member(
+    archive: zipfile.ZipFile,
+    info: zipfile.ZipInfo,
+    dest_dir: str,
+    budget: _ByteBudget,
+    chunk_size: int,
+) -> tuple[str, int]:
+    path = safe_join(dest_dir, info.filename)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    written = 0
+    with archive.open(info) as source, open(path, "wb") as target:
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            budget.charge(len(chunk))
+            target.write(chunk)
+            written += len(chunk)
+    return path, written
+
+
+def ingest_archives(
+    archive_paths: list[str],
+    dest_dir: str,
+    workers: int | None = None,
+    max_bytes: int = DEFAULT_MAX_UNCOMPRESSED_BYTES,
+    max_ratio: float = DEFAULT_MAX_COMPRESSION_RATIO,
+    max_nesting: int = DEFAULT_MAX_NESTING,
+    progress: ProgressCallback | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> list[str]:
+    """Extract archives, and zips nested inside them, into ``dest_dir``.
+
+    Each archive lands in a folder named after it; a nested ``x.zip``
+    is replaced by an ``x`` folder, up to ``max_nesting`` levels deep.
+    Members decompress in parallel on a thread pool (zlib releases the
+    GIL). Every archive is checked against the limits up front, and all
+    writes draw on one shared byte budget, so a zip bomb fails on the
+    first chunk past the limit rather than after filling the disk.
+    Returns the folders the top-level archives were extracted to.
+    """
+    budget = _ByteBudget(max_bytes)
+    reporter = ProgressReporter(progress)
+    reporter.set_phase("extract")
+    roots = []
+    pending = []
+    for archive_path in archive_paths:
+        stem = os.path.splitext(os.path.basename(archive_path))[0]
+        root = safe_join(dest_dir, stem)
+        roots.append(root)
+        pending.append((archive_path, root, 0))
+    with ThreadPoolExecutor(max_workers=workers or min(8, os.cpu_count() or 1)) as pool:
+        while pending:
+            archive_path, root, depth = pending.pop()
+            name = os.path.basename(archive_path)
+            with zipfile.ZipFile(archive_path) as archive:
+                members = check_archive(archive, name, max_bytes - budget.used, max_ratio)
+                reporter.discover(len(members))
+                futures = [
+                    pool.submit(
+                        _extract_member, archive, info, root, budget, chunk_size
+                    )
+                    for info in members
+                ]
+                try:
+                    for future in as_completed(futures):
+                        path, written = future.result()
+                        reporter.advance(1, bytes_read=written)
+                        if path.endswith(".zip") and depth < max_nesting:
+                            if zipfile.is_zipfile(path):
+                                pending.append((path, path[: -len(".zip")], depth + 1))
+                finally:
+                    for future in futures:
+                        future.cancel()
+                    wait(futures)
+            if depth > 0:
+                os.remove(archive_path)
+    reporter.set_phase("extracted")
+    return roots
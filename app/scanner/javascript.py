@@ -0,0 +1,289 @@
+import json
+import logging
+import os
+import re
+from typing import Iterable
+
+JS_EXTENSIONS = frozenset({".js", ".jsx", ".mjs", ".cjs", ".ts", ".tsx", ".mts", ".cts"})
+TSCONFIG_NAMES = frozenset({"tsconfig.json", "jsconfig.json"})
+PROBE_EXTENSIONS = (".ts", ".tsx", ".d.ts", ".js", ".jsx", ".mjs", ".cjs", ".mts", ".cts")
+# TypeScript ESM code imports "./x.js" to mean "./x.ts".
+SOURCE_FOR_EMITTED = {
+    ".js": (".ts", ".tsx"),
+    ".jsx": (".tsx",),
+    ".mjs": (".mts",),
+    ".cjs": (".cts",),
+}
+
+_TOKEN = re.compile(
+    r"""
+    \s*(?:
+    (?P<comment>//[^\n]*|/\*.*?(?:\*/|\Z))
+    |(?P<string>'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*")
+    |(?P<template>`(?:[^`\\]|\\.)*`)
+    |(?P<name>[A-Za-z_$][\w$]*)
+    |(?P<number>\d[\w.]*)
+    |(?P<punct>.)
+    |(?P<end>\Z)
+    )""",
+    re.S | re.X,
+)
+_REGEX_LITERAL = re.compile(r"/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[A-Za-z]*")
+# After these, a "/" starts a regex literal rather than a division.
+_REGEX_AFTER_NAMES = frozenset(
+    {
+        "return", "typeof", "instanceof", "in", "of", "new", "delete", "void",
+        "throw", "case", "do", "else", "yield", "await",
+    }
+)
+_DIVISION_AFTER_PUNCT = frozenset(")]}")
+_EXPORT_CLAUSE = frozenset({"*", "{", "}", ","})
+
+
+def tokenize(text: str) -> list[tuple[str, str]]:
+    """Significant tokens as (kind, value); comments and whitespace are dropped.
+
+    Strings keep their quotes. Template literals and regex literals are
+    single opaque tokens, so import-like text inside them is never seen.
+    """
+    tokens: list[tuple[str, str]] = []
+    append = tokens.append
+    match = _TOKEN.match
+    pos = 0
+    end = len(text)
+    while pos < end:
+        m = match(text, pos)
+        kind = m.lastgroup
+        value = m.group(kind)
+        pos = m.end()
+        if kind == "comment" or kind == "end":
+            continue
+        if value == "/":
+            previous = tokens[-1] if tokens else None
+            if (
+                previous is None
+                or (previous[0] == "punct" and previous[1] not in _DIVISION_AFTER_PUNCT)
+                or (previous[0] == "name" and previous[1] in _REGEX_AFTER_NAMES)
+            ):
+                regex = _REGEX_LITERAL.match(text, m.start(kind))
+                if regex is not None:
+                    pos = regex.end()
+                    append(("regex", regex.group()))
+                    continue
+        append((kind, value))
+    return tokens
+
+
+def _string_at(tokens: list[tuple[str, str]], i: int) -> str | None:
+    """The literal's contents, if token ``i`` is a string or a plain template."""
+    if i < len(tokens):
+        kind, value = tokens[i]
+        if kind == "string" or (kind == "template" and "${" not in value):
+            return value[1:-1]
+    return None
+
+
+def scan_js_imports(text: str) -> list[str]:
+    """Module specifiers from ``import``, ``export ... from``, ``require()``
+    and ``import()`` with a string literal argument, in source order."""
+    if "import" not in text and "require" not in text and "export" not in text:
+        return []
+    tokens = tokenize(text)
+    specifiers = []
+    count = len(tokens)
+    for i, (kind, value) in enumerate(tokens):
+        if kind != "name" or value not in ("import", "export", "require"):
+            continue
+        if i and tokens[i - 1] == ("punct", "."):
+            continue
+        following = tokens[i + 1] if i + 1 < count else ("", "")
+        if value == "require" or (value == "import" and following == ("punct", "(")):
+            if following == ("punct", "(") and tokens[i + 3 : i + 4] == [("punct", ")")]:
+                specifier = _string_at(tokens, i + 2)
+                if specifier is not None:
+                    specifiers.append(specifier)
+            continue
+        if value == "import" and following[0] == "string":
+            specifiers.append(following[1][1:-1])
+            continue
+        # Walk the import/export clause up to its "from" string.
+        for j in range(i + 1, count):
+            token_kind, token_value = tokens[j]
+            if token_kind == "name":
+                if token_value == "from":
+                    specifier = _string_at(tokens, j + 1)
+                    if specifier is not None:
+                        specifiers.append(specifier)
+                        break
+                    continue
+                if token_value in ("import", "export", "require"):
+                    break
+                if value == "export" and j == i + 1 and token_value != "type":
+                    break
+            elif token_kind != "punct" or token_value not in _EXPORT_CLAUSE:
+                break
+    return specifiers
+
+
+def parse_jsonc(text: str) -> dict:
+    """Parse tsconfig-style JSON, which allows comments and trailing commas."""
+    parts = []
+    for kind, value in tokenize(text):
+        if kind == "punct" and value in "}]" and parts and parts[-1] == ",":
+            parts.pop()
+        parts.append(value)
+    return json.loads("".join(parts))
+
+
+def tsconfig_options(path: str, text: str) -> dict | None:
+    """The resolution-relevant subset of a tsconfig/jsconfig file.
+
+    ``baseUrl`` is made relative to the scan root, and ``paths`` keeps its
+    patterns with targets relative to the directory they resolve against.
+    A relative ``extends`` is recorded so the resolver can merge it.
+    """
+    try:
+        config = parse_jsonc(text)
+    except ValueError as e:
+        logging.exception(f"Could not parse {path}: {e}")
+        return None
+    if not isinstance(config, dict):
+        return None
+    directory = os.path.dirname(path)
+    options = config.get("compilerOptions") or {}
+    result: dict = {}
+    base_url = options.get("baseUrl")
+    if isinstance(base_url, str):
+        result["baseUrl"] = os.path.normpath(os.path.join(directory, base_url))
+    paths = options.get("paths")
+    if isinstance(paths, dict):
+        result["paths"] = {
+            pattern: [t for t in targets if isinstance(t, str)]
+            for pattern, targets in paths.items()
+            if isinstance(targets, list)
+        }
+        result["pathsBase"] = result.get("baseUrl", os.path.normpath(directory))
+    extends = config.get("extends")
+    if isinstance(extends, str) and extends.startswith("."):
+        target = os.path.normpath(os.path.join(directory, extends))
+        if not target.endswith(".json"):
+            target += ".json"
+        result["extends"] = target
+    return result
+
+
+def package_name(specifier: str) -> str:
+    parts = specifier.split("/")
+    if specifier.startswith("@") and len(parts) > 1:
+        return "/".join(parts[:2])
+    return parts[0]
+
+
+class JsResolver:
+    """Resolves JS/TS module specifiers to scanned files.
+
+    Relative specifiers are probed for the exact file, added extensions
+    and ``index`` files. Bare specifiers go through the nearest tsconfig's
+    ``paths`` and ``baseUrl`` before being treated as packages. Results are
+    cached per importing directory, since every file in a directory resolves
+    a given specifier the same way.
+    """
+
+    def __init__(self, paths: Iterable[str], configs: dict[str, dict]):
+        self.files = set(paths)
+        self.configs = configs
+        self._directory_configs: dict[str, dict | None] = {}
+        self._cache: dict[str, dict[str, str | None]] = {}
+
+    def _config_for(self, directory: str) -> dict | None:
+        if directory in self._directory_configs:
+            return self._directory_configs[directory]
+        config = None
+        for name in sorted(TSCONFIG_NAMES, reverse=True):
+            candidate = os.path.join(directory, name) if directory else name
+            if candidate in self.configs:
+                config = self._merged(candidate, set())
+                break
+        else:
+            if directory:
+                config = self._config_for(os.path.dirname(directory))
+        self._directory_configs[directory] = config
+        return config
+
+    def _merged(self, path: str, seen: set[str]) -> dict:
+        config = self.configs[path]
+        parent_path = config.get("extends")
+        if parent_path in self.configs and parent_path not in seen:
+            seen.add(path)
+            return {**self._merged(parent_path, seen), **config}
+        return config
+
+    def _probe(self, base: str) -> str | None:
+        files = self.files
+        if base in files:
+            return base
+        stem, ext = os.path.splitext(base)
+        for source_ext in SOURCE_FOR_EMITTED.get(ext, ()):
+            if stem + source_ext in files:
+                return stem + source_ext
+        for ext in PROBE_EXTENSIONS:
+            if base + ext in files:
+                return base + ext
+        index = os.path.join(base, "index") if base else "index"
+        for ext in PROBE_EXTENSIONS:
+            if index + ext in files:
+                return index + ext
+        return None
+
+    def _resolve_bare(self, specifier: str, config: dict) -> str | None:
+        for pattern, targets in config.get("paths", {}).items():
+            prefix, star, suffix = pattern.partition("*")
+            if star:
+                if not (
+                    specifier.startswith(prefix)
+                    and specifier.endswith(suffix)
+                    and len(specifier) >= len(prefix) + len(suffix)
+                ):
+                    continue
+                captured = specifier[len(prefix) : len(specifier) - len(suffix)]
+            elif specifier != pattern:
+                continue
+            else:
+                captured = ""
+            for target in targets:
+                candidate = os.path.normpath(
+                    os.path.join(config["pathsBase"], target.replace("*", captured))
+                )
+                found = self._probe("" if candidate == "." else candidate)
+                if found is not None:
+                    return found
+        base_url = config.get("baseUrl")
+        if base_url is not None:
+            candidate = os.path.normpath(os.path.join(base_url, specifier))
+            return self._probe(candidate)
+        return None
+
+    def resolve(self, source: str, specifier: str) -> str | None:
+        directory = os.path.dirname(source)
+        cache = self._cache.get(directory)
+        if cache is None:
+            cache = self._cache[directory] = {}
+        if specifier in cache:
+            return cache[specifier]
+        if specifier.startswith((".", "/")):
+            if specifier.startswith("/"):
+                candidate = os.path.normpath(specifier.lstrip("/"))
+            else:
+                candidate = os.path.normpath(os.path.join(directory, specifier))
+            target = None
+            if not candidate.startswith(".."):
+                target = self._probe("" if candidate == "." else candidate)
+        else:
+            config = self._config_for(directory)
+            target = self._resolve_bare(specifier, config) if config else None
+        cache[specifier] = target
+        return target
+
+    @staticmethod
+    def is_relative(specifier: str) -> bool:
+        return specifier.startswith((".", "/"))
@@ -0,0 +1,163 @@
+import hashlib
+import math
+import threading
+from array import array
+from collections import OrderedDict
+
+from app.scanner.models import Snapshot
+from app.scanner.reachability import strongly_connected_components
+
+MAX_CACHED_LAYOUTS = 16
+BARYCENTER_SWEEPS = 2
+
+
+class GraphLayout:
+    """Node positions for one graph, plus its edges packed for plotting.
+
+    ``edge_x``/``edge_y`` hold every edge as ``x0, x1, None`` so a single
+    line trace draws them all.
+    """
+
+    __slots__ = ("nodes", "x", "y", "layers", "edge_x", "edge_y")
+
+    def __init__(self, nodes: list[str], x: array, y: array, layers: array):
+        self.nodes = nodes
+        self.x = x
+        self.y = y
+        self.layers = layers
+        self.edge_x: list[float | None] = []
+        self.edge_y: list[float | None] = []
+
+
+def graph_fingerprint(graph: dict[str, list[str]]) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for source in sorted(graph):
+        digest.update(source.encode())
+        digest.update(b"\0")
+        digest.update("\0".join(graph[source]).encode())
+        digest.update(b"\1")
+    return digest.hexdigest()
+
+
+def _order_layer(layer: list[int], position: list[float], neighbors: list[list[int]]) -> None:
+    """Barycenter step: sort one layer by the mean position of its neighbors."""
+    keys = {}
+    for node in layer:
+        around = neighbors[node]
+        if around:
+            keys[node] = sum(position[n] for n in around) / len(around)
+        else:
+            keys[node] = position[node]
+    layer.sort(key=keys.__getitem__)
+    width = len(layer)
+    for rank, node in enumerate(layer):
+        position[node] = (rank + 0.5) / width
+
+
+def layered_layout(graph: dict[str, list[str]]) -> GraphLayout:
+    """Layered (Sugiyama-style) layout in O(V log V + E).
+
+    Import cycles are collapsed with Tarjan's algorithm, and each node's
+    layer is the longest import path below it, so leaf modules sit at the
+    bottom and entry points at the top. A couple of barycenter sweeps
+    reduce crossings. Layers wider than about twice the square root of the
+    node count wrap onto extra rows to keep the figure roughly square.
+    """
+    nodes = sorted(set(graph).union(*graph.values()))
+    ids = {node: i for i, node in enumerate(nodes)}
+    count = len(nodes)
+    successors: list[list[int]] = [[] for _ in range(count)]
+    predecessors: list[list[int]] = [[] for _ in range(count)]
+    for source, targets in graph.items():
+        s = ids[source]
+        for target in set(targets):
+            t = ids[target]
+            if t != s:
+                successors[s].append(t)
+                predecessors[t].append(s)
+
+    layer_of = array("l", [0] * count)
+    component_of = [0] * count
+    components = strongly_connected_components(successors)
+    for c, component in enumerate(components):
+        for node in component:
+            component_of[node] = c
+    for c, component in enumerate(components):
+        depth = 0
+        for node in component:
+            for successor in successors[node]:
+                if component_of[successor] != c:
+                    depth = max(depth, layer_of[successor] + 1)
+        for node in component:
+            layer_of[node] = depth
+
+    layers: list[list[int]] = [[] for _ in range(max(layer_of, default=-1) + 1)]
+    for node in range(count):
+        layers[layer_of[node]].append(node)
+    position = [0.0] * count
+    for layer in layers:
+        width = len(layer)
+        for rank, node in enumerate(layer):
+            position[node] = (rank + 0.5) / width
+    for _ in range(BARYCENTER_SWEEPS):
+        for layer in reversed(layers[:-1]):
+            _order_layer(layer, position, predecessors)
+        for layer in layers[1:]:
+            _order_layer(layer, position, successors)
+
+    row_width = max(10, int(2 * math.sqrt(count)))
+    x = array("d", [0.0] * count)
+    y = array("d", [0.0] * count)
+    row = 0
+    for layer in layers:
+        for start in range(0, len(layer), row_width):
+            chunk = layer[start : start + row_width]
+            offset = (len(chunk) - 1) / 2
+            for rank, node in enumerate(chunk):
+                x[node] = rank - offset
+                y[node] = row
+            row += 1
+
+    layout = GraphLayout(nodes, x, y, layer_of)
+    edge_x = layout.edge_x
+    edge_y = layout.edge_y
+    for s, targets in enumerate(successors):
+        x0 = x[s]
+        y0 = y[s]
+        for t in targets:
+            edge_x += (x0, x[t], None)
+            edge_y += (y0, y[t], None)
+    return layout
+
+
+_layouts: OrderedDict[str, GraphLayout] = OrderedDict()
+_fingerprints: OrderedDict[str, str] = OrderedDict()
+_layouts_lock = threading.Lock()
+
+
+def layout_for(snapshot: Snapshot) -> GraphLayout:
+    """Return the layout of the snapshot's resolved graph, cached by fingerprint.
+
+    Rescans that produce an identical graph reuse the previous layout.
+    """
+    snapshot_id = snapshot["snapshot_id"]
+    graph = snapshot.get("resolved_graph", {})
+    with _layouts_lock:
+        fingerprint = _fingerprints.get(snapshot_id)
+    if fingerprint is None:
+        fingerprint = graph_fingerprint(graph)
+    with _layouts_lock:
+        _fingerprints[snapshot_id] = fingerprint
+        _fingerprints.move_to_end(snapshot_id)
+        while len(_fingerprints) > MAX_CACHED_LAYOUTS * 4:
+            _fingerprints.popitem(last=False)
+        layout = _layouts.get(fingerprint)
+        if layout is not None:
+            _layouts.move_to_end(fingerprint)
+            return layout
+    layout = layered_layout(graph)
+    with _layouts_lock:
+        _layouts[fingerprint] = layout
+        while len(_layouts) > MAX_CACHED_LAYOUTS:
+            _layouts.popitem(last=False)
+    return layout
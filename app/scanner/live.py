@@ -0,0 +1,520 @@
+import bisect
+import os
+import time
+import uuid
+from typing import Iterable, Sequence
+
+from app.scanner.analyzers import DEFAULT_ANALYZERS, Analyzer
+from app.scanner.cache import ScanCache
+from app.scanner.engine import (
+    analyze_file,
+    analyze_files,
+    analyze_files_incremental,
+    build_snapshot,
+    validate_architecture,
+    walk_project,
+)
+from app.scanner.filetree import patch_tree, remember_tree, tree_for
+from app.scanner.javascript import JS_EXTENSIONS, TSCONFIG_NAMES, JsResolver
+from app.scanner.models import FileResult, Snapshot
+from app.scanner.modules import DEFAULT_SOURCE_ROOTS, ModuleIndex, resolve_file
+from app.scanner.reachability import (
+    DEFAULT_ENTRY_POINTS,
+    EntryPoints,
+    strongly_connected_components,
+)
+from app.scanner.vfs import LocalFileSystem
+from app.scanner.watch import is_ignored
+
+INIT = "__init__.py"
+
+
+def _package_parent(path: str) -> str:
+    directory = os.path.dirname(path)
+    if os.path.basename(path) == INIT:
+        directory = os.path.dirname(directory)
+    return os.path.join(directory, INIT) if directory else ""
+
+
+def _components(graph: dict[str, list[str]], nodes: set[str]) -> list[list[str]]:
+    """Cycles (SCCs of more than one file) of the subgraph induced by ``nodes``."""
+    order = sorted(nodes)
+    ids = {node: i for i, node in enumerate(order)}
+    adjacency = [
+        [ids[t] for t in graph.get(node, ()) if t in ids] for node in order
+    ]
+    return [
+        sorted(order[i] for i in component)
+        for component in strongly_connected_components(adjacency)
+        if len(component) > 1
+    ]
+
+
+class LiveProject:
+    """A local project kept current by patching file changes into its snapshot.
+
+    ``start`` runs one full scan and keeps the per-file results. ``apply``
+    then re-analyzes only the given paths and derives a new snapshot from
+    the previous one. Totals, the file table, the import graph, external
+    and unresolved imports, architecture violations, the unused list,
+    cycles and the folder trie are all patched rather than recomputed.
+    Snapshots stay immutable: every patch yields a new snapshot ID and
+    shares unchanged data with the last one.
+
+    Edits that keep the set of files (the usual save) only re-resolve the
+    edited files. Adding or removing files also re-resolves the files whose
+    imports could now point elsewhere (see ``_rebuild_resolvers``), from
+    the kept results without re-reading them. Reachability and cycles are
+    updated from the changed edges: new edges extend the reachable set and
+    merge cycles locally, removed edges re-split the cycle they were in,
+    and only a removed edge into a reachable file (or a removed entry
+    point) repeats the reachability walk.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        source_roots: Sequence[str] = DEFAULT_SOURCE_ROOTS,
+        entry_points: Sequence[str] = DEFAULT_ENTRY_POINTS,
+        analyzers: Sequence[Analyzer] = DEFAULT_ANALYZERS,
+    ):
+        self.fs = LocalFileSystem(root)
+        self.source_roots = source_roots
+        self.entry_points = EntryPoints(entry_points)
+        self._entry_point_list = entry_points
+        self.analyzers = analyzers
+        self.snapshot: Snapshot | None = None
+
+    def start(self, workers: int | None = None, cache: ScanCache | None = None) -> Snapshot:
+        """Full scan; also what ``apply`` falls back to after lost events."""
+        rel_paths = walk_project(self.fs)
+        if cache is not None:
+            results = analyze_files_incremental(
+                self.fs, rel_paths, cache, workers=workers, analyzers=self.analyzers
+            )
+        else:
+            results = analyze_files(
+                self.fs, rel_paths, workers=workers, analyzers=self.analyzers
+            )
+        snapshot = build_snapshot(
+            results, source_roots=self.source_roots, entry_points=self._entry_point_list
+        )
+        self.results = {result["metrics"]["path"]: result for result in results}
+        self.rows = {path: i for i, path in enumerate(self.results)}
+        self._build_resolvers()
+        self.externals: dict[str, set[str]] = {}
+        for result in results:
+            resolved = resolve_file(result, self.module_index, self.js_resolver)
+            if resolved is not None:
+                self.externals[result["metrics"]["path"]] = resolved[1]
+        self.importers: dict[str, set[str]] = {path: set() for path in snapshot["resolved_graph"]}
+        for source, targets in snapshot["resolved_graph"].items():
+            for target in targets:
+                self.importers.setdefault(target, set()).add(source)
+        self.violations = {
+            path: validate_architecture({path: imports})
+            for path, imports in snapshot["dependency_graph"].items()
+        }
+        self._index_cycles(snapshot["import_cycles"])
+        self._recompute_reachability(snapshot["resolved_graph"])
+        self.snapshot = snapshot
+        remember_tree(snapshot["snapshot_id"], tree_for(snapshot))
+        return snapshot
+
+    def start_cached(self, workers: int | None, use_cache: bool) -> Snapshot:
+        """``start`` with a scan cache opened and closed in the calling thread."""
+        cache = ScanCache() if use_cache else None
+        try:
+            return self.start(workers=workers, cache=cache)
+        finally:
+            if cache is not None:
+                cache.close()
+
+    def _build_resolvers(self) -> None:
+        self.module_index = ModuleIndex(
+            (path for path in self.results if path.endswith(".py")),
+            source_roots=self.source_roots,
+        )
+        self._build_js_resolver()
+
+    def _build_js_resolver(self) -> None:
+        self.js_resolver = JsResolver(
+            self.results,
+            {
+                path: result["js_config"]
+                for path, result in self.results.items()
+                if result.get("js_config")
+            },
+        )
+
+    def _rebuild_resolvers(
+        self, added: list[str], removed: list[str], changed: dict[str, FileResult]
+    ) -> list[str]:
+        """Update the resolvers after files came or went; return what to re-resolve.
+
+        Added modules are registered in place; removals rebuild the module
+        index. Python imports only change target if they name a module (or
+        package prefix) that appeared or disappeared, or start with a
+        top-level name that did. Any JS/TS specifier may point at any file,
+        so every JS/TS file is re-resolved, and a tsconfig edit re-resolves
+        everything.
+        """
+        if any(os.path.basename(path) in TSCONFIG_NAMES for path in changed):
+            self._build_resolvers()
+            return list(self.results)
+        old_top_level = set(self.module_index.top_level)
+        if removed:
+            self._build_resolvers()
+        else:
+            for path in added:
+                self.module_index.add(path)
+            self._build_js_resolver()
+        top_level = old_top_level ^ self.module_index.top_level
+        names = set()
+        for path in added + removed:
+            for root in self.module_index.source_roots:
+                module = ModuleIndex._module_name(path, root)
+                if module is not None:
+                    parts = module.split(".")
+                    names.update(".".join(parts[:i]) for i in range(1, len(parts) + 1))
+        to_resolve = []
+        for path, result in self.results.items():
+            imports = result["imports"]
+            if imports is None:
+                continue
+            if (
+                path in changed
+                or result["metrics"]["extension"] in JS_EXTENSIONS
+                or not names.isdisjoint(imports)
+                or not names.isdisjoint(result.get("submodule_imports") or ())
+                or (
+                    top_level
+                    and any(module.split(".", 1)[0] in top_level for module in imports)
+                )
+            ):
+                to_resolve.append(path)
+        return to_resolve
+
+    def _index_cycles(self, cycles: list[list[str]]) -> None:
+        self.cycles = {i: list(cycle) for i, cycle in enumerate(cycles)}
+        self.cycle_of = {node: i for i, cycle in self.cycles.items() for node in cycle}
+        self._next_cycle = len(cycles)
+
+    def _recompute_reachability(self, graph: dict[str, list[str]]) -> None:
+        """Reachable files from the entry points, or None if none match."""
+        starts = [path for path in graph if self.entry_points.matches(path)]
+        self.reached: set[str] | None = None
+        if starts:
+            self.reached = set()
+            self._reach(graph, starts)
+
+    def _reach(self, graph: dict[str, list[str]], starts: Iterable[str]) -> None:
+        reached = self.reached
+        stack = [node for node in starts if node in graph and node not in reached]
+        reached.update(stack)
+        while stack:
+            node = stack.pop()
+            parent = _package_parent(node)
+            if parent in graph and parent not in reached:
+                reached.add(parent)
+                stack.append(parent)
+            for target in graph[node]:
+                if target in graph and target not in reached:
+                    reached.add(target)
+                    stack.append(target)
+
+    def _expand(self, paths: Iterable[str]) -> set[str]:
+        """Changed files, with directory events turned into the files under them."""
+        expanded = set()
+        for path in paths:
+            if is_ignored(path):
+                continue
+            full = os.path.join(self.fs.root, path)
+            if path in self.results or os.path.isfile(full):
+                expanded.add(path)
+                continue
+            prefix = path + os.sep
+            expanded.update(p for p in self.results if p.startswith(prefix))
+            if os.path.isdir(full):
+                for dirpath, dirs, files in os.walk(full):
+                    dirs[:] = [d for d in dirs if not is_ignored(d)]
+                    rel = os.path.relpath(dirpath, self.fs.root)
+                    expanded.update(
+                        os.path.join(rel, name) for name in files if not is_ignored(name)
+                    )
+        return expanded
+
+    def apply(self, paths: Iterable[str]) -> Snapshot | None:
+        """Patch in changes to ``paths``; None if nothing scan-relevant changed."""
+        old = self.snapshot
+        changed: dict[str, FileResult] = {}
+        removed: list[str] = []
+        for path in sorted(self._expand(paths)):
+            result = None
+            if os.path.isfile(os.path.join(self.fs.root, path)):
+                result = analyze_file(self.fs, path, self.analyzers)
+            if result is None:
+                if path in self.results:
+                    removed.append(path)
+            elif result != self.results.get(path):
+                changed[path] = result
+        if not changed and not removed:
+            return None
+        added = [path for path in changed if path not in self.results]
+
+        files = old["files"].copy()
+        distribution = dict(old["file_type_distribution"])
+        total_size = old["total_size"]
+        total_lines = old["total_lines_of_code"]
+        tree_changes: dict[str, int | None] = {}
+        for path in removed:
+            metrics = self.results.pop(path)["metrics"]
+            total_size -= metrics["size"]
+            total_lines -= metrics["lines_of_code"]
+            distribution[metrics["extension"]] -= 1
+            if not distribution[metrics["extension"]]:
+                del distribution[metrics["extension"]]
+            tree_changes[path] = None
+        # Update rows in place first: deleting renumbers the rows after a gap.
+        for path, result in changed.items():
+            metrics = result["metrics"]
+            previous = self.results.get(path)
+            if previous is not None:
+                total_size -= previous["metrics"]["size"]
+                total_lines -= previous["metrics"]["lines_of_code"]
+                files.update(self.rows[path], metrics["size"], metrics["lines_of_code"])
+            total_size += metrics["size"]
+            total_lines += metrics["lines_of_code"]
+            tree_changes[path] = metrics["lines_of_code"]
+        if removed:
+            gone = sorted(self.rows.pop(path) for path in removed)
+            files.delete(set(gone))
+            self.rows = {
+                path: row - bisect.bisect(gone, row) for path, row in self.rows.items()
+            }
+        for path in added:
+            self.rows[path] = len(files)
+            metrics = changed[path]["metrics"]
+            files.append(path, metrics["size"], metrics["lines_of_code"], metrics["extension"])
+            distribution[metrics["extension"]] = distribution.get(metrics["extension"], 0) + 1
+        self.results.update(changed)
+
+        dependency_graph = dict(old["dependency_graph"])
+        violations_changed = False
+        for path in removed:
+            dependency_graph.pop(path, None)
+            violations_changed |= bool(self.violations.pop(path, None))
+        for path, result in changed.items():
+            if result["imports"] is not None:
+                dependency_graph[path] = result["imports"]
+                violations = validate_architecture({path: result["imports"]})
+                violations_changed |= violations != self.violations.get(path, [])
+                self.violations[path] = violations
+
+        graph = dict(old["resolved_graph"])
+        external = dict(old["external_imports"])
+        unresolved = dict(old["unresolved_imports"])
+        if added or removed or any(
+            os.path.basename(path) in TSCONFIG_NAMES for path in changed
+        ):
+            to_resolve = self._rebuild_resolvers(added, removed, changed)
+        else:
+            to_resolve = list(changed)
+        for path in removed:
+            graph.pop(path, None)
+            unresolved.pop(path, None)
+            for package in self.externals.pop(path, ()):
+                self._count(external, package, -1)
+        new_edges: dict[str, list[str]] = {}
+        for path in to_resolve:
+            resolved = resolve_file(self.results[path], self.module_index, self.js_resolver)
+            if resolved is None:
+                continue
+            targets, packages, missing = resolved
+            previous = self.externals.get(path, set())
+            if packages != previous:
+                for package in previous - packages:
+                    self._count(external, package, -1)
+                for package in packages - previous:
+                    self._count(external, package, 1)
+                self.externals[path] = packages
+            if missing:
+                unresolved[path] = missing
+            else:
+                unresolved.pop(path, None)
+            if graph.get(path) != targets:
+                new_edges[path] = targets
+
+        added_edges, removed_edges = self._patch_edges(graph, removed, new_edges)
+        self._patch_cycles(graph, added_edges, removed_edges, removed)
+        unused = self._patch_unused(old, graph, added, removed, added_edges, removed_edges)
+
+        snapshot = Snapshot(
+            snapshot_id=uuid.uuid4().hex,
+            timestamp=time.time(),
+            total_files=len(files),
+            total_size=total_size,
+            total_lines_of_code=total_lines,
+            files=files,
+            folders=old["folders"],
+            file_type_distribution=distribution,
+            dependency_graph=dependency_graph,
+            resolved_graph=graph,
+            external_imports=external,
+            unresolved_imports=unresolved,
+            architecture_violations=(
+                [v for path in dependency_graph for v in self.violations[path]]
+                if violations_changed
+                else old["architecture_violations"]
+            ),
+            unused_components=unused,
+            import_cycles=sorted(
+                self.cycles.values(), key=lambda cycle: (-len(cycle), cycle[0])
+            ),
+            partial=False,
+            stop_reason="",
+        )
+        remember_tree(
+            snapshot["snapshot_id"], patch_tree(tree_for(old), tree_changes)
+        )
+        self.snapshot = snapshot
+        return snapshot
+
+    @staticmethod
+    def _count(counts: dict[str, int], key: str, delta: int) -> None:
+        value = counts.get(key, 0) + delta
+        if value:
+            counts[key] = value
+        else:
+            counts.pop(key, None)
+
+    def _patch_edges(
+        self,
+        graph: dict[str, list[str]],
+        removed: list[str],
+        new_edges: dict[str, list[str]],
+    ) -> tuple[list[tuple[str, str]], list[tuple[str, str]]]:
+        """Apply new target lists to ``graph`` and ``importers``; return the edge diff."""
+        added_edges = []
+        removed_edges = []
+        for path in removed:
+            for target in self.importers.pop(path, ()):
+                removed_edges.append((target, path))
+            for target in self.snapshot["resolved_graph"].get(path, ()):
+                removed_edges.append((path, target))
+                self.importers.get(target, set()).discard(path)
+        for path, targets in new_edges.items():
+            before = set(graph.get(path, ()))
+            after = set(targets)
+            for target in before - after:
+                removed_edges.append((path, target))
+                self.importers.get(target, set()).discard(path)
+            for target in after - before:
+                added_edges.append((path, target))
+                self.importers.setdefault(target, set()).add(path)
+            graph[path] = targets
+            self.importers.setdefault(path, set())
+        return added_edges, removed_edges
+
+    def _patch_cycles(
+        self,
+        graph: dict[str, list[str]],
+        added_edges: list[tuple[str, str]],
+        removed_edges: list[tuple[str, str]],
+        removed: list[str],
+    ) -> None:
+        # A removed edge can only split the cycle that held both its ends.
+        split = {
+            self.cycle_of[source]
+            for source, target in removed_edges
+            if source in self.cycle_of and self.cycle_of.get(target) == self.cycle_of[source]
+        }
+        for path in removed:
+            if path in self.cycle_of:
+                split.add(self.cycle_of[path])
+        for cycle_id in split:
+            nodes = {node for node in self.cycles.pop(cycle_id) if node in graph}
+            for node in nodes:
+                self.cycle_of.pop(node, None)
+            for path in removed:
+                self.cycle_of.pop(path, None)
+            for component in _components(graph, nodes):
+                self._add_cycle(component)
+        # A new edge u -> v closes a cycle iff v already reaches u; the
+        # merged cycle is everything reachable from v that also reaches u.
+        for source, target in added_edges:
+            if source not in graph or target not in graph:
+                continue
+            cycle_id = self.cycle_of.get(source)
+            if cycle_id is not None and cycle_id == self.cycle_of.get(target):
+                continue
+            forward = self._walk(target, lambda node: graph.get(node, ()))
+            if source not in forward:
+                continue
+            backward = self._walk(source, lambda node: self.importers.get(node, ()))
+            members = forward & backward
+            for node in members:
+                previous = self.cycle_of.pop(node, None)
+                if previous is not None:
+                    self.cycles.pop(previous, None)
+            self._add_cycle(sorted(members))
+
+    @staticmethod
+    def _walk(start: str, successors) -> set[str]:
+        seen = {start}
+        stack = [start]
+        while stack:
+            for node in successors(stack.pop()):
+                if node not in seen:
+                    seen.add(node)
+                    stack.append(node)
+        return seen
+
+    def _add_cycle(self, cycle: list[str]) -> None:
+        cycle_id = self._next_cycle
+        self._next_cycle += 1
+        self.cycles[cycle_id] = cycle
+        for node in cycle:
+            self.cycle_of[node] = cycle_id
+
+    def _patch_unused(
+        self,
+        old: Snapshot,
+        graph: dict[str, list[str]],
+        added: list[str],
+        removed: list[str],
+        added_edges: list[tuple[str, str]],
+        removed_edges: list[tuple[str, str]],
+    ) -> list[str]:
+        structural = bool(added or removed)
+        if (
+            self.reached is None
+            or any(target in self.reached for _, target in removed_edges)
+            or any(os.path.basename(path) == INIT for path in added)
+            or any(self.entry_points.matches(path) for path in removed)
+        ):
+            previous = self.reached
+            self._recompute_reachability(graph)
+            unchanged = not structural and previous == self.reached
+        else:
+            before = len(self.reached)
+            for path in removed:
+                self.reached.discard(path)
+            self._reach(
+                graph,
+                [path for path in added if self.entry_points.matches(path)]
+                + [target for source, target in added_edges if source in self.reached],
+            )
+            unchanged = not structural and len(self.reached) == before
+        if self.reached is not None:
+            if unchanged:
+                return old["unused_components"]
+            return sorted(path for path in graph if path not in self.reached)
+        # No entry point matches: fall back to files nothing imports.
+        if not structural and not added_edges and not removed_edges:
+            return old["unused_components"]
+        return sorted(
+            path
+            for path in graph
+            if not self.importers.get(path) and not path.endswith(INIT)
+        )
@@ -0,0 +1,67 @@
+from typing import TYPE_CHECKING, TypedDict
+
+if TYPE_CHECKING:
+    from app.scanner.filetable import FileTable
+
+
+class FileMetrics(TypedDict):
+    path: str
+    size: int
+    lines_of_code: int
+    extension: str
+
+
+class FolderMetrics(TypedDict):
+    path: str
+    total_files: int
+    total_size: int
+    file_types: dict[str, int]
+
+
+class ComponentNode(TypedDict):
+    id: str
+    type: str
+
+
+class DependencyEdge(TypedDict):
+    source: str
+    target: str
+
+
+class Snapshot(TypedDict):
+    snapshot_id: str
+    timestamp: float
+    total_files: int
+    total_size: int
+    total_lines_of_code: int
+    files: "FileTable"
+    folders: dict[str, FolderMetrics]
+    file_type_distribution: dict[str, int]
+    dependency_graph: dict[str, list[str]]
+    resolved_graph: dict[str, list[str]]
+    external_imports: dict[str, int]
+    unresolved_imports: dict[str, list[str]]
+    architecture_violations: list[str]
+    unused_components: list[str]
+    import_cycles: list[list[str]]
+    partial: bool
+    stop_reason: str
+
+
+class FileNode(TypedDict):
+    name: str
+    lines_of_code: int
+
+
+class FolderNode(TypedDict):
+    name: str
+    folders: list["FolderNode"]
+    files: list[FileNode]
+    file_count: int
+
+
+class FileResult(TypedDict):
+    metrics: FileMetrics
+    imports: list[str] | None
+    submodule_imports: list[str] | None
+    js_config: dict | None
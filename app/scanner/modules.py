@@ -0,0 +1,175 @@
+import os
+from typing import Iterable, Sequence
+
+from app.scanner.javascript import JS_EXTENSIONS, JsResolver, package_name
+from app.scanner.models import FileResult
+
+DEFAULT_SOURCE_ROOTS = ("", "src")
+
+
+class ModuleIndex:
+    """Maps dotted module names to scanned files, built once per scan.
+
+    Every ``.py`` file is registered under its dotted path relative to the scan
+    root and to each configured source root it lives under, with earlier roots
+    winning collisions. ``pkg/__init__.py`` registers as ``pkg``. Directories
+    holding modules but no ``__init__.py`` register as namespace packages.
+    """
+
+    def __init__(
+        self,
+        py_paths: Iterable[str],
+        source_roots: Sequence[str] = DEFAULT_SOURCE_ROOTS,
+    ):
+        self.source_roots = [os.path.normpath(r) if r else "" for r in source_roots]
+        if "" not in self.source_roots:
+            self.source_roots.append("")
+        self.modules: dict[str, str] = {}
+        self.namespaces: set[str] = set()
+        self.top_level: set[str] = set()
+        for path in py_paths:
+            self.add(path)
+
+    def add(self, path: str) -> list[str]:
+        """Register one more file; returns the names it now resolves."""
+        added = []
+        for root in self.source_roots:
+            module = self._module_name(path, root)
+            if module is None or module in self.modules:
+                continue
+            self.modules[module] = path
+            self.namespaces.discard(module)
+            added.append(module)
+            parts = module.split(".")
+            self.top_level.add(parts[0])
+            for i in range(1, len(parts)):
+                prefix = ".".join(parts[:i])
+                if prefix not in self.modules:
+                    self.namespaces.add(prefix)
+        return added
+
+    @staticmethod
+    def _module_name(path: str, root: str) -> str | None:
+        if root:
+            prefix = root + os.sep
+            if not path.startswith(prefix):
+                return None
+            path = path[len(prefix) :]
+        stem, ext = os.path.splitext(path)
+        if ext != ".py":
+            return None
+        parts = stem.split(os.sep)
+        if parts[-1] == "__init__":
+            parts.pop()
+        if not parts or not all(part.isidentifier() for part in parts):
+            return None
+        return ".".join(parts)
+
+    def resolve(self, module: str) -> str | None:
+        return self.modules.get(module)
+
+    def is_local(self, module: str) -> bool:
+        return module.split(".", 1)[0] in self.top_level
+
+
+def _resolve_python(
+    result: FileResult, index: ModuleIndex
+) -> tuple[set[str], set[str], list[str]]:
+    targets = set()
+    external_packages = set()
+    missing = []
+    for module in result["imports"]:
+        target = index.resolve(module)
+        if target is not None:
+            targets.add(target)
+        elif module in index.namespaces:
+            continue
+        elif module.startswith(".") or index.is_local(module):
+            missing.append(module)
+        else:
+            external_packages.add(module.split(".", 1)[0])
+    for candidate in result.get("submodule_imports") or ():
+        target = index.resolve(candidate)
+        if target is not None:
+            targets.add(target)
+    return targets, external_packages, missing
+
+
+def _resolve_js(
+    source: str, specifiers: list[str], resolver: JsResolver
+) -> tuple[set[str], set[str], list[str]]:
+    targets = set()
+    external_packages = set()
+    missing = []
+    for specifier in specifiers:
+        target = resolver.resolve(source, specifier)
+        if target is not None:
+            targets.add(target)
+        elif resolver.is_relative(specifier):
+            missing.append(specifier)
+        else:
+            external_packages.add(package_name(specifier))
+    return targets, external_packages, missing
+
+
+def _in_graph(result: FileResult, js_resolver: JsResolver | None) -> bool:
+    if result["imports"] is None:
+        return False
+    return js_resolver is not None or result["metrics"]["extension"] not in JS_EXTENSIONS
+
+
+def resolve_file(
+    result: FileResult, index: ModuleIndex, js_resolver: JsResolver | None = None
+) -> tuple[list[str], set[str], list[str]] | None:
+    """One file's sorted targets, external packages and unresolved imports.
+
+    None for files without imports, and for JS/TS files without a resolver.
+    """
+    if not _in_graph(result, js_resolver):
+        return None
+    source = result["metrics"]["path"]
+    if result["metrics"]["extension"] in JS_EXTENSIONS:
+        targets, external_packages, missing = _resolve_js(
+            source, result["imports"], js_resolver
+        )
+    else:
+        targets, external_packages, missing = _resolve_python(result, index)
+    targets.discard(source)
+    return sorted(targets), external_packages, missing
+
+
+def resolve_import_graph(
+    results: list[FileResult],
+    index: ModuleIndex,
+    js_resolver: JsResolver | None = None,
+) -> tuple[dict[str, list[str]], dict[str, int], dict[str, list[str]], list[list[int]]]:
+    """Resolve every import edge to a concrete file in O(1) per edge.
+
+    Returns the file -> files graph for every Python (and, given a resolver,
+    JS/TS) file, the number of files importing each external top-level
+    package, the local-looking imports that match no scanned file, and the
+    graph as integer successor lists (node ids follow the graph's key order,
+    targets outside it are dropped) for ``analyze_reachability``.
+    """
+    ids = {
+        result["metrics"]["path"]: i
+        for i, result in enumerate(r for r in results if _in_graph(r, js_resolver))
+    }
+    node_id = ids.get
+    graph: dict[str, list[str]] = {}
+    adjacency: list[list[int]] = []
+    external: dict[str, int] = {}
+    unresolved: dict[str, list[str]] = {}
+    for result in results:
+        resolved = resolve_file(result, index, js_resolver)
+        if resolved is None:
+            continue
+        source = result["metrics"]["path"]
+        targets, external_packages, missing = resolved
+        graph[source] = targets
+        adjacency.append([i for i in map(node_id, targets) if i is not None])
+        for package in external_packages:
+            external[package] = external.get(package, 0) + 1
+        if missing:
+            unresolved[source] = missing
+    return graph, external, unresolved, adjacency
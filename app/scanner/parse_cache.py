@@ -0,0 +1,204 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, NamedTuple
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    "INDU_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "indu")
+)
+DEFAULT_STORE_PATH = os.path.join(DEFAULT_CACHE_DIR, "parse_cache_v1.sqlite3")
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_STORED = int(os.environ.get("INDU_MAX_STORED_PARSES", "500000"))
+ENTRY_OVERHEAD = 64
+FLUSH_EVERY = 256
+
+
+class RawImport(NamedTuple):
+    """An import statement as written, before relative resolution against a path.
+
+    ``names`` is None for ``import module`` and the imported names for
+    ``from module import ...``.
+    """
+
+    module: str | None
+    level: int
+    names: tuple[str, ...] | None
+
+
+def content_digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _entry_size(imports: tuple[RawImport, ...]) -> int:
+    size = ENTRY_OVERHEAD
+    for item in imports:
+        size += ENTRY_OVERHEAD + len(item.module or "")
+        if item.names:
+            size += sum(len(name) for name in item.names)
+    return size
+
+
+class ParseStore:
+    """Raw imports by content hash in SQLite, shared by every process of a scan.
+
+    Pool workers each keep their own in-memory ParseCache; this is the tier
+    they share, so a file parsed by one worker (or an earlier scan, or another
+    upload) is not parsed again by the next. Writes are buffered and flushed
+    in batches; beyond ``max_rows`` the oldest rows are dropped. Any SQLite
+    error disables the store for the process and scans carry on without it.
+    """
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH, max_rows: int = DEFAULT_MAX_STORED):
+        self.path = path
+        self.max_rows = max_rows
+        self._conn = None
+        self._failed = False
+        self._pending: list[tuple[bytes, str]] = []
+
+    def _connect(self):
+        if self._conn is None and not self._failed:
+            import sqlite3
+
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                with conn:
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS parsed "
+                        "(digest BLOB PRIMARY KEY, imports TEXT)"
+                    )
+                self._conn = conn
+            except (OSError, sqlite3.Error) as e:
+                self._fail(e)
+        return self._conn
+
+    def _fail(self, e: Exception) -> None:
+        logging.exception(f"Parse store {self.path} disabled: {e}")
+        self._failed = True
+        self._pending.clear()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def get(self, digest: bytes) -> tuple[RawImport, ...] | None:
+        import sqlite3
+
+        conn = self._connect()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT imports FROM parsed WHERE digest = ?", (digest,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            self._fail(e)
+            return None
+        if row is None:
+            return None
+        return tuple(
+            RawImport(module, level, tuple(names) if names is not None else None)
+            for module, level, names in json.loads(row[0])
+        )
+
+    def put(self, digest: bytes, imports: tuple[RawImport, ...]) -> None:
+        if self._failed:
+            return
+        self._pending.append((digest, json.dumps(imports)))
+        if len(self._pending) >= FLUSH_EVERY:
+            self.flush()
+
+    def flush(self) -> None:
+        import sqlite3
+
+        if not self._pending:
+            return
+        conn = self._connect()
+        if conn is None:
+            return
+        pending, self._pending = self._pending, []
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO parsed (digest, imports) VALUES (?, ?)", pending
+                )
+                conn.execute(
+                    "DELETE FROM parsed WHERE rowid <= "
+                    "(SELECT MAX(rowid) FROM parsed) - ?",
+                    (self.max_rows,),
+                )
+        except sqlite3.Error as e:
+            self._fail(e)
+
+    def close(self) -> None:
+        self.flush()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class ParseCache:
+    """Process-wide LRU of raw imports keyed by content hash, bounded by total bytes.
+
+    Identical files parse once no matter which path, project or upload they
+    come from; callers resolve relative imports against their own path.
+    Misses fall through to the shared ``store`` before parsing.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, store: ParseStore | None = None):
+        self.max_bytes = max_bytes
+        self.store = store
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, tuple[tuple[RawImport, ...], int]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get_or_parse(
+        self, digest: bytes, parse: Callable[[], tuple[RawImport, ...]]
+    ) -> tuple[RawImport, ...]:
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None:
+                self._entries.move_to_end(digest)
+                self.hits += 1
+                return entry[0]
+            imports = self.store.get(digest) if self.store is not None else None
+            if imports is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if imports is None:
+            imports = parse()
+            if self.store is not None:
+                with self._lock:
+                    self.store.put(digest, imports)
+        size = _entry_size(imports)
+        with self._lock:
+            if digest not in self._entries and size <= self.max_bytes:
+                self._entries[digest] = (imports, size)
+                self.total_bytes += size
+                while self.total_bytes > self.max_bytes:
+                    _, (_, evicted_size) = self._entries.popitem(last=False)
+                    self.total_bytes -= evicted_size
+        return imports
+
+    def flush(self) -> None:
+        """Write buffered parses through to the store."""
+        if self.store is not None:
+            with self._lock:
+                self.store.flush()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+
+PARSE_CACHE = ParseCache(store=ParseStore())
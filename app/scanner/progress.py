@@ -0,0 +1,72 @@
+import time
+from typing import Callable, TypedDict
+
+
+class ScanProgress(TypedDict):
+    phase: str
+    files_total: int
+    files_processed: int
+    bytes_read: int
+    lines_of_code: int
+
+
+ProgressCallback = Callable[[ScanProgress], None]
+
+DEFAULT_EVERY_FILES = 1000
+DEFAULT_EVERY_SECONDS = 0.25
+
+
+class ProgressReporter:
+    """Accumulates scan counters and forwards them to a callback, throttled.
+
+    A report goes out on every phase change, and otherwise at most once per
+    ``every_seconds`` unless ``every_files`` files were processed since the
+    last one, so reporting cost stays flat however fast batches complete.
+    """
+
+    def __init__(
+        self,
+        callback: ProgressCallback | None = None,
+        every_files: int = DEFAULT_EVERY_FILES,
+        every_seconds: float = DEFAULT_EVERY_SECONDS,
+    ):
+        self.callback = callback
+        self.every_files = every_files
+        self.every_seconds = every_seconds
+        self.progress = ScanProgress(
+            phase="walk",
+            files_total=0,
+            files_processed=0,
+            bytes_read=0,
+            lines_of_code=0,
+        )
+        self._last_emit = 0.0
+        self._last_files = 0
+
+    def set_phase(self, phase: str, files_total: int | None = None) -> None:
+        self.progress["phase"] = phase
+        if files_total is not None:
+            self.progress["files_total"] = files_total
+        self._emit()
+
+    def discover(self, files: int) -> None:
+        self.progress["files_total"] += files
+        if time.monotonic() - self._last_emit >= self.every_seconds:
+            self._emit()
+
+    def advance(self, files: int, bytes_read: int = 0, lines_of_code: int = 0) -> None:
+        self.progress["files_processed"] += files
+        self.progress["bytes_read"] += bytes_read
+        self.progress["lines_of_code"] += lines_of_code
+        if (
+            self.progress["files_processed"] - self._last_files >= self.every_files
+            or time.monotonic() - self._last_emit >= self.every_seconds
+        ):
+            self._emit()
+
+    def _emit(self) -> None:
+        if self.callback is None:
+            return
+        self._last_emit = time.monotonic()
+        self._last_files = self.progress["files_processed"]
+        self.callback(ScanProgress(**self.progress))
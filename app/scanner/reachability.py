@@ -0,0 +1,207 @@
+import fnmatch
+import gc
+import os
+import re
+from itertools import chain
+from typing import Iterable, Sequence
+
+DEFAULT_ENTRY_POINTS = tuple(
+    entry
+    for entry in os.environ.get(
+        "INDU_ENTRY_POINTS",
+        "app/app.py,rxconfig.py,setup.py,tests,test,*conftest.py,*__main__.py,"
+        "src/main.*,src/index.*,index.*,pages,src/pages,*.config.*,*.test.*,*.spec.*",
+    ).split(",")
+    if entry
+)
+
+
+class EntryPoints:
+    """Matches scanned paths against configured entry points.
+
+    An entry is an exact file path, a directory (every file under it is an
+    entry, e.g. test roots) or a glob when it contains ``*``, ``?`` or ``[``.
+    """
+
+    def __init__(self, entries: Iterable[str] = DEFAULT_ENTRY_POINTS):
+        patterns = []
+        for entry in entries:
+            if any(ch in entry for ch in "*?["):
+                patterns.append(fnmatch.translate(entry))
+            else:
+                entry = re.escape(os.path.normpath(entry))
+                patterns.append(f"{entry}\\Z|{entry}{re.escape(os.sep)}")
+        # One alternation, so matching a path is a single regex call.
+        self._match = re.compile("|".join(patterns)).match if patterns else None
+
+    def matches(self, path: str) -> bool:
+        return self._match is not None and self._match(path) is not None
+
+
+def _package_parents(paths: list[str]) -> list[int]:
+    """Id of the ``__init__.py`` Python runs before each module, or -1."""
+    init = "__init__.py"
+    sep = os.sep
+    packages: dict[str, int] = {}
+    for i, path in enumerate(paths):
+        directory, _, name = path.rpartition(sep)
+        if name == init:
+            packages[directory] = i
+    if not packages:
+        return [-1] * len(paths)
+    parents = []
+    for path in paths:
+        directory, _, name = path.rpartition(sep)
+        if name == init:
+            directory = directory.rpartition(sep)[0]
+        parents.append(packages.get(directory, -1) if directory else -1)
+    return parents
+
+
+def _adjacency(graph: dict[str, list[str]], ids: dict[str, int]) -> list[list[int]]:
+    """Integer successor lists; targets outside the graph are dropped."""
+    lookup = ids.__getitem__
+    adjacency = []
+    for targets in graph.values():
+        try:
+            adjacency.append(list(map(lookup, targets)))
+        except KeyError:
+            adjacency.append([ids[t] for t in targets if t in ids])
+    return adjacency
+
+
+def strongly_connected_components(adjacency: list[list[int]]) -> list[list[int]]:
+    """Iterative Tarjan; returns components in reverse topological order.
+
+    The DFS keeps explicit node and successor-iterator stacks, so depth is
+    bounded by memory rather than the recursion limit. Nodes without
+    successors are emitted as singletons without being pushed.
+    """
+    count = len(adjacency)
+    index = [-1] * count
+    lowlink = [0] * count
+    on_stack = bytearray(count)
+    stack: list[int] = []
+    push = stack.append
+    pop = stack.pop
+    components: list[list[int]] = []
+    next_index = 0
+    for start in range(count):
+        if index[start] != -1:
+            continue
+        if not adjacency[start]:
+            index[start] = next_index
+            next_index += 1
+            components.append([start])
+            continue
+        index[start] = lowlink[start] = next_index
+        next_index += 1
+        push(start)
+        on_stack[start] = 1
+        nodes = [start]
+        iterators = [iter(adjacency[start])]
+        while nodes:
+            node = nodes[-1]
+            low = lowlink[node]
+            for successor in iterators[-1]:
+                successor_index = index[successor]
+                if successor_index == -1:
+                    if not adjacency[successor]:
+                        index[successor] = next_index
+                        next_index += 1
+                        components.append([successor])
+                        continue
+                    lowlink[node] = low
+                    index[successor] = lowlink[successor] = next_index
+                    next_index += 1
+                    push(successor)
+                    on_stack[successor] = 1
+                    nodes.append(successor)
+                    iterators.append(iter(adjacency[successor]))
+                    break
+                if successor_index < low and on_stack[successor]:
+                    low = successor_index
+            else:
+                nodes.pop()
+                iterators.pop()
+                if nodes:
+                    parent = nodes[-1]
+                    if low < lowlink[parent]:
+                        lowlink[parent] = low
+                if low == index[node]:
+                    member = pop()
+                    on_stack[member] = 0
+                    if member == node:
+                        components.append([member])
+                    else:
+                        component = [member]
+                        while member != node:
+                            member = pop()
+                            on_stack[member] = 0
+                            component.append(member)
+                        components.append(component)
+                else:
+                    lowlink[node] = low
+    return components
+
+
+def analyze_reachability(
+    graph: dict[str, list[str]],
+    entry_points: Sequence[str] = DEFAULT_ENTRY_POINTS,
+    adjacency: list[list[int]] | None = None,
+) -> tuple[list[str] | None, list[list[str]]]:
+    """Find files unreachable from the entry points, and import cycles.
+
+    Importing a module also runs its packages' ``__init__`` files, so those
+    count as reachable from it. Returns ``(unreachable, cycles)``;
+    ``unreachable`` is None when no scanned file matches an entry point, as
+    every file would otherwise be reported. Cycles are sorted largest first.
+
+    ``adjacency`` is the graph as integer successor lists in key order, as
+    ``resolve_import_graph`` returns it; it is derived from ``graph`` if omitted.
+    """
+    # The walk allocates no reference cycles, only many small lists, which
+    # would otherwise set off repeated full collections over the whole graph.
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _analyze(graph, entry_points, adjacency)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def _analyze(
+    graph: dict[str, list[str]],
+    entry_points: Sequence[str],
+    adjacency: list[list[int]] | None,
+) -> tuple[list[str] | None, list[list[str]]]:
+    paths = list(graph)
+    if adjacency is None:
+        adjacency = _adjacency(graph, {path: i for i, path in enumerate(paths)})
+
+    matcher = EntryPoints(entry_points)
+    frontier = [i for i, path in enumerate(paths) if matcher.matches(path)]
+    unreachable = None
+    if frontier:
+        parents = _package_parents(paths)
+        successors = adjacency.__getitem__
+        package_of = parents.__getitem__
+        reached = set(frontier)
+        # Level-synchronous walk: the per-edge work happens in set operations.
+        while frontier:
+            level = set(chain.from_iterable(map(successors, frontier)))
+            level.update(map(package_of, frontier))
+            level.discard(-1)
+            level -= reached
+            reached |= level
+            frontier = level
+        unreachable = sorted(path for i, path in enumerate(paths) if i not in reached)
+
+    cycles = [
+        sorted(paths[i] for i in component)
+        for component in strongly_connected_components(adjacency)
+        if len(component) > 1
+    ]
+    cycles.sort(key=lambda cycle: (-len(cycle), cycle[0]))
+    return unreachable, cycles
@@ -0,0 +1,463 @@
+"""Config-driven background scanning of many projects.
+
+``config.json`` (or ``$INDU_CONFIG``) looks like::
+
+    {
+      "scheduler": {"max_concurrent": 2, "max_queue": 64, "workers": 8},
+      "projects": [
+        {"name": "web", "path": "../web", "priority": 10,
+         "min_interval_seconds": 600, "budget": {"max_seconds": 300},
+         "entry_points": ["src/main.tsx"], "source_roots": ["", "src"]}
+      ]
+    }
+
+Relative project paths resolve against the config file's directory.
+
+The scheduler, like SNAPSHOT_STORE, PROJECT_HISTORY and SCAN_COORDINATOR,
+lives in process memory, so the app must run as a single backend worker.
+Reflex only starts several when a Redis state manager is configured;
+there every worker would run its own scheduler and rescan every project,
+so it only starts in a process with ``INDU_SCHEDULER_LEADER=1``.
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import os
+import shlex
+import time
+from collections import deque
+from typing import Sequence, TypedDict
+
+from app.scanner.cache import ScanCache
+from app.scanner.control import ScanBudget, ScanControl
+from app.scanner.coordinator import SCAN_COORDINATOR, ScanCoordinator
+from app.scanner.engine import scan_project
+from app.scanner.filetree import tree_for
+from app.scanner.models import Snapshot
+from app.scanner.modules import DEFAULT_SOURCE_ROOTS
+from app.scanner.progress import ProgressCallback
+from app.scanner.reachability import DEFAULT_ENTRY_POINTS
+from app.scanner.store import SNAPSHOT_STORE, SnapshotStore
+from app.scanner.vfs import ZipFileSystem, as_filesystem
+
+DEFAULT_CONFIG_PATH = os.environ.get("INDU_CONFIG", "config.json")
+DEFAULT_MAX_CONCURRENT = 2
+DEFAULT_MAX_QUEUE = 64
+DEFAULT_MIN_INTERVAL_SECONDS = 300.0
+DEFAULT_HISTORY_PER_PROJECT = int(os.environ.get("INDU_PROJECT_HISTORY", "20"))
+TICK_SECONDS = 1.0
+BUDGET_TYPES = {"max_seconds": float, "max_files": int, "max_bytes": int}
+
+
+class ProjectConfig(TypedDict):
+    name: str
+    path: str
+    priority: int
+    min_interval_seconds: float
+    budget: ScanBudget
+    source_roots: list[str]
+    entry_points: list[str]
+
+
+class SchedulerConfig(TypedDict):
+    max_concurrent: int
+    max_queue: int
+    workers: int | None
+    use_cache: bool
+
+
+class HistoryEntry(TypedDict):
+    snapshot_id: str
+    timestamp: float
+    total_files: int
+    total_lines_of_code: int
+    partial: bool
+
+
+class ProjectStatus(TypedDict):
+    name: str
+    path: str
+    priority: int
+    state: str
+    last_snapshot_id: str
+    last_finished: float
+    last_error: str
+    scans: int
+
+
+def run_scan_blocking(
+    scan_path: str,
+    workers: int | None,
+    use_cache: bool,
+    progress: ProgressCallback | None = None,
+    control: ScanControl | None = None,
+    identity: str = "",
+    source_roots: Sequence[str] = DEFAULT_SOURCE_ROOTS,
+    entry_points: Sequence[str] = DEFAULT_ENTRY_POINTS,
+) -> Snapshot:
+    """Blocking scan used by both the UI and the scheduler; run it in a thread.
+
+    Uploaded archives are scanned in place; ``identity`` (the upload's
+    content hash) lets re-uploads of the same archive reuse the scan cache.
+    The folder trie is built here for the dashboard; the graph layout is
+    left to the Dependencies page, which asks for it through ``layout_for``.
+    """
+    cache = ScanCache() if use_cache else None
+    if identity:
+        source = ZipFileSystem(scan_path, identity=f"zip:{identity}")
+    else:
+        source = as_filesystem(scan_path)
+    try:
+        snapshot = scan_project(
+            source,
+            workers=workers,
+            cache=cache,
+            progress=progress,
+            control=control,
+            source_roots=source_roots,
+            entry_points=entry_points,
+        )
+    finally:
+        source.close()
+        if cache is not None:
+            cache.close()
+    tree_for(snapshot)
+    return snapshot
+
+
+def _string_list(value, field: str, name: str) -> list[str]:
+    if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+        raise ValueError(f"Project {name!r}: {field} must be a list of strings")
+    return value
+
+
+def _project_config(entry, base: str) -> ProjectConfig:
+    """One validated project entry; raises TypeError or ValueError if malformed."""
+    if not isinstance(entry, dict):
+        raise ValueError("a project must be a JSON object")
+    name = entry.get("name")
+    project_path = entry.get("path")
+    if not isinstance(name, str) or not isinstance(project_path, str):
+        raise ValueError("a project needs a string name and path")
+    budget = entry.get("budget") or {}
+    if not isinstance(budget, dict) or not set(budget) <= set(BUDGET_TYPES):
+        raise ValueError(f"Project {name!r}: budget may only set {', '.join(BUDGET_TYPES)}")
+    return ProjectConfig(
+        name=name,
+        path=os.path.normpath(os.path.join(base, project_path)),
+        priority=int(entry.get("priority", 0)),
+        min_interval_seconds=float(
+            entry.get("min_interval_seconds", DEFAULT_MIN_INTERVAL_SECONDS)
+        ),
+        budget=ScanBudget(
+            **{key: BUDGET_TYPES[key](value) for key, value in budget.items()}
+        ),
+        source_roots=_string_list(
+            entry.get("source_roots", list(DEFAULT_SOURCE_ROOTS)), "source_roots", name
+        ),
+        entry_points=_string_list(
+            entry.get("entry_points", list(DEFAULT_ENTRY_POINTS)), "entry_points", name
+        ),
+    )
+
+
+def load_config(
+    path: str = DEFAULT_CONFIG_PATH,
+) -> tuple[SchedulerConfig, list[ProjectConfig]]:
+    """Read the scheduler settings and projects; a missing file means no projects.
+
+    Raises ValueError for a malformed file or scheduler settings. Malformed
+    project entries (and duplicate names) are logged and skipped, so one bad
+    entry does not stop the other projects from being scheduled.
+    """
+    settings = SchedulerConfig(
+        max_concurrent=DEFAULT_MAX_CONCURRENT,
+        max_queue=DEFAULT_MAX_QUEUE,
+        workers=None,
+        use_cache=True,
+    )
+    if not os.path.exists(path):
+        return settings, []
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"{path} must contain a JSON object")
+    scheduler = data.get("scheduler") or {}
+    if not isinstance(scheduler, dict):
+        raise ValueError(f"{path}: scheduler must be a JSON object")
+    for key, value in scheduler.items():
+        if key in settings:
+            settings[key] = value
+    try:
+        settings["max_concurrent"] = int(settings["max_concurrent"])
+        settings["max_queue"] = int(settings["max_queue"])
+        if settings["workers"] is not None:
+            settings["workers"] = int(settings["workers"])
+        settings["use_cache"] = bool(settings["use_cache"])
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"{path}: invalid scheduler settings: {e}") from e
+    if settings["max_concurrent"] < 1 or settings["max_queue"] < 1:
+        raise ValueError("max_concurrent and max_queue must be at least 1")
+    entries = data.get("projects") or []
+    if not isinstance(entries, list):
+        raise ValueError(f"{path}: projects must be a JSON list")
+    base = os.path.dirname(os.path.abspath(path))
+    projects: list[ProjectConfig] = []
+    names = set()
+    for i, entry in enumerate(entries):
+        try:
+            project = _project_config(entry, base)
+            if project["name"] in names:
+                raise ValueError(f"duplicate project name {project['name']!r}")
+        except (TypeError, ValueError) as e:
+            logging.error(f"Skipping project #{i} in {path}: {e}")
+            continue
+        names.add(project["name"])
+        projects.append(project)
+    return settings, projects
+
+
+class ProjectHistory:
+    """Snapshot history per project, newest last.
+
+    The newest snapshot of every project stays pinned in the snapshot
+    store, so switching projects never needs a rescan. Older entries keep
+    their summary numbers even after the store evicts their snapshots.
+    """
+
+    def __init__(
+        self,
+        store: SnapshotStore = SNAPSHOT_STORE,
+        max_entries: int = DEFAULT_HISTORY_PER_PROJECT,
+    ):
+        self.store = store
+        self.max_entries = max_entries
+        self._entries: dict[str, deque[HistoryEntry]] = {}
+
+    def record(self, name: str, snapshot: Snapshot) -> None:
+        entries = self._entries.setdefault(name, deque(maxlen=self.max_entries))
+        previous = entries[-1]["snapshot_id"] if entries else ""
+        snapshot_id = self.store.put(snapshot)
+        self.store.pin(snapshot_id)
+        entries.append(
+            HistoryEntry(
+                snapshot_id=snapshot_id,
+                timestamp=snapshot["timestamp"],
+                total_files=snapshot["total_files"],
+                total_lines_of_code=snapshot["total_lines_of_code"],
+                partial=snapshot["partial"],
+            )
+        )
+        if previous and previous != snapshot_id:
+            self.store.unpin(previous)
+
+    def latest(self, name: str) -> Snapshot | None:
+        entries = self._entries.get(name)
+        return self.store.get(entries[-1]["snapshot_id"]) if entries else None
+
+    def entries(self, name: str) -> list[HistoryEntry]:
+        return list(self._entries.get(name, ()))
+
+
+PROJECT_HISTORY = ProjectHistory()
+
+
+class ScanScheduler:
+    """Keeps configured projects scanned with bounded concurrency.
+
+    A project becomes due ``min_interval_seconds`` after its last scan
+    finished (or failed); due projects are queued highest priority first.
+    At most ``max_concurrent`` scans run at once, all through the shared
+    scan coordinator and process pool. The queue holds at most
+    ``max_queue`` projects: once it is full, due projects stay unqueued
+    until a slot frees up, and ``enqueue`` reports False so callers can
+    back off instead of piling up work.
+    """
+
+    def __init__(
+        self,
+        projects: list[ProjectConfig],
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        workers: int | None = None,
+        use_cache: bool = True,
+        history: ProjectHistory = PROJECT_HISTORY,
+        coordinator: ScanCoordinator = SCAN_COORDINATOR,
+    ):
+        self.projects = {project["name"]: project for project in projects}
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.workers = workers
+        self.use_cache = use_cache
+        self.history = history
+        self.coordinator = coordinator
+        self.status = {
+            project["name"]: ProjectStatus(
+                name=project["name"],
+                path=project["path"],
+                priority=project["priority"],
+                state="idle",
+                last_snapshot_id="",
+                last_finished=0.0,
+                last_error="",
+                scans=0,
+            )
+            for project in projects
+        }
+        self._next_due = {name: 0.0 for name in self.projects}
+        self._controls: dict[str, ScanControl] = {}
+        self._order = itertools.count()
+        self._queue: asyncio.PriorityQueue | None = None
+
+    @property
+    def backlog(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def enqueue(self, name: str, force: bool = False) -> bool:
+        """Queue a scan of ``name``; ``force`` ignores the minimum interval.
+
+        Returns False if the project is already queued or scanning, is not
+        due yet, the scheduler is not running, or the queue is full.
+        """
+        status = self.status[name]
+        if self._queue is None or status["state"] in ("queued", "scanning"):
+            return False
+        if not force and time.monotonic() < self._next_due[name]:
+            return False
+        try:
+            self._queue.put_nowait(
+                (-self.projects[name]["priority"], next(self._order), name)
+            )
+        except asyncio.QueueFull:
+            return False
+        status["state"] = "queued"
+        return True
+
+    async def _scan(self, project: ProjectConfig) -> None:
+        name = project["name"]
+        status = self.status[name]
+        status["state"] = "scanning"
+        control = ScanControl()
+        self._controls[name] = control
+        try:
+            snapshot = await self.coordinator.run(
+                project["path"],
+                lambda progress, scan_control: run_scan_blocking(
+                    project["path"],
+                    self.workers,
+                    self.use_cache,
+                    progress,
+                    scan_control,
+                    source_roots=project["source_roots"],
+                    entry_points=project["entry_points"],
+                ),
+                budget=project["budget"],
+                control=control,
+                options=(
+                    tuple(project["source_roots"]),
+                    tuple(project["entry_points"]),
+                ),
+            )
+            if snapshot is not None:
+                self.history.record(name, snapshot)
+                status["last_snapshot_id"] = snapshot["snapshot_id"]
+                status["last_finished"] = time.time()
+                status["last_error"] = ""
+                status["scans"] += 1
+            status["state"] = "idle"
+        except Exception as e:
+            logging.exception(f"Scheduled scan of {name} failed: {e}")
+            status["state"] = "failed"
+            status["last_error"] = str(e)
+        finally:
+            del self._controls[name]
+            self._next_due[name] = time.monotonic() + project["min_interval_seconds"]
+
+    async def _worker(self) -> None:
+        while True:
+            _, _, name = await self._queue.get()
+            try:
+                await self._scan(self.projects[name])
+            finally:
+                self._queue.task_done()
+
+    async def run(self) -> None:
+        """Schedule scans until cancelled; cancelling also stops running scans."""
+        self._queue = asyncio.PriorityQueue(self.max_queue)
+        by_priority = sorted(
+            self.projects.values(), key=lambda project: -project["priority"]
+        )
+        workers = [
+            asyncio.create_task(self._worker()) for _ in range(self.max_concurrent)
+        ]
+        try:
+            while True:
+                for project in by_priority:
+                    if self._queue.full():
+                        break
+                    self.enqueue(project["name"])
+                await asyncio.sleep(TICK_SECONDS)
+        finally:
+            for task in workers:
+                task.cancel()
+            for control in self._controls.values():
+                control.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self._queue = None
+
+
+SCHEDULER: ScanScheduler | None = None
+
+
+def multiple_backend_workers() -> bool:
+    """Whether the environment asks for more than one backend worker process."""
+    if os.environ.get("REFLEX_REDIS_URL"):
+        return True
+    for name in ("GRANIAN_WORKERS", "WEB_CONCURRENCY"):
+        if os.environ.get(name, "1").strip() not in ("", "1"):
+            return True
+    args = shlex.split(os.environ.get("GUNICORN_CMD_ARGS", ""))
+    for i, arg in enumerate(args):
+        if arg in ("-w", "--workers"):
+            value = args[i + 1] if i + 1 < len(args) else "1"
+        elif arg.startswith("--workers="):
+            value = arg.partition("=")[2]
+        elif arg.startswith("-w"):
+            value = arg[2:]
+        else:
+            continue
+        if value != "1":
+            return True
+    return False
+
+
+async def run_configured_scheduler(config_path: str = DEFAULT_CONFIG_PATH) -> None:
+    """App lifespan task: schedule the projects in ``config_path``, if any."""
+    global SCHEDULER
+    try:
+        settings, projects = load_config(config_path)
+    except (OSError, ValueError) as e:
+        logging.exception(f"Invalid scheduler config {config_path}: {e}")
+        return
+    if not projects:
+        return
+    if multiple_backend_workers() and os.environ.get("INDU_SCHEDULER_LEADER") != "1":
+        logging.error(
+            "Not starting the project scheduler: the app is running with several "
+            "backend workers, and each would scan every project. Run a single "
+            "worker, or set INDU_SCHEDULER_LEADER=1 on exactly one of them."
+        )
+        return
+    SCHEDULER = ScanScheduler(
+        projects,
+        max_concurrent=settings["max_concurrent"],
+        max_queue=settings["max_queue"],
+        workers=settings["workers"],
+        use_cache=settings["use_cache"],
+    )
+    try:
+        await SCHEDULER.run()
+    finally:
+        SCHEDULER = None
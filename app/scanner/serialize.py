@@ -0,0 +1,66 @@
+import json
+from typing import IO, Any, Iterator
+
+from app.scanner.models import Snapshot
+
+# Fields that grow with the project; the summary leaves them out and the
+# API serves them paginated or streamed instead.
+BULK_FIELDS = ("files", "dependency_graph", "resolved_graph")
+NDJSON_BATCH_SIZE = 1000
+
+_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def snapshot_to_dict(snapshot: Snapshot) -> dict[str, Any]:
+    """Plain JSON-ready dict; the columnar file table becomes a list of records."""
+    data = dict(snapshot)
+    data["files"] = snapshot["files"].to_records()
+    return data
+
+
+def dump_snapshot(snapshot: Snapshot, fp: IO[str], indent: int | None = None) -> None:
+    json.dump(snapshot_to_dict(snapshot), fp, indent=indent)
+
+
+def snapshot_json(snapshot: Snapshot) -> bytes:
+    return _encode(snapshot_to_dict(snapshot)).encode()
+
+
+def to_json(data: Any) -> bytes:
+    return _encode(data).encode()
+
+
+def snapshot_summary(snapshot: Snapshot) -> dict[str, Any]:
+    """Everything but the bulk fields, plus their sizes."""
+    data = {key: value for key, value in snapshot.items() if key not in BULK_FIELDS}
+    data["edge_count"] = sum(len(targets) for targets in snapshot["resolved_graph"].values())
+    return data
+
+
+def file_page(snapshot: Snapshot, offset: int, limit: int) -> tuple[list, int | None]:
+    """Records ``offset`` to ``offset + limit`` and the offset of the next page."""
+    files = snapshot["files"]
+    end = min(offset + limit, len(files))
+    records = [files.record(i) for i in range(offset, end)]
+    return records, (end if end < len(files) else None)
+
+
+def iter_file_lines(snapshot: Snapshot, offset: int = 0) -> Iterator[bytes]:
+    """NDJSON file records, a batch of lines per chunk, built as they are sent."""
+    files = snapshot["files"]
+    for start in range(offset, len(files), NDJSON_BATCH_SIZE):
+        end = min(start + NDJSON_BATCH_SIZE, len(files))
+        yield "".join(_encode(files.record(i)) + "\n" for i in range(start, end)).encode()
+
+
+def iter_edge_lines(snapshot: Snapshot) -> Iterator[bytes]:
+    """NDJSON ``{"source", "target"}`` lines for the resolved import graph."""
+    batch = []
+    for source, targets in snapshot["resolved_graph"].items():
+        for target in targets:
+            batch.append(_encode({"source": source, "target": target}) + "\n")
+            if len(batch) >= NDJSON_BATCH_SIZE:
+                yield "".join(batch).encode()
+                batch = []
+    if batch:
+        yield "".join(batch).encode()
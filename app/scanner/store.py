@@ -0,0 +1,67 @@
+import os
+import threading
+from collections import OrderedDict
+
+from app.scanner.models import Snapshot
+
+DEFAULT_MAX_SNAPSHOTS = int(os.environ.get("INDU_MAX_SNAPSHOTS", "64"))
+
+
+class SnapshotStore:
+    """Process-wide snapshot storage; sessions hold snapshot IDs, not snapshots.
+
+    Snapshots shared through the scan coordinator are stored once however
+    many sessions reference them. The least recently used snapshots are
+    dropped beyond ``max_snapshots``, so callers must handle ``get`` returning
+    None for an ID that has been evicted. Pinned snapshots are never evicted
+    and do not count towards the limit.
+    """
+
+    def __init__(self, max_snapshots: int = DEFAULT_MAX_SNAPSHOTS):
+        self.max_snapshots = max_snapshots
+        self._snapshots: OrderedDict[str, Snapshot] = OrderedDict()
+        self._pinned: set[str] = set()
+        self._lock = threading.Lock()
+
+    def put(self, snapshot: Snapshot) -> str:
+        snapshot_id = snapshot["snapshot_id"]
+        with self._lock:
+            self._snapshots[snapshot_id] = snapshot
+            self._snapshots.move_to_end(snapshot_id)
+            self._evict()
+        return snapshot_id
+
+    def _evict(self) -> None:
+        excess = len(self._snapshots) - len(self._pinned) - self.max_snapshots
+        for snapshot_id in list(self._snapshots):
+            if excess <= 0:
+                break
+            if snapshot_id not in self._pinned:
+                del self._snapshots[snapshot_id]
+                excess -= 1
+
+    def pin(self, snapshot_id: str) -> None:
+        with self._lock:
+            if snapshot_id in self._snapshots:
+                self._pinned.add(snapshot_id)
+
+    def unpin(self, snapshot_id: str) -> None:
+        with self._lock:
+            self._pinned.discard(snapshot_id)
+            self._evict()
+
+    def get(self, snapshot_id: str) -> Snapshot | None:
+        if not snapshot_id:
+            return None
+        with self._lock:
+            snapshot = self._snapshots.get(snapshot_id)
+            if snapshot is not None:
+                self._snapshots.move_to_end(snapshot_id)
+            return snapshot
+
+    def discard(self, snapshot_id: str) -> None:
+        with self._lock:
+            self._snapshots.pop(snapshot_id, None)
+            self._pinned.discard(snapshot_id)
+
+SNAPSHOT_STORE = SnapshotStore()
@@ -0,0 +1,237 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Iterator
+
+from app.scanner.cache import FileSignature, file_signature
+
+if TYPE_CHECKING:
+    import zipfile
+
+WalkEntry = tuple[str, list[str], list[str]]
+
+MAX_SHARED_ARCHIVES = 4
+
+
+class FileSystem:
+    """Where the scanner enumerates and reads files from.
+
+    Paths are relative to the scan root and use ``os.sep``. ``root`` is the
+    base that Python relative imports resolve against (only ever used
+    lexically), and ``cache_root`` identifies the tree in the scan cache.
+    Implementations must be picklable so process-pool workers can read
+    files themselves.
+    """
+
+    root: str
+    cache_root: str
+
+    def walk(self) -> Iterator[WalkEntry]:
+        """``os.walk``-style, top-down with relative directory paths; callers
+        may prune by editing the directory list in place."""
+        raise NotImplementedError
+
+    def size(self, rel_path: str) -> int:
+        raise NotImplementedError
+
+    def read(self, rel_path: str) -> bytes:
+        raise NotImplementedError
+
+    def signature(self, rel_path: str) -> FileSignature | None:
+        raise NotImplementedError
+
+    def fingerprint(self) -> str:
+        """Cheap change detector for the whole tree, used to key shared scans."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class LocalFileSystem(FileSystem):
+    def __init__(self, root: str):
+        self.root = root
+        self.cache_root = os.path.realpath(root)
+
+    def walk(self) -> Iterator[WalkEntry]:
+        for dirpath, dirs, files in os.walk(self.root):
+            rel = os.path.relpath(dirpath, self.root)
+            yield ("" if rel == "." else rel), dirs, files
+
+    def size(self, rel_path: str) -> int:
+        return os.path.getsize(os.path.join(self.root, rel_path))
+
+    def read(self, rel_path: str) -> bytes:
+        with open(os.path.join(self.root, rel_path), "rb") as f:
+            return f.read()
+
+    def signature(self, rel_path: str) -> FileSignature | None:
+        return file_signature(os.path.join(self.root, rel_path))
+
+    def fingerprint(self) -> str:
+        """The root and its direct entries' stat data.
+
+        Catches files added, removed or touched at the top level and anything
+        that bumps a first-level directory's mtime. Deeper edits are covered
+        by the coordinator's result TTL and the per-file scan cache.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        st = os.stat(self.root)
+        digest.update(f"{st.st_ino}:{st.st_mtime_ns}".encode())
+        with os.scandir(self.root) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                try:
+                    entry_st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                digest.update(
+                    f"{entry.name}:{entry_st.st_size}:{entry_st.st_mtime_ns}\0".encode()
+                )
+        return digest.hexdigest()
+
+
+class ZipFileSystem(FileSystem):
+    """Reads a zip archive in place: listing and sizes come from the central
+    directory, contents from member streams, with nothing extracted to disk.
+
+    The archive must pass the same central-directory checks as extraction
+    (``ingest.check_archive``: unsafe names, declared size and compression
+    ratio); zipfile never reads a member past its declared size, so those
+    bound what a scan can inflate. Nested zips are scanned as plain files.
+
+    If every member sits under one top-level folder, that folder becomes
+    the scan root, as it would after a typical extraction. ``identity``
+    (e.g. the upload's content hash) keys the scan cache so re-uploads of
+    the same archive hit it; member signatures use size and CRC-32.
+
+    Unpickling (once per batch sent to a pool worker) reuses an instance
+    already opened in that process instead of re-reading the central
+    directory; see ``_shared_archive``.
+    """
+
+    def __init__(self, archive_path: str, identity: str | None = None):
+        import zipfile
+
+        from app.scanner.ingest import check_archive
+
+        self.archive_path = archive_path
+        self.cache_root = identity or "zip:" + os.path.realpath(archive_path)
+        self._shared = False
+        self._lock = threading.Lock()
+        self._zip = zipfile.ZipFile(archive_path)
+        try:
+            infos = check_archive(self._zip, os.path.basename(archive_path))
+        except Exception:
+            self._zip.close()
+            raise
+        prefix = ""
+        tops = {info.filename.split("/", 1)[0] for info in infos}
+        if len(tops) == 1 and all("/" in info.filename for info in infos):
+            prefix = tops.pop() + "/"
+        self.root = os.path.abspath(archive_path)
+        if prefix:
+            self.root = os.path.join(self.root, prefix[:-1])
+        self.members: "dict[str, zipfile.ZipInfo]" = {}
+        for info in infos:
+            name = info.filename[len(prefix) :]
+            parts = [p for p in name.split("/") if p not in ("", ".")]
+            if parts:
+                self.members[os.path.join(*parts)] = info
+
+    def __getstate__(self):
+        return {"archive_path": self.archive_path, "cache_root": self.cache_root}
+
+    def __setstate__(self, state):
+        shared = _shared_archive(state["archive_path"], state["cache_root"])
+        self.__dict__.update(shared.__dict__)
+        self._shared = True
+
+    def walk(self) -> Iterator[WalkEntry]:
+        tree: dict[str, tuple[list[str], list[str]]] = {"": ([], [])}
+        for rel_path in self.members:
+            directory, name = os.path.split(rel_path)
+            missing = []
+            parent = directory
+            while parent not in tree:
+                missing.append(parent)
+                parent = os.path.dirname(parent)
+            for folder in reversed(missing):
+                tree[folder] = ([], [])
+                tree[os.path.dirname(folder)][0].append(os.path.basename(folder))
+            tree[directory][1].append(name)
+        stack = [""]
+        while stack:
+            directory = stack.pop()
+            dirs, files = tree[directory]
+            dirs.sort()
+            files.sort()
+            yield directory, dirs, files
+            for name in reversed(dirs):
+                stack.append(os.path.join(directory, name) if directory else name)
+
+    def size(self, rel_path: str) -> int:
+        info = self.members.get(rel_path)
+        if info is None:
+            raise FileNotFoundError(rel_path)
+        return info.file_size
+
+    def read(self, rel_path: str) -> bytes:
+        info = self.members.get(rel_path)
+        if info is None:
+            raise FileNotFoundError(rel_path)
+        with self._lock:
+            member = self._zip.open(info)
+        with member:
+            return member.read()
+
+    def signature(self, rel_path: str) -> FileSignature | None:
+        info = self.members.get(rel_path)
+        if info is None:
+            return None
+        return FileSignature(info.file_size, info.CRC, 0)
+
+    def fingerprint(self) -> str:
+        st = os.stat(self.archive_path)
+        return f"{self.cache_root}:{st.st_size}:{st.st_mtime_ns}:{st.st_ino}"
+
+    def close(self) -> None:
+        # Unpickled copies share their process's open archive; it stays open.
+        if not self._shared:
+            self._zip.close()
+
+
+_shared_archives: "OrderedDict[tuple, ZipFileSystem]" = OrderedDict()
+_shared_lock = threading.Lock()
+
+
+def _shared_archive(archive_path: str, cache_root: str) -> ZipFileSystem:
+    """This process's open ZipFileSystem for an archive, keyed by its stat data."""
+    st = os.stat(archive_path)
+    key = (os.path.realpath(archive_path), st.st_size, st.st_mtime_ns, cache_root)
+    with _shared_lock:
+        fs = _shared_archives.get(key)
+        if fs is not None:
+            _shared_archives.move_to_end(key)
+            return fs
+    fs = ZipFileSystem(archive_path, cache_root)
+    with _shared_lock:
+        fs = _shared_archives.setdefault(key, fs)
+        _shared_archives.move_to_end(key)
+        # Evicted archives close once no unpickled copy still refers to them.
+        while len(_shared_archives) > MAX_SHARED_ARCHIVES:
+            _shared_archives.popitem(last=False)
+    return fs
+
+
+def as_filesystem(source: "str | FileSystem") -> FileSystem:
+    """Wrap a path: zip archives are read in place, anything else from disk."""
+    if isinstance(source, FileSystem):
+        return source
+    if not os.path.isfile(source):
+        return LocalFileSystem(source)
+    import zipfile
+
+    if zipfile.is_zipfile(source):
+        return ZipFileSystem(source)
+    return LocalFileSystem(source)
@@ -0,0 +1,76 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, TypeVar
+
+DEFAULT_MAX_VIEWS = int(os.environ.get("INDU_MAX_CACHED_VIEWS", "512"))
+
+T = TypeVar("T")
+
+
+class ViewCache:
+    """Memoizes views derived from snapshots, keyed by (snapshot ID, view, params).
+
+    Snapshots never change after they are stored, so a derived view only
+    depends on its key. Cached values are shared between sessions and must
+    be treated as read-only. The least recently used entries are evicted
+    beyond ``max_entries``, or once the entries' ``weigh`` sizes add up to
+    more than ``max_weight``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_VIEWS,
+        max_weight: int = 0,
+        weigh: Callable[[Any], int] | None = None,
+    ):
+        self.max_entries = max_entries
+        self.max_weight = max_weight
+        self.weigh = weigh
+        self.weight = 0
+        self._views: OrderedDict[tuple, object] = OrderedDict()
+        self._weights: dict[tuple, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, snapshot_id: str, view: str, params: Hashable, build: Callable[[], T]
+    ) -> T:
+        key = (snapshot_id, view, params)
+        with self._lock:
+            if key in self._views:
+                self._views.move_to_end(key)
+                self.hits += 1
+                return self._views[key]
+            self.misses += 1
+        value = build()
+        weight = self.weigh(value) if self.weigh is not None else 0
+        with self._lock:
+            self._remove(key)
+            self._views[key] = value
+            self._weights[key] = weight
+            self.weight += weight
+            while len(self._views) > self.max_entries or (
+                self.max_weight and self.weight > self.max_weight and len(self._views) > 1
+            ):
+                self._remove(next(iter(self._views)))
+        return value
+
+    def _remove(self, key: tuple) -> None:
+        if key in self._views:
+            del self._views[key]
+            self.weight -= self._weights.pop(key)
+
+    def invalidate(self, snapshot_id: str | None = None) -> None:
+        with self._lock:
+            if snapshot_id is None:
+                self._views.clear()
+                self._weights.clear()
+                self.weight = 0
+                return
+            for key in [k for k in self._views if k[0] == snapshot_id]:
+                self._remove(key)
+
+
+VIEW_CACHE = ViewCache()
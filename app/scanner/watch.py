@@ -0,0 +1,209 @@
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import time
+
+from app.scanner.engine import IGNORE_DIRS, IGNORE_FILES
+
+DEFAULT_DEBOUNCE_SECONDS = 0.2
+DEFAULT_MAX_DELAY_SECONDS = 2.0
+DEFAULT_POLL_SECONDS = 1.0
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_ONLYDIR
+)
+_EVENT = struct.Struct("iIII")
+
+
+def is_ignored(rel_path: str) -> bool:
+    parts = rel_path.split(os.sep)
+    return parts[-1] in IGNORE_FILES or any(part in IGNORE_DIRS for part in parts)
+
+
+class Watcher:
+    """Reports scan-root-relative paths (files or directories) that changed.
+
+    ``wait`` coalesces bursts: after the first event it keeps collecting
+    until nothing new arrives for ``debounce`` seconds, or ``max_delay``
+    seconds have passed, so a save that touches several files (or one file
+    several times) comes back as one batch.
+    """
+
+    root: str
+
+    def poll(self, timeout: float) -> set[str] | None:
+        """Changes seen within ``timeout`` seconds; None if events were lost."""
+        raise NotImplementedError
+
+    def wait(
+        self,
+        timeout: float,
+        debounce: float = DEFAULT_DEBOUNCE_SECONDS,
+        max_delay: float = DEFAULT_MAX_DELAY_SECONDS,
+    ) -> set[str] | None:
+        """A coalesced batch of changes (empty on timeout); None means rescan."""
+        changes = self.poll(timeout)
+        if not changes:
+            return changes
+        deadline = time.monotonic() + max_delay
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return changes
+            more = self.poll(min(debounce, remaining))
+            if more is None:
+                return None
+            if not more:
+                return changes
+            changes |= more
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher(Watcher):
+    """Linux inotify through libc, one watch per (non-ignored) directory.
+
+    Raises OSError if inotify is unavailable or the watch limit is reached.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        self._directories: dict[int, str] = {}
+        try:
+            self._watch_tree("")
+        except OSError:
+            os.close(self.fd)
+            raise
+
+    def _watch_tree(self, rel_dir: str) -> None:
+        for dirpath, dirs, _ in os.walk(os.path.join(self.root, rel_dir)):
+            dirs[:] = [d for d in dirs if d not in IGNORE_DIRS]
+            wd = self._add_watch(self.fd, os.fsencode(dirpath), WATCH_MASK)
+            if wd < 0:
+                error = ctypes.get_errno()
+                if error == 2:  # ENOENT: removed while we walked
+                    continue
+                raise OSError(error, os.strerror(error), dirpath)
+            rel = os.path.relpath(dirpath, self.root)
+            self._directories[wd] = "" if rel == "." else rel
+
+    def poll(self, timeout: float) -> set[str] | None:
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+        changes: set[str] = set()
+        lost = False
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT.unpack_from(data, offset)
+                offset += _EVENT.size
+                name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+                offset += length
+                if mask & IN_Q_OVERFLOW:
+                    lost = True
+                    continue
+                directory = self._directories.get(wd)
+                if mask & IN_IGNORED:
+                    self._directories.pop(wd, None)
+                    continue
+                if directory is None or not name:
+                    continue
+                rel_path = os.path.join(directory, name) if directory else name
+                if is_ignored(rel_path):
+                    continue
+                changes.add(rel_path)
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                    try:
+                        self._watch_tree(rel_path)
+                    except OSError as e:
+                        logging.exception(f"Could not watch {rel_path}: {e}")
+                        lost = True
+        return None if lost else changes
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingWatcher(Watcher):
+    """Fallback that re-stats the tree every ``interval`` seconds and diffs it."""
+
+    def __init__(self, root: str, interval: float = DEFAULT_POLL_SECONDS):
+        self.root = root
+        self.interval = interval
+        self._stats = self._stat_tree()
+        self._next_poll = time.monotonic() + interval
+
+    def _stat_tree(self) -> dict[str, tuple[int, int]]:
+        stats = {}
+        for dirpath, dirs, files in os.walk(self.root):
+            dirs[:] = [d for d in dirs if d not in IGNORE_DIRS]
+            rel = os.path.relpath(dirpath, self.root)
+            for name in files:
+                if name in IGNORE_FILES:
+                    continue
+                try:
+                    st = os.stat(os.path.join(dirpath, name))
+                except OSError:
+                    continue
+                stats[name if rel == "." else os.path.join(rel, name)] = (
+                    st.st_size,
+                    st.st_mtime_ns,
+                )
+        return stats
+
+    def poll(self, timeout: float) -> set[str] | None:
+        delay = self._next_poll - time.monotonic()
+        if delay > timeout:
+            time.sleep(timeout)
+            return set()
+        time.sleep(max(delay, 0))
+        self._next_poll = time.monotonic() + self.interval
+        stats = self._stat_tree()
+        previous = self._stats
+        self._stats = stats
+        changes = {path for path, stat in stats.items() if previous.get(path) != stat}
+        changes.update(path for path in previous if path not in stats)
+        return changes
+
+
+def open_watcher(root: str) -> Watcher:
+    """inotify where available, otherwise polling."""
+    try:
+        return InotifyWatcher(root)
+    except (OSError, AttributeError) as e:
+        logging.warning(f"inotify unavailable for {root} ({e}); polling instead")
+        return PollingWatcher(root)
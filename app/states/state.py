@@ -2,71 +2,50 @@ import reflex as rx
 import os
 import reflex as rx
 import os
-import time
+import asyncio
+import threading
 import logging
-import re
-import ast
-from typing import TypedDict, Any, Union
-import plotly.graph_objects as go
-import zipfile
-import tempfile
-import shutil
-
-
-class FileMetrics(TypedDict):
-    path: str
-    size: int
-    lines_of_code: int
-    extension: str
-
-
-class FolderMetrics(TypedDict):
-    path: str
-    total_files: int
-    total_size: int
-    file_types: dict[str, int]
-
-
-class ComponentNode(TypedDict):
-    id: str
-    type: str
-
-
-class DependencyEdge(TypedDict):
-    source: str
-    target: str
-
-
-class Snapshot(TypedDict):
-    timestamp: float
-    total_files: int
-    total_size: int
-    total_lines_of_code: int
-    files: list[FileMetrics]
-    folders: dict[str, FolderMetrics]
-    file_type_distribution: dict[str, int]
-    dependency_graph: dict[str, list[str]]
-    architecture_violations: list[str]
-    unused_components: list[str]
-
-
-class FileNode(TypedDict):
-    name: str
-    lines_of_code: int
-
-
-class FolderNode(TypedDict):
-    name: str
-    folders: list["FolderNode"]
-    files: list[FileNode]
-    file_count: int
+import math
+from typing import Union
+from app.scanner.aggregate import AggregateView, aggregate_view_for
+from app.scanner.control import DEFAULT_SCAN_BUDGET, ScanBudget, ScanControl
+from app.scanner.coordinator import SCAN_COORDINATOR
+from app.scanner.filetree import find_folder, folder_view, tree_for
+from app.scanner.layout import GraphLayout, layout_for
+from app.scanner import scheduler as project_scheduler
+from app.scanner.scheduler import PROJECT_HISTORY, ProjectStatus, run_scan_blocking
+from app.scanner.store import SNAPSHOT_STORE
+from app.scanner.viewcache import VIEW_CACHE
+from app.scanner.progress import ScanProgress
+from app.scanner.models import FolderNode, Snapshot
+
+_scan_controls: dict[str, ScanControl] = {}
+_watch_stops: dict[str, threading.Event] = {}
+MAX_SCAN_HISTORY = 50
+# How long watch mode outlives its browser tab; a reload reconnects sooner.
+WATCH_DISCONNECT_GRACE_SECONDS = 30.0
+MAX_LABELLED_NODES = 200
+GRAPH_NODE_COLORS = {"folder": "#fb923c", "file": "#60a5fa", "external": "#d1d5db"}
 
 
 class InduState(rx.State):
     scan_path: str = "."
+    scan_workers: int = 0
+    use_scan_cache: bool = True
+    scan_max_seconds: float = DEFAULT_SCAN_BUDGET["max_seconds"]
+    scan_max_files: int = DEFAULT_SCAN_BUDGET["max_files"]
+    scan_max_bytes: int = DEFAULT_SCAN_BUDGET["max_bytes"]
     is_scanning: bool = False
-    latest_snapshot: Snapshot | None = None
-    scan_history: list[Snapshot] = []
+    watch_mode: bool = False
+    scan_progress: ScanProgress = {
+        "phase": "",
+        "files_total": 0,
+        "files_processed": 0,
+        "bytes_read": 0,
+        "lines_of_code": 0,
+    }
+    _latest_snapshot_id: str = ""
+    _snapshot_history: list[str] = []
     nav_items: list[dict[str, str]] = [
         {"label": "Upload", "icon": "upload", "href": "#"},
         {"label": "Dashboard", "icon": "layout-dashboard", "href": "/"},
@@ -75,13 +54,9 @@ class InduState(rx.State):
         {"label": "Unused", "icon": "trash-2", "href": "#"},
     ]
     active_page: str = "Upload"
-    file_tree: FolderNode = {
-        "name": "root",
-        "folders": [],
-        "files": [],
-        "file_count": 0,
-    }
     current_path: list[str] = []
+    graph_path: list[str] = []
+    show_all_files: bool = False
     search_query: str = ""
     filter_extension: str = ""
     uploaded_files: list[str] = []
@@ -92,6 +67,19 @@ class InduState(rx.State):
     is_uploading: bool = False
     uploaded_project_name: str | None = None
     uploaded_project_path: str | None = None
+    _upload_digests: list[str] = []
+    _upload_workspace: str = ""
+    _upload_identity: str = ""
+    extract_uploads: bool = False
+    projects: list[ProjectStatus] = []
+    active_project: str = ""
+    upload_progress: ScanProgress = {
+        "phase": "",
+        "files_total": 0,
+        "files_processed": 0,
+        "bytes_read": 0,
+        "lines_of_code": 0,
+    }
 
     @rx.event
     def set_active_page(self, page: str):
@@ -123,101 +111,149 @@ class InduState(rx.State):
 
     @rx.var
     def current_view(self) -> FolderNode:
-        if not self.file_tree:
-            return {"name": "root", "folders": [], "files": [], "file_count": 0}
-        view = self.file_tree
-        for part in self.current_path:
-            found = False
-            for folder in view["folders"]:
-                if folder["name"] == part:
-                    view = folder
-                    found = True
-                    break
-            if not found:
-                return {"name": "root", "folders": [], "files": [], "file_count": 0}
-        return view
+        snapshot = SNAPSHOT_STORE.get(self._latest_snapshot_id)
+        if not snapshot:
+            return folder_view(None)
+        path = list(self.current_path)
+        return VIEW_CACHE.get(
+            snapshot["snapshot_id"],
+            "current_view",
+            tuple(path),
+            lambda: folder_view(find_folder(tree_for(snapshot), path)),
+        )
 
     @rx.var
     def current_path_with_indices(self) -> list[tuple[str, int]]:
         return [(part, i) for i, part in enumerate(self.current_path)]
 
+    @rx.var
+    def has_snapshot(self) -> bool:
+        return SNAPSHOT_STORE.get(self._latest_snapshot_id) is not None
+
+    @rx.var
+    def scan_history_count(self) -> int:
+        return len(self._snapshot_history)
+
     @rx.var
     def total_files(self) -> int:
-        return self.latest_snapshot["total_files"] if self.latest_snapshot else 0
+        snapshot = SNAPSHOT_STORE.get(self._latest_snapshot_id)
+        return snapshot["total_files"] if snapshot else 0
 
     @rx.var
     def total_size_mb(self) -> str:
-        if not self.latest_snapshot:
+        snapshot = SNAPSHOT_STORE.get(self._latest_snapshot_id)
+        if not snapshot:
             return "0.00"
-        return f"{self.latest_snapshot['total_size'] / (1024 * 1024):.2f}"
+        return f"{snapshot['total_size'] / (1024 * 1024):.2f}"
 
     @rx.var
     def total_lines_of_code(self) -> str:
-        if not self.latest_snapshot:
+        snapshot = SNAPSHOT_STORE.get(self._latest_snapshot_id)
+        if not snapshot:
             return "0"
-        return f"{self.latest_snapshot['total_lines_of_code']:,}"
+        return f"{snapshot['total_lines_of_code']:,}"
+
+    @rx.var
+    def partial_scan_reason(self) -> str:
+        snapshot = SNAPSHOT_STORE.get(self._latest_snapshot_id)
+        if not snapshot or not snapshot.get("partial"):
+            return ""
+        return snapshot.get("stop_reason", "")
+
+    @rx.var
+    def scan_progress_label(self) -> str:
+        progress = self.scan_progress
+        if not progress["phase"]:
+            return ""
+        return (
+            f"{progress['phase'].capitalize()}: "
+            f"{progress['files_processed']:,} / {progress['files_total']:,} files, "
+            f"{progress['bytes_read'] / (1024 * 1024):.1f} MB read"
+        )
+
+    @rx.var
+    def upload_progress_label(self) -> str:
+        progress = self.upload_progress
+        if not progress["phase"]:
+            return ""
+        return (
+            f"Extracting: {progress['files_processed']:,} / "
+            f"{progress['files_total']:,} files, "
+            f"{progress['bytes_read'] / (1024 * 1024):.1f} MB written"
+        )
+
+    @rx.var
+    def scan_progress_percent(self) -> int:
+        progress = self.scan_progress
+        if not progress["files_total"]:
+            return 0
+        return min(100, progress["files_processed"] * 100 // progress["files_total"])
 
     @rx.var
     def file_type_chart_data(self) -> list[dict[str, Union[str, int]]]:
-        if not self.latest_snapshot:
+        snapshot = SNAPSHOT_STORE.get(self._latest_snapshot_id)
+        if not snapshot:
             return []
-        dist = self.latest_snapshot.get("file_type_distribution", {})
-        sorted_dist = sorted(dist.items(), key=lambda item: item[1], reverse=True)[:10]
-        return [
-            {"name": ext if ext else "Other", "count": count}
-            for ext, count in sorted_dist
-        ]
+        return VIEW_CACHE.get(
+            snapshot["snapshot_id"],
+            "file_type_chart_data",
+            (),
+            lambda: _file_type_chart_data(snapshot),
+        )
 
     @rx.var
-    def dependency_graph_data(
-        self,
-    ) -> dict[str, list[Union[ComponentNode, DependencyEdge]]]:
-        if not self.latest_snapshot or "dependency_graph" not in self.latest_snapshot:
-            return {"nodes": [], "edges": []}
-        graph = self.latest_snapshot["dependency_graph"]
-        nodes = {node for node in graph.keys()}
-        edges_set = set()
-        for source, targets in graph.items():
-            nodes.add(source)
-            for target in targets:
-                nodes.add(target)
-                edges_set.add((source, target))
-        node_list = [
-            ComponentNode(id=node, type="file") for node in sorted(list(nodes))
-        ]
-        edge_list = [
-            DependencyEdge(source=s, target=t) for s, t in sorted(list(edges_set))
-        ]
-        return {"nodes": node_list, "edges": edge_list}
+    def architecture_violations(self) -> list[str]:
+        snapshot = SNAPSHOT_STORE.get(self._latest_snapshot_id)
+        if not snapshot:
+            return []
+        return snapshot.get("architecture_violations", [])
 
     @rx.var
-    def architecture_violations(self) -> list[str]:
-        if not self.latest_snapshot:
+    def import_cycles(self) -> list[str]:
+        snapshot = SNAPSHOT_STORE.get(self._latest_snapshot_id)
+        if not snapshot:
             return []
-        return self.latest_snapshot.get("architecture_violations", [])
+        return VIEW_CACHE.get(
+            snapshot["snapshot_id"],
+            "import_cycles",
+            (),
+            lambda: [" -> ".join(cycle) for cycle in snapshot.get("import_cycles", [])],
+        )
 
     @rx.var
     def unused_components(self) -> list[str]:
-        if not self.latest_snapshot:
+        snapshot = SNAPSHOT_STORE.get(self._latest_snapshot_id)
+        if not snapshot:
             return []
-        return self.latest_snapshot.get("unused_components", [])
+        return snapshot.get("unused_components", [])
 
     @rx.var
     def unique_extensions(self) -> list[str]:
-        if not self.latest_snapshot:
+        snapshot = SNAPSHOT_STORE.get(self._latest_snapshot_id)
+        if not snapshot:
             return []
-        unused = self.latest_snapshot.get("unused_components", [])
-        extensions = {os.path.splitext(f)[1] for f in unused if os.path.splitext(f)[1]}
-        return sorted(list(extensions))
+        return VIEW_CACHE.get(
+            snapshot["snapshot_id"],
+            "unique_extensions",
+            (),
+            lambda: _unique_extensions(snapshot.get("unused_components", [])),
+        )
 
     @rx.var
     def filtered_unused_components(self) -> list[str]:
-        unused = self.unused_components
-        if self.search_query:
-            unused = [u for u in unused if self.search_query.lower() in u.lower()]
-        if self.filter_extension:
-            unused = [u for u in unused if u.endswith(self.filter_extension)]
-        return unused
+        snapshot = SNAPSHOT_STORE.get(self._latest_snapshot_id)
+        if not snapshot:
+            return []
+        unused = snapshot.get("unused_components", [])
+        # Only the lowercased paths are cached: one entry per snapshot rather
+        # than one per search keystroke.
+        lowered = VIEW_CACHE.get(
+            snapshot["snapshot_id"],
+            "unused_components_lower",
+            (),
+            lambda: [u.lower() for u in unused],
+        )
+        return _filter_unused(unused, lowered, self.search_query, self.filter_extension)
 
     @rx.var
     def scan_target_display(self) -> str:
@@ -226,57 +262,75 @@ class InduState(rx.State):
         return "Local Project"
 
     @rx.var
-    def dependency_figure(self) -> go.Figure:
-        if not self.latest_snapshot or "dependency_graph" not in self.latest_snapshot:
-            return go.Figure()
-        graph = self.latest_snapshot["dependency_graph"]
-        all_nodes = sorted(
-            list(set(graph.keys()) | {dep for deps in graph.values() for dep in deps})
-        )
-        node_map = {name: i for i, name in enumerate(all_nodes)}
-        edge_x = []
-        edge_y = []
-        for source, deps in graph.items():
-            for target in deps:
-                if source in node_map and target in node_map:
-                    x0, y0 = (node_map[source] % 10, node_map[source] // 10)
-                    x1, y1 = (node_map[target] % 10, node_map[target] // 10)
-                    edge_x.extend([x0, x1, None])
-                    edge_y.extend([y0, y1, None])
-        node_x = [node_map[name] % 10 for name in all_nodes]
-        node_y = [node_map[name] // 10 for name in all_nodes]
-        edge_trace = go.Scatter(
-            x=edge_x,
-            y=edge_y,
-            line=dict(width=0.5, color="#888"),
-            hoverinfo="none",
-            mode="lines",
-        )
-        node_trace = go.Scatter(
-            x=node_x,
-            y=node_y,
-            mode="markers+text",
-            hoverinfo="text",
-            text=all_nodes,
-            textposition="bottom center",
-            marker=dict(showscale=False, color="#fb923c", size=10, line_width=2),
+    def graph_path_with_indices(self) -> list[tuple[str, int]]:
+        return [(part, i) for i, part in enumerate(self.graph_path)]
+
+    @rx.var
+    def graph_packages(self) -> list[str]:
+        snapshot = SNAPSHOT_STORE.get(self._latest_snapshot_id)
+        if not snapshot:
+            return []
+        path = list(self.graph_path)
+        return VIEW_CACHE.get(
+            snapshot["snapshot_id"],
+            "graph_packages",
+            tuple(path),
+            lambda: _graph_packages(aggregate_view_for(snapshot, path)),
         )
-        fig = go.Figure(
-            data=[edge_trace, node_trace],
-            layout=go.Layout(
-                showlegend=False,
-                hovermode="closest",
-                margin=dict(b=20, l=5, r=5, t=40),
-                xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-                yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-            ),
+
+    @rx.var
+    def dependency_figure(self) -> dict:
+        """Plotly figure JSON, built only while the Dependencies page is open.
+
+        Figures are plain dicts so this module never imports Plotly; the
+        page casts the var to a Figure for ``rx.plotly``.
+        """
+        snapshot = SNAPSHOT_STORE.get(self._latest_snapshot_id)
+        if (
+            self.active_page != "Dependencies"
+            or not snapshot
+            or "resolved_graph" not in snapshot
+        ):
+            return _empty_figure()
+        if self.show_all_files:
+            return VIEW_CACHE.get(
+                snapshot["snapshot_id"],
+                "dependency_figure",
+                ("files",),
+                lambda: _file_graph_figure(layout_for(snapshot)),
+            )
+        path = list(self.graph_path)
+        return VIEW_CACHE.get(
+            snapshot["snapshot_id"],
+            "dependency_figure",
+            ("folders", *path),
+            lambda: _aggregate_figure(aggregate_view_for(snapshot, path)),
         )
-        return fig
+
+    @rx.event
+    def drill_into_package(self, name: str):
+        self.graph_path.append(name)
+
+    @rx.event
+    def set_graph_path_to_index(self, index: int):
+        if index == -1:
+            self.graph_path = []
+        else:
+            self.graph_path = self.graph_path[: index + 1]
+
+    @rx.event
+    def set_show_all_files(self, value: bool):
+        self.show_all_files = value
 
     def _cleanup_temp_dir(self):
-        if self.uploaded_project_path and os.path.exists(self.uploaded_project_path):
+        import shutil
+
+        workspace = self._upload_workspace or self.uploaded_project_path
+        if workspace and os.path.exists(workspace):
             try:
-                shutil.rmtree(self.uploaded_project_path)
+                shutil.rmtree(workspace)
+                self._upload_workspace = ""
+                self._upload_identity = ""
                 self.uploaded_project_path = None
                 self.uploaded_project_name = None
             except Exception as e:
@@ -287,18 +341,80 @@ class InduState(rx.State):
         """Clean up any lingering temp directories when the app loads for a new session."""
         self._cleanup_temp_dir()
         self.active_page = "Upload"
+        self.refresh_projects()
+
+    @rx.event
+    def refresh_projects(self):
+        scheduler = project_scheduler.SCHEDULER
+        if scheduler is None:
+            self.projects = []
+            return
+        self.projects = sorted(
+            (ProjectStatus(**status) for status in scheduler.status.values()),
+            key=lambda status: (-status["priority"], status["name"]),
+        )
+
+    @rx.event
+    def select_project(self, name: str):
+        """Show a scheduled project's latest snapshot without rescanning it."""
+        self.refresh_projects()
+        snapshot = PROJECT_HISTORY.latest(name)
+        if snapshot is None:
+            return rx.toast.info(f"{name} has not been scanned yet.")
+        self.active_project = name
+        self.scan_path = next(
+            (status["path"] for status in self.projects if status["name"] == name),
+            self.scan_path,
+        )
+        self._latest_snapshot_id = snapshot["snapshot_id"]
+        self._snapshot_history = (self._snapshot_history + [self._latest_snapshot_id])[
+            -MAX_SCAN_HISTORY:
+        ]
+        self.current_path = []
+        self.graph_path = []
+        self.active_page = "Dashboard"
+
+    @rx.event
+    def queue_project_scan(self, name: str):
+        scheduler = project_scheduler.SCHEDULER
+        if scheduler is None:
+            return rx.toast.error("The project scheduler is not running.")
+        queued = scheduler.enqueue(name, force=True)
+        self.refresh_projects()
+        if queued:
+            return rx.toast.success(f"Queued a scan of {name}.")
+        if scheduler.backlog >= scheduler.max_queue:
+            return rx.toast.warning("The scan queue is full; try again shortly.")
+        return rx.toast.info(f"{name} is already queued or scanning.")
 
     @rx.event
     def clear_upload(self):
         self._cleanup_temp_dir()
         self.uploaded_files = []
-        self.latest_snapshot = None
+        self._latest_snapshot_id = ""
         self.active_page = "Upload"
         return rx.toast.info("Cleared uploaded project.")
 
     @rx.event
     async def handle_upload(self, files: list[rx.UploadFile]):
-        """Handle file uploads, extracting zip files if present."""
+        """Stream uploads to a temp workspace and prepare them for scanning.
+
+        A single archive with no nested zips is scanned in place. Several
+        archives, nested zips or archives mixed with loose files go through
+        the ingestion stage, which extracts them under size and ratio limits
+        and reports progress while it runs.
+        """
+        import shutil
+        import tempfile
+        import zipfile
+
+        from app.scanner.ingest import (
+            DEFAULT_MAX_UPLOAD_BYTES,
+            ingest_archives,
+            safe_join,
+            stream_upload,
+        )
+
         if not files:
             yield rx.toast.error("No files selected for upload.")
             return
@@ -308,36 +424,76 @@ class InduState(rx.State):
         try:
             self._cleanup_temp_dir()
             self.uploaded_files = []
-            zip_processed = False
+            self._upload_digests = []
             temp_dir = tempfile.mkdtemp()
-            self.uploaded_project_path = temp_dir
+            self._upload_workspace = temp_dir
+            uploads_dir = os.path.join(temp_dir, "uploads")
+            remaining = DEFAULT_MAX_UPLOAD_BYTES
+            stored_files = []
             for file in files:
-                upload_data = await file.read()
-                file_path = os.path.join(temp_dir, file.name)
-                with open(file_path, "wb") as f:
-                    f.write(upload_data)
+                stored = await stream_upload(file, uploads_dir, max_bytes=remaining)
+                remaining -= stored["size"]
+                stored_files.append(stored)
+                self._upload_digests.append(stored["digest"])
                 self.uploaded_files.append(file.name)
-                if file.name.endswith(".zip") and (not zip_processed):
-                    with zipfile.ZipFile(file_path, "r") as zip_ref:
-                        extract_path = os.path.join(
-                            temp_dir, os.path.splitext(file.name)[0]
-                        )
-                        os.makedirs(extract_path, exist_ok=True)
-                        zip_ref.extractall(extract_path)
-                    self.uploaded_project_path = extract_path
-                    self.uploaded_project_name = file.name
-                    self.uploaded_files = [f"{file.name} (project)"]
-                    zip_processed = True
-                    upload_successful = True
-                    yield rx.toast.success(f"Extracted project: {file.name}")
-                    break
-            if not zip_processed and files:
+            archives = [f for f in stored_files if f["name"].endswith(".zip")]
+            loose = [f for f in stored_files if not f["name"].endswith(".zip")]
+            if not archives:
+                self.uploaded_project_path = uploads_dir
                 self.uploaded_project_name = f"{len(files)} individual files"
-                upload_successful = True
-            if not self.uploaded_project_name:
-                yield rx.toast.info(
-                    "Please upload a .zip project archive or individual files."
+            elif (
+                len(archives) == 1
+                and not loose
+                and not self.extract_uploads
+                and not await asyncio.to_thread(_needs_ingestion, archives[0]["path"])
+            ):
+                self.uploaded_project_path = archives[0]["path"]
+                self.uploaded_project_name = archives[0]["name"]
+                self._upload_identity = archives[0]["digest"]
+                self.uploaded_files = [f"{archives[0]['name']} (project)"]
+                yield rx.toast.success(f"Loaded project: {archives[0]['name']}")
+            else:
+                project_dir = os.path.join(temp_dir, "project")
+                loop = asyncio.get_running_loop()
+                updates: asyncio.Queue[ScanProgress] = asyncio.Queue()
+                ingest_task = asyncio.ensure_future(
+                    asyncio.to_thread(
+                        ingest_archives,
+                        [f["path"] for f in archives],
+                        project_dir,
+                        progress=lambda progress: loop.call_soon_threadsafe(
+                            updates.put_nowait, progress
+                        ),
+                    )
                 )
+                while not ingest_task.done():
+                    next_update = asyncio.ensure_future(updates.get())
+                    await asyncio.wait(
+                        {ingest_task, next_update},
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    if not next_update.done():
+                        next_update.cancel()
+                        continue
+                    self.upload_progress = next_update.result()
+                    yield
+                roots = ingest_task.result()
+                for f in loose:
+                    shutil.move(f["path"], safe_join(project_dir, f["name"]))
+                if len(roots) == 1 and not loose:
+                    self.uploaded_project_path = roots[0]
+                else:
+                    self.uploaded_project_path = project_dir
+                self.uploaded_project_name = ", ".join(f["name"] for f in archives)
+                self.uploaded_files = [f"{f['name']} (project)" for f in archives] + [
+                    f["name"] for f in loose
+                ]
+                yield rx.toast.success(f"Extracted {len(archives)} archive(s)")
+            upload_successful = True
+        except ValueError as e:
+            logging.exception(f"Upload rejected: {e}")
+            yield rx.toast.error(str(e))
+            self._cleanup_temp_dir()
         except zipfile.BadZipFile:
             logging.exception("Bad zip file uploaded")
             yield rx.toast.error("Uploaded file is not a valid zip archive.")
@@ -348,6 +504,9 @@ class InduState(rx.State):
             self._cleanup_temp_dir()
         finally:
             self.is_uploading = False
+            self.upload_progress = ScanProgress(
+                phase="", files_total=0, files_processed=0, bytes_read=0, lines_of_code=0
+            )
             if upload_successful:
                 yield InduState.run_scan
             else:
@@ -355,200 +514,343 @@ class InduState(rx.State):
 
     @rx.event(background=True)
     async def run_scan(self):
+        """Scan the uploaded project (or scan_path) and publish a new snapshot.
+
+        The walk, file reads, parsing and tree building all run in a worker
+        thread (and, for large trees, the engine's process pool) that this
+        coroutine awaits. The event loop itself only takes the state lock for
+        short attribute updates, so other sessions stay responsive for the
+        whole scan. Sessions scanning the same tree share one scan through
+        SCAN_COORDINATOR.
+        """
         async with self:
+            if self.is_scanning:
+                yield rx.toast.info("A scan is already running.")
+                return
             self.is_scanning = True
-            if not self.latest_snapshot and (not self.uploaded_project_path):
+            self.scan_progress = {
+                "phase": "walk",
+                "files_total": 0,
+                "files_processed": 0,
+                "bytes_read": 0,
+                "lines_of_code": 0,
+            }
+            token = self.router.session.client_token
+            control = ScanControl()
+            _scan_controls[token] = control
+            budget = ScanBudget(
+                max_seconds=self.scan_max_seconds,
+                max_files=self.scan_max_files,
+                max_bytes=self.scan_max_bytes,
+            )
+            workers = self.scan_workers or None
+            use_cache = self.use_scan_cache
+            identity = self._upload_identity
+            if not self._latest_snapshot_id and (not self.uploaded_project_path):
                 self.active_page = "Dashboard"
                 yield rx.toast.info("Running initial local scan...")
             yield
-        scan_path = (
-            self.uploaded_project_path if self.uploaded_project_path else self.scan_path
-        )
-        if not os.path.exists(scan_path):
-            async with self:
-                self.is_scanning = False
-            yield rx.toast.error(f"Scan path does not exist: {scan_path}")
-            return
-        files_data: list[FileMetrics] = []
-        folders_data: dict[str, FolderMetrics] = {}
-        total_files = 0
-        total_size = 0
-        total_loc = 0
-        file_type_distribution: dict[str, int] = {}
-        ignore_dirs = {".git", "__pycache__", "node_modules", ".web", "assets"}
-        ignore_files = {".DS_Store"}
-        base_path_for_relpath = scan_path
-        for root, dirs, files in os.walk(scan_path):
-            dirs[:] = [d for d in dirs if d not in ignore_dirs]
-            for file in files:
-                if file in ignore_files:
-                    continue
-                file_path = os.path.join(root, file)
-                try:
-                    size = os.path.getsize(file_path)
-                    loc = 0
-                    try:
-                        with open(
-                            file_path, "r", encoding="utf-8", errors="ignore"
-                        ) as f:
-                            loc = sum((1 for _ in f))
-                    except (IOError, UnicodeDecodeError) as e:
-                        logging.exception(
-                            f"Error reading file for LOC: {file_path} - {e}"
-                        )
-                        loc = 0
-                    _, ext = os.path.splitext(file)
-                    ext = ext if ext else "Other"
-                    rel_file_path = os.path.relpath(file_path, base_path_for_relpath)
-                    file_metric = FileMetrics(
-                        path=rel_file_path, size=size, lines_of_code=loc, extension=ext
-                    )
-                    files_data.append(file_metric)
-                    total_files += 1
-                    total_size += size
-                    total_loc += loc
-                    file_type_distribution[ext] = file_type_distribution.get(ext, 0) + 1
-                except FileNotFoundError as e:
-                    logging.exception(f"File not found during scan: {file_path} - {e}")
-                    continue
-        dependency_graph = self._build_dependency_graph(
-            files_data, base_path_for_relpath
-        )
-        architecture_violations = self._validate_architecture(dependency_graph)
-        unused_components = self._find_unused_components(
-            files_data, dependency_graph, base_path_for_relpath
-        )
-        snapshot = Snapshot(
-            timestamp=time.time(),
-            total_files=total_files,
-            total_size=total_size,
-            total_lines_of_code=total_loc,
-            files=files_data,
-            folders=folders_data,
-            file_type_distribution=file_type_distribution,
-            dependency_graph=dependency_graph,
-            architecture_violations=architecture_violations,
-            unused_components=unused_components,
-        )
-        tree = {"name": "root", "folders": [], "files": [], "file_count": 0}
-        for file_metric in files_data:
-            path_parts = file_metric["path"].split(os.sep)
-            current_level = tree
-            for i, part in enumerate(path_parts[:-1]):
-                folder = next(
-                    (f for f in current_level["folders"] if f["name"] == part), None
+        try:
+            scan_path = (
+                self.uploaded_project_path
+                if self.uploaded_project_path
+                else self.scan_path
+            )
+            exists = await asyncio.to_thread(os.path.exists, scan_path)
+            if not exists:
+                yield rx.toast.error(f"Scan path does not exist: {scan_path}")
+                return
+            loop = asyncio.get_running_loop()
+            updates: asyncio.Queue[ScanProgress] = asyncio.Queue()
+            scan_task = asyncio.ensure_future(
+                SCAN_COORDINATOR.run(
+                    scan_path,
+                    lambda progress, scan_control: run_scan_blocking(
+                        scan_path, workers, use_cache, progress, scan_control, identity
+                    ),
+                    budget=budget,
+                    progress=lambda progress: loop.call_soon_threadsafe(
+                        updates.put_nowait, progress
+                    ),
+                    control=control,
                 )
-                if not folder:
-                    folder = {"name": part, "folders": [], "files": [], "file_count": 0}
-                    current_level["folders"].append(folder)
-                current_level = folder
-            filename = path_parts[-1]
-            if current_level:
-                current_level["files"].append(
-                    {"name": filename, "lines_of_code": file_metric["lines_of_code"]}
+            )
+            while not scan_task.done():
+                next_update = asyncio.ensure_future(updates.get())
+                await asyncio.wait(
+                    {scan_task, next_update}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not next_update.done():
+                    next_update.cancel()
+                    continue
+                progress = next_update.result()
+                while not updates.empty():
+                    progress = updates.get_nowait()
+                async with self:
+                    self.scan_progress = progress
+            result = await scan_task
+            if result is None or control.cancelled:
+                yield rx.toast.info("Scan cancelled.")
+                return
+            snapshot = result
+            async with self:
+                self._latest_snapshot_id = SNAPSHOT_STORE.put(snapshot)
+                self._snapshot_history = (
+                    self._snapshot_history + [self._latest_snapshot_id]
+                )[-MAX_SCAN_HISTORY:]
+                self.current_path = []
+                self.graph_path = []
+                self.active_page = "Dashboard"
+            if snapshot["partial"]:
+                yield rx.toast.warning(
+                    f"Scan stopped early ({snapshot['stop_reason']}); "
+                    "showing partial results.",
+                    duration=5000,
                 )
-        self._count_files_recursively(tree)
+            else:
+                yield rx.toast.success("Scan complete!", duration=3000)
+        except Exception as e:
+            logging.exception(f"Scan failed: {e}")
+            yield rx.toast.error(f"Scan failed: {e}")
+        finally:
+            if _scan_controls.get(token) is control:
+                del _scan_controls[token]
+            async with self:
+                self.is_scanning = False
+
+    @rx.event
+    def cancel_scan(self):
+        control = _scan_controls.get(self.router.session.client_token)
+        if control is not None:
+            control.cancel()
+
+    @rx.event
+    def set_watch_mode(self, value: bool):
+        self.watch_mode = value
+        if value:
+            return InduState.watch_project
+        stop = _watch_stops.pop(self.router.session.client_token, None)
+        if stop is not None:
+            stop.set()
+
+    @rx.event(background=True)
+    async def watch_project(self):
+        """Keep the dashboard current with scan_path while watch mode is on.
+
+        One full scan seeds a LiveProject; after that each coalesced batch of
+        file changes is patched into a new snapshot in a worker thread and
+        published like a scan result. The snapshot it replaces is dropped
+        from the store, so a long edit session does not fill it with
+        near-identical snapshots. Lost events (or a watcher error) fall back
+        to a fresh full scan. Watching stops once the tab has been
+        disconnected for WATCH_DISCONNECT_GRACE_SECONDS.
+        """
+        from reflex.utils.prerequisites import get_and_validate_app
+
+        from app.scanner.live import LiveProject
+        from app.scanner.watch import open_watcher
+
         async with self:
-            self.latest_snapshot = snapshot
-            self.scan_history.append(snapshot)
-            self.file_tree = tree
-            self.current_path = []
-            self.is_scanning = False
-            self.active_page = "Dashboard"
-        yield rx.toast.success("Scan complete!", duration=3000)
-
-    def _count_files_recursively(self, folder: FolderNode):
-        file_count = len(folder["files"])
-        for subfolder in folder["folders"]:
-            file_count += self._count_files_recursively(subfolder)
-        folder["file_count"] = file_count
-        return file_count
-
-    def _parse_python_imports(
-        self, content: str, file_path: str, base_path: str
-    ) -> list[str]:
-        imports = set()
+            token = self.router.session.client_token
+            if token in _watch_stops:
+                return
+            if self.uploaded_project_path:
+                self.watch_mode = False
+                yield rx.toast.error("Watch mode needs a local scan path, not an upload.")
+                return
+            stop = threading.Event()
+            _watch_stops[token] = stop
+            scan_path = self.scan_path
+            workers = self.scan_workers or None
+            use_cache = self.use_scan_cache
+        watcher = None
+        previous_id = ""
+        namespace = get_and_validate_app().app.event_namespace
+        loop = asyncio.get_running_loop()
+        disconnected_since = 0.0
         try:
-            tree = ast.parse(content)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        imports.add(alias.name)
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module:
-                        module_path_parts = node.module.split(".")
-                        if node.level > 0:
-                            source_dir = os.path.dirname(file_path)
-                            rel_path_base = source_dir
-                            for _ in range(node.level - 1):
-                                rel_path_base = os.path.dirname(rel_path_base)
-                            abs_path = os.path.abspath(
-                                os.path.join(rel_path_base, *module_path_parts)
-                            )
-                            rel_to_scan_root = os.path.relpath(abs_path, base_path)
-                            imports.add(
-                                os.path.normpath(rel_to_scan_root).replace(os.sep, ".")
-                            )
-                        else:
-                            imports.add(node.module)
-        except SyntaxError as e:
-            logging.exception(f"Could not parse Python file {file_path}: {e}")
-        return list(imports)
-
-    def _extract_file_dependencies(
-        self, file_metric: FileMetrics, base_path: str
-    ) -> list[str]:
-        full_path = os.path.join(base_path, file_metric["path"])
-        try:
-            with open(full_path, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-        except (IOError, UnicodeDecodeError) as e:
-            logging.exception(f"Could not read file {full_path}: {e}")
-            return []
-        if file_metric["extension"] == ".py":
-            return self._parse_python_imports(content, full_path, base_path)
-        return []
-
-    def _build_dependency_graph(
-        self, files_data: list[FileMetrics], base_path: str
-    ) -> dict[str, list[str]]:
-        graph = {}
-        for file_metric in files_data:
-            if file_metric["extension"] == ".py":
-                dependencies = self._extract_file_dependencies(file_metric, base_path)
-                graph[file_metric["path"]] = dependencies
-        return graph
-
-    def _validate_architecture(self, graph: dict[str, list[str]]) -> list[str]:
-        violations = []
-        for file, deps in graph.items():
-            if "components" in file:
-                for dep in deps:
-                    if "states" in dep:
-                        violations.append(
-                            f"Violation: Component '{file}' imports state '{dep}'"
-                        )
-        return violations
-
-    def _find_unused_components(
-        self,
-        files_data: list[FileMetrics],
-        dependency_graph: dict[str, list[str]],
-        base_path: str,
-    ) -> list[str]:
-        all_scanned_py_files = {
-            f["path"] for f in files_data if f["extension"] == ".py"
+            if not await asyncio.to_thread(os.path.isdir, scan_path):
+                yield rx.toast.error(f"Scan path is not a directory: {scan_path}")
+                return
+            live = LiveProject(scan_path)
+            snapshot = None
+            while not stop.is_set():
+                if namespace is not None and token not in namespace.token_to_sid:
+                    disconnected_since = disconnected_since or loop.time()
+                    if loop.time() - disconnected_since > WATCH_DISCONNECT_GRACE_SECONDS:
+                        logging.info(f"Stopped watching {scan_path}: tab disconnected")
+                        break
+                else:
+                    disconnected_since = 0.0
+                if snapshot is None:
+                    if watcher is not None:
+                        watcher.close()
+                    watcher = await asyncio.to_thread(open_watcher, scan_path)
+                    snapshot = await asyncio.to_thread(live.start_cached, workers, use_cache)
+                else:
+                    changes = await asyncio.to_thread(watcher.wait, 1.0)
+                    if changes is None:
+                        snapshot = None
+                        continue
+                    if not changes:
+                        continue
+                    patched = await asyncio.to_thread(live.apply, changes)
+                    if patched is None:
+                        continue
+                    snapshot = patched
+                if stop.is_set():
+                    break
+                async with self:
+                    self._latest_snapshot_id = SNAPSHOT_STORE.put(snapshot)
+                    history = self._snapshot_history
+                    if previous_id and history and history[-1] == previous_id:
+                        history = history[:-1]
+                    self._snapshot_history = (history + [self._latest_snapshot_id])[
+                        -MAX_SCAN_HISTORY:
+                    ]
+                if previous_id:
+                    SNAPSHOT_STORE.discard(previous_id)
+                    VIEW_CACHE.invalidate(previous_id)
+                previous_id = snapshot["snapshot_id"]
+        except Exception as e:
+            logging.exception(f"Watching {scan_path} failed: {e}")
+            yield rx.toast.error(f"Watch mode stopped: {e}")
+        finally:
+            if watcher is not None:
+                watcher.close()
+            if _watch_stops.get(token) is stop:
+                del _watch_stops[token]
+                async with self:
+                    self.watch_mode = False
+
+
+def _file_type_chart_data(snapshot: Snapshot) -> list[dict[str, Union[str, int]]]:
+    dist = snapshot.get("file_type_distribution", {})
+    sorted_dist = sorted(dist.items(), key=lambda item: item[1], reverse=True)[:10]
+    return [
+        {"name": ext if ext else "Other", "count": count} for ext, count in sorted_dist
+    ]
+
+
+def _unique_extensions(unused: list[str]) -> list[str]:
+    extensions = {os.path.splitext(f)[1] for f in unused if os.path.splitext(f)[1]}
+    return sorted(list(extensions))
+
+
+def _filter_unused(
+    unused: list[str], lowered: list[str], query: str, extension: str
+) -> list[str]:
+    if query:
+        query = query.lower()
+        unused = [u for u, low in zip(unused, lowered) if query in low]
+    if extension:
+        unused = [u for u in unused if u.endswith(extension)]
+    return unused
+
+
+def _graph_packages(view: AggregateView) -> list[str]:
+    return [
+        node.rstrip(os.sep).rsplit(os.sep, 1)[-1]
+        for node, kind in zip(view.nodes, view.kinds)
+        if kind == "folder"
+    ]
+
+
+def _graph_figure_layout() -> dict:
+    return dict(
+        showlegend=False,
+        hovermode="closest",
+        margin=dict(b=20, l=5, r=5, t=40),
+        xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+        yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+    )
+
+
+def _empty_figure() -> dict:
+    return {"data": [], "layout": _graph_figure_layout()}
+
+
+def _file_graph_figure(layout: GraphLayout) -> dict:
+    show_labels = len(layout.nodes) <= MAX_LABELLED_NODES
+    edge_trace = {
+        "type": "scattergl",
+        "x": layout.edge_x,
+        "y": layout.edge_y,
+        "line": {"width": 0.5, "color": "#888"},
+        "hoverinfo": "none",
+        "mode": "lines",
+    }
+    node_trace = {
+        "type": "scattergl",
+        "x": layout.x.tolist(),
+        "y": layout.y.tolist(),
+        "mode": "markers+text" if show_labels else "markers",
+        "hoverinfo": "text",
+        "text": layout.nodes,
+        "textposition": "bottom center",
+        "marker": {
+            "showscale": False,
+            "color": "#fb923c",
+            "size": 10 if show_labels else 5,
+            "line": {"width": 2 if show_labels else 0},
+        },
+    }
+    return {"data": [edge_trace, node_trace], "layout": _graph_figure_layout()}
+
+
+def _aggregate_figure(view: AggregateView) -> dict:
+    """Folder-level figure: node size follows LOC, edge width follows import count."""
+    layout = view.layout
+    if layout is None:
+        return _empty_figure()
+    attributes = {node: i for i, node in enumerate(view.nodes)}
+    order = [attributes[node] for node in layout.nodes]
+    largest = max(view.lines_of_code, default=0) or 1
+    traces = [
+        {
+            "type": "scattergl",
+            "x": xs,
+            "y": ys,
+            "line": {"width": width, "color": "#888"},
+            "hoverinfo": "none",
+            "mode": "lines",
+        }
+        for width, xs, ys in view.edge_traces
+    ]
+    traces.append(
+        {
+            "type": "scattergl",
+            "x": layout.x.tolist(),
+            "y": layout.y.tolist(),
+            "mode": "markers+text",
+            "hoverinfo": "text",
+            "text": [view.nodes[i].rstrip(os.sep).rsplit(os.sep, 1)[-1] for i in order],
+            "hovertext": [
+                f"{view.nodes[i]}<br>{view.file_counts[i]:,} files, "
+                f"{view.lines_of_code[i]:,} lines"
+                for i in order
+            ],
+            "textposition": "bottom center",
+            "marker": {
+                "showscale": False,
+                "color": [GRAPH_NODE_COLORS[view.kinds[i]] for i in order],
+                "size": [
+                    8 + 32 * math.sqrt(view.lines_of_code[i] / largest) for i in order
+                ],
+                "line": {"width": 1},
+            },
         }
-        all_imported_modules = set()
-        file_paths_relative = {f["path"] for f in files_data if f["extension"] == ".py"}
-        for dependencies in dependency_graph.values():
-            for dep in dependencies:
-                potential_path = dep.replace(".", os.sep) + ".py"
-                if potential_path in file_paths_relative:
-                    all_imported_modules.add(potential_path)
-                init_path = os.path.join(dep.replace(".", os.sep), "__init__.py")
-                if init_path in file_paths_relative:
-                    all_imported_modules.add(init_path)
-        unused = all_scanned_py_files - all_imported_modules
-        unused = {f for f in unused if not f.endswith("__init__.py")}
-        return sorted(list(unused))
\ No newline at end of file
+    )
+    return {"data": traces, "layout": _graph_figure_layout()}
+
+
+def _needs_ingestion(archive_path: str) -> bool:
+    """Check an archive against the ingestion limits; True if it nests zips."""
+    import zipfile
+
+    from app.scanner.ingest import check_archive
+
+    with zipfile.ZipFile(archive_path) as archive:
+        members = check_archive(archive, os.path.basename(archive_path))
+        return any(info.filename.endswith(".zip") for info in members)
+
@@ -0,0 +1,67 @@
+"""Reachability benchmark: ``python scripts/bench_reachability.py [--nodes N] [--edges N]``.
+
+Builds a random import graph of Python-style paths (with package
+``__init__`` files and an ``app/app.py`` entry point) and times
+``analyze_reachability`` on it, best of ``--runs``, given the integer
+adjacency as ``resolve_import_graph`` produces it during a scan. Exits 1
+when the best run goes over ``--budget-ms`` (0 disables the check).
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.scanner.reachability import _adjacency, analyze_reachability  # noqa: E402
+
+PACKAGES = 500
+# Analyzing the default graph took ~1.5 s before the resolver built the
+# adjacency and GC was paused during the walk; fail well before that.
+DEFAULT_BUDGET_MS = 900
+
+
+def random_graph(nodes: int, edges: int, seed: int) -> dict[str, list[str]]:
+    rng = random.Random(seed)
+    paths = [f"app/pkg{i % PACKAGES}/mod{i}.py" for i in range(nodes - PACKAGES - 1)]
+    paths += [f"app/pkg{i}/__init__.py" for i in range(PACKAGES)]
+    paths.append("app/app.py")
+    targets: dict[str, set[str]] = {path: set() for path in paths}
+    for _ in range(edges):
+        targets[rng.choice(paths)].add(rng.choice(paths))
+    targets["app/app.py"].update(paths[:10])
+    return {path: sorted(t - {path}) for path, t in targets.items()}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=100_000)
+    parser.add_argument("--edges", type=int, default=1_000_000)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    args = parser.parse_args(argv)
+    graph = random_graph(args.nodes, args.edges, args.seed)
+    edge_count = sum(len(targets) for targets in graph.values())
+    adjacency = _adjacency(graph, {path: i for i, path in enumerate(graph)})
+    timings = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        unreachable, cycles = analyze_reachability(graph, adjacency=adjacency)
+        timings.append(time.perf_counter() - start)
+    best_ms = min(timings) * 1000
+    print(
+        f"{len(graph)} nodes, {edge_count} edges: {best_ms:.0f} ms best of {args.runs} "
+        f"({len(unreachable or ())} unreachable, {len(cycles)} cycles, "
+        f"largest {max(map(len, cycles), default=0)})"
+    )
+    if args.budget_ms and best_ms > args.budget_ms:
+        print(f"over budget ({args.budget_ms:g} ms)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""Import-time benchmark: ``python scripts/importtime.py [--runs N] [--top N]``.
+
+Imports each target module in a fresh interpreter under ``-X importtime``
+and reports its cumulative import time (best of ``--runs``) and the
+slowest modules it pulls in. Exits 1 when a target goes over its budget,
+fails to import, or loads a module it must not (e.g. Plotly from the
+headless scanner), so it can run in CI to catch import-time regressions.
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from typing import TypedDict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Target(TypedDict):
+    module: str
+    budget_ms: float
+    forbidden: list[str]
+
+
+TARGETS = [
+    Target(
+        module="app.scanner.__main__",
+        budget_ms=120,
+        forbidden=["reflex", "plotly", "multiprocessing", "sqlite3", "zipfile"],
+    ),
+    # The state module itself never imports Plotly, but reflex.utils.serializers
+    # imports plotly.graph_objects (and with it plotly.basedatatypes) whenever
+    # Plotly is installed, so only the trace classes can be ruled out here.
+    Target(
+        module="app.states.state",
+        budget_ms=2500,
+        forbidden=["plotly.graph_objs._scattergl", "plotly.validators"],
+    ),
+]
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def measure(module: str) -> tuple[int, list[tuple[int, str]]]:
+    """(cumulative microseconds, [(self microseconds, name)]) for one cold import."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+    modules = []
+    total = 0
+    for line in completed.stderr.splitlines():
+        m = _LINE.match(line)
+        if m is None:
+            continue
+        self_us, cumulative_us, indent, name = m.groups()
+        modules.append((int(self_us), name))
+        if name == module and len(indent) == 1:
+            total = int(cumulative_us)
+    return total, modules
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args(argv)
+    failed = False
+    for target in TARGETS:
+        module = target["module"]
+        try:
+            runs = [measure(module) for _ in range(args.runs)]
+        except RuntimeError as e:
+            print(f"{module}: import failed: {e}")
+            failed = True
+            continue
+        total, modules = min(runs)
+        total_ms = total / 1000
+        over = total_ms > target["budget_ms"]
+        print(f"{module}: {total_ms:.1f} ms (budget {target['budget_ms']:g} ms)")
+        for self_us, name in sorted(modules, reverse=True)[: args.top]:
+            print(f"    {self_us / 1000:7.1f} ms  {name}")
+        loaded = {name for _, name in modules}
+        forbidden = sorted(
+            name
+            for name in loaded
+            if any(name == f or name.startswith(f + ".") for f in target["forbidden"])
+        )
+        if forbidden:
+            print(f"    loads forbidden modules: {', '.join(forbidden)}")
+        if over or forbidden:
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+import json
+
+import pytest
+
+pytest.importorskip("starlette")
+pytest.importorskip("httpx")
+
+from starlette.testclient import TestClient  # noqa: E402
+
+from app import api  # noqa: E402
+from app.scanner.engine import scan_project  # noqa: E402
+from app.scanner.scheduler import ProjectHistory  # noqa: E402
+from app.scanner.store import SNAPSHOT_STORE  # noqa: E402
+from app.scanner.viewcache import ViewCache  # noqa: E402
+
+
+def _scan(root, count: int = 40):
+    (root / "app").mkdir(exist_ok=True)
+    (root / "app" / "app.py").write_text("import app.mod0\n")
+    for i in range(count):
+        (root / "app" / f"mod{i}.py").write_text(f"import app.mod{(i + 1) % count}\n")
+    snapshot = scan_project(str(root), workers=1)
+    SNAPSHOT_STORE.put(snapshot)
+    return snapshot
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(api, "PROJECT_HISTORY", ProjectHistory(SNAPSHOT_STORE))
+    return TestClient(api.api)
+
+
+def test_snapshot_or_project_is_required(client, tmp_path):
+    _scan(tmp_path)
+    for path in ("/api/snapshot/latest", "/api/files", "/api/dependencies", "/api/unused"):
+        response = client.get(path)
+        assert response.status_code == 400
+        assert "snapshot" in response.json()["error"]
+    assert client.get("/api/unused", params={"project": "unknown"}).status_code == 404
+
+
+def test_etag_revalidation(client, tmp_path):
+    snapshot = _scan(tmp_path)
+    params = {"snapshot": snapshot["snapshot_id"]}
+    response = client.get("/api/unused", params=params)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    revalidated = client.get("/api/unused", params=params, headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    other = client.get("/api/dependencies", params=params, headers={"If-None-Match": etag})
+    assert other.status_code == 200
+
+
+def test_gzip_only_above_threshold(client, tmp_path):
+    snapshot = _scan(tmp_path)
+    params = {"snapshot": snapshot["snapshot_id"]}
+    gzip = {"Accept-Encoding": "gzip"}
+    small = client.get("/api/unused", params=params, headers=gzip)
+    assert len(small.content) < api.GZIP_MIN_BYTES
+    assert "content-encoding" not in small.headers
+    large = client.get("/api/dependencies", params=params, headers=gzip)
+    assert len(large.content) >= api.GZIP_MIN_BYTES
+    assert large.headers["content-encoding"] == "gzip"
+    assert large.json()["graph"] == snapshot["resolved_graph"]
+    identity = client.get(
+        "/api/dependencies", params=params, headers={"Accept-Encoding": "identity"}
+    )
+    assert "content-encoding" not in identity.headers
+    assert identity.headers["etag"] != large.headers["etag"]
+
+
+def test_cursor_stays_on_its_snapshot(client, tmp_path):
+    first = _scan(tmp_path)
+    api.PROJECT_HISTORY.record("demo", first)
+    page = client.get("/api/files", params={"project": "demo", "limit": 10}).json()
+    assert page["snapshot_id"] == first["snapshot_id"]
+
+    (tmp_path / "app" / "extra.py").write_text("x = 1\n")
+    second = _scan(tmp_path)
+    api.PROJECT_HISTORY.record("demo", second)
+    assert client.get("/api/files", params={"project": "demo"}).json()["snapshot_id"] == (
+        second["snapshot_id"]
+    )
+
+    paths = [record["path"] for record in page["files"]]
+    cursor = page["next_cursor"]
+    while cursor:
+        page = client.get("/api/files", params={"cursor": cursor, "limit": 10}).json()
+        assert page["snapshot_id"] == first["snapshot_id"]
+        paths += [record["path"] for record in page["files"]]
+        cursor = page["next_cursor"]
+    assert paths == [record["path"] for record in first["files"].to_records()]
+    assert client.get("/api/files", params={"cursor": "not-a-cursor"}).status_code == 400
+
+
+def test_ndjson_streams(client, tmp_path):
+    snapshot = _scan(tmp_path)
+    params = {"snapshot": snapshot["snapshot_id"], "format": "ndjson"}
+    files = client.get("/api/files", params=params)
+    assert files.headers["content-type"].startswith(api.NDJSON_TYPE)
+    records = [json.loads(line) for line in files.text.splitlines()]
+    assert records == snapshot["files"].to_records()
+    edges = client.get(
+        "/api/dependencies",
+        params={"snapshot": snapshot["snapshot_id"]},
+        headers={"Accept": api.NDJSON_TYPE, "Accept-Encoding": "gzip"},
+    )
+    assert edges.headers["content-encoding"] == "gzip"
+    lines = [json.loads(line) for line in edges.text.splitlines()]
+    assert len(lines) == sum(len(t) for t in snapshot["resolved_graph"].values())
+    assert {"source": "app/app.py", "target": "app/mod0.py"} in lines
+
+
+def test_body_cache_is_bounded_by_size():
+    cache = ViewCache(max_entries=10, max_weight=100, weigh=lambda cached: len(cached.body))
+    for i in range(5):
+        cache.get("snap", "view", i, lambda: api.CachedBody(b"x" * 40))
+    assert cache.weight == 80
+    assert [key[2] for key in cache._views] == [3, 4]
+    cache.invalidate("snap")
+    assert cache.weight == 0
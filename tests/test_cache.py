@@ -0,0 +1,81 @@
+import itertools
+import os
+import types
+
+from app.scanner import cache as cache_module
+from app.scanner.cache import FileSignature, ScanCache
+from app.scanner.engine import analyze_files, analyze_files_incremental, walk_project
+from app.scanner.vfs import LocalFileSystem
+from tests.test_engine import _generate_project
+
+
+def _result(path: str, padding: int = 0) -> dict:
+    return {
+        "metrics": {"path": path, "size": 1, "lines_of_code": 1, "extension": ".py"},
+        "imports": ["x" * padding],
+        "submodule_imports": [],
+        "js_config": None,
+    }
+
+
+def test_unchanged_signatures_hit_and_modified_files_miss(tmp_path):
+    root = str(tmp_path / "project")
+    _generate_project(root, count=40)
+    fs = LocalFileSystem(root)
+    rel_paths = walk_project(fs)
+    cache = ScanCache(version="test", path=str(tmp_path / "cache.sqlite3"))
+    first = analyze_files_incremental(fs, rel_paths, cache, workers=1)
+    signatures = {path: fs.signature(path) for path in rel_paths}
+    assert set(cache.get_many(fs.cache_root, signatures)) == set(rel_paths)
+
+    changed = os.path.join("app", "pkg0", "mod0.py")
+    with open(os.path.join(root, changed), "a") as f:
+        f.write("import app.pkg1.mod1\n")
+    signatures[changed] = fs.signature(changed)
+    hits = cache.get_many(fs.cache_root, signatures)
+    assert set(rel_paths) - set(hits) == {changed}
+
+    second = analyze_files_incremental(fs, rel_paths, cache, workers=1)
+    assert second == analyze_files(fs, rel_paths, workers=1)
+    assert second != first
+    cache.close()
+
+
+def test_other_roots_and_inodes_miss(tmp_path):
+    cache = ScanCache(version="test", path=str(tmp_path / "cache.sqlite3"))
+    signature = FileSignature(10, 1000, 7)
+    cache.put_many("/a", [("mod.py", signature, _result("mod.py"))])
+    assert cache.get_many("/a", {"mod.py": signature}) == {"mod.py": _result("mod.py")}
+    assert cache.get_many("/b", {"mod.py": signature}) == {}
+    assert cache.get_many("/a", {"mod.py": signature._replace(inode=8)}) == {}
+    cache.close()
+
+
+def test_version_change_drops_every_entry(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    signature = FileSignature(10, 1000, 7)
+    cache = ScanCache(version="v1", path=path)
+    cache.put_many("/a", [("mod.py", signature, _result("mod.py"))])
+    cache.close()
+
+    cache = ScanCache(version="v2", path=path)
+    assert cache.get_many("/a", {"mod.py": signature}) == {}
+    cache.close()
+    cache = ScanCache(version="v1", path=path)
+    assert cache.get_many("/a", {"mod.py": signature}) == {}
+    cache.close()
+
+
+def test_least_recently_used_payloads_are_evicted(tmp_path, monkeypatch):
+    clock = itertools.count()
+    monkeypatch.setattr(cache_module, "time", types.SimpleNamespace(time=lambda: next(clock)))
+    signature = FileSignature(10, 1000, 7)
+    cache = ScanCache(version="test", path=str(tmp_path / "cache.sqlite3"), max_bytes=4000)
+    for name in ("a.py", "b.py", "c.py"):
+        cache.put_many("/root", [(name, signature, _result(name, padding=1000))])
+    assert cache.get_many("/root", {"a.py": signature})
+    cache.put_many("/root", [("d.py", signature, _result("d.py", padding=1000))])
+
+    signatures = dict.fromkeys(["a.py", "b.py", "c.py", "d.py"], signature)
+    assert sorted(cache.get_many("/root", signatures)) == ["a.py", "c.py", "d.py"]
+    cache.close()
@@ -0,0 +1,29 @@
+import os
+
+import pytest
+
+from app.scanner.__main__ import main
+
+
+def test_missing_path_is_a_usage_error(tmp_path, capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        main([str(tmp_path / "missing"), "--fail-on", "unused"])
+    assert excinfo.value.code == 2
+    assert "no such directory or zip archive" in capsys.readouterr().err
+
+
+def test_plain_file_is_a_usage_error(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("hello\n")
+    with pytest.raises(SystemExit) as excinfo:
+        main([str(path)])
+    assert excinfo.value.code == 2
+
+
+def test_fail_on_unused(tmp_path):
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "app.py").write_text("x = 1\n")
+    (tmp_path / "app" / "orphan.py").write_text("y = 2\n")
+    output = os.path.join(tmp_path, "snapshot.json")
+    assert main([str(tmp_path), "-o", output, "--workers", "1"]) == 0
+    assert main([str(tmp_path), "-o", output, "--workers", "1", "--fail-on", "unused"]) == 1
@@ -0,0 +1,76 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from app.scanner import engine
+from app.scanner.engine import analyze_files, scan_project, walk_project
+from app.scanner.vfs import LocalFileSystem
+
+BATCH_SIZE = 16
+
+
+def _generate_project(root: str, count: int = 200) -> None:
+    for i in range(count):
+        package = os.path.join(root, "app", f"pkg{i % 7}")
+        os.makedirs(package, exist_ok=True)
+        with open(os.path.join(package, f"mod{i}.py"), "w") as f:
+            f.write(f"import app.pkg{(i * 3) % 7}.mod{(i * 5) % count}\n")
+            f.write("import requests\nfrom app.states import state\n" if i % 11 == 0 else "")
+            f.write(f"def handler_{i}(value):\n    return value * {i}\n")
+        if i % 13 == 0:
+            with open(os.path.join(package, f"widget{i}.tsx"), "w") as f:
+                f.write(f"import {{ a }} from './widget{(i + 13) % count}'\n")
+                f.write("export const Widget = () => null\n")
+    for i in range(7):
+        open(os.path.join(root, "app", f"pkg{i}", "__init__.py"), "w").close()
+    with open(os.path.join(root, "app", "app.py"), "w") as f:
+        f.write("import app.pkg0.mod0\n")
+    with open(os.path.join(root, "app", "broken.py"), "w") as f:
+        f.write("def broken(:\n")
+
+
+def _comparable(snapshot) -> dict:
+    data = dict(snapshot)
+    for key in ("snapshot_id", "timestamp"):
+        data.pop(key)
+    data["files"] = snapshot["files"].to_records()
+    return data
+
+
+def test_serial_and_pool_scans_are_identical(tmp_path):
+    root = str(tmp_path)
+    _generate_project(root)
+    try:
+        fs = LocalFileSystem(root)
+        rel_paths = walk_project(fs)
+        assert len(rel_paths) > 2 * BATCH_SIZE
+        serial_results = analyze_files(fs, rel_paths, workers=1, batch_size=BATCH_SIZE)
+        pool_results = analyze_files(fs, rel_paths, workers=2, batch_size=BATCH_SIZE)
+        assert 2 in engine._executors
+        assert serial_results == pool_results
+
+        serial = scan_project(root, workers=1, batch_size=BATCH_SIZE)
+        pool = scan_project(root, workers=2, batch_size=BATCH_SIZE)
+        assert _comparable(serial) == _comparable(pool)
+    finally:
+        engine.shutdown_executors()
+
+
+def test_concurrent_scans_with_different_worker_counts(tmp_path):
+    root = str(tmp_path)
+    _generate_project(root)
+    fs = LocalFileSystem(root)
+    rel_paths = walk_project(fs)
+    expected = analyze_files(fs, rel_paths, workers=1, batch_size=BATCH_SIZE)
+    try:
+        with ThreadPoolExecutor(max_workers=4) as threads:
+            futures = [
+                threads.submit(
+                    analyze_files, fs, rel_paths, workers=workers, batch_size=BATCH_SIZE
+                )
+                for workers in (2, 3, 2, 3)
+            ]
+            results = [future.result() for future in futures]
+        assert all(result == expected for result in results)
+        assert sorted(engine._executors) == [2, 3]
+    finally:
+        engine.shutdown_executors()
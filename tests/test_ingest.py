@@ -0,0 +1,119 @@
+import io
+import os
+import struct
+import zipfile
+
+import pytest
+
+from app.scanner.ingest import (
+    ArchiveLimitExceeded,
+    RATIO_CHECK_MIN_BYTES,
+    _ByteBudget,
+    ingest_archives,
+)
+from app.scanner.vfs import ZipFileSystem
+
+
+def _zip_bytes(members: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def _write_zip(path, members: dict[str, bytes]) -> str:
+    path.write_bytes(_zip_bytes(members))
+    return str(path)
+
+
+def _forge_declared_size(path: str, size: int) -> None:
+    """Rewrite every header to claim ``size`` uncompressed bytes."""
+    with open(path, "rb") as f:
+        data = bytearray(f.read())
+    for signature, offset in ((b"PK\x03\x04", 22), (b"PK\x01\x02", 24)):
+        start = data.find(signature)
+        while start != -1:
+            struct.pack_into("<I", data, start + offset, size)
+            start = data.find(signature, start + 4)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def test_nested_zips_become_folders(tmp_path):
+    inner = _zip_bytes({"pkg/mod.py": b"import os\n"})
+    archive = _write_zip(
+        tmp_path / "project.zip", {"app/app.py": b"x = 1\n", "vendor/lib.zip": inner}
+    )
+    dest = tmp_path / "out"
+    roots = ingest_archives([archive], str(dest))
+    assert roots == [str(dest / "project")]
+    files = sorted(
+        os.path.relpath(os.path.join(root, name), dest)
+        for root, _, names in os.walk(dest)
+        for name in names
+    )
+    assert files == [
+        os.path.join("project", "app", "app.py"),
+        os.path.join("project", "vendor", "lib", "pkg", "mod.py"),
+    ]
+
+
+def test_nesting_stops_at_the_depth_limit(tmp_path):
+    data = _zip_bytes({"leaf.py": b"x = 1\n"})
+    for depth in range(3, 0, -1):
+        data = _zip_bytes({f"level{depth}.zip": data})
+    archive = _write_zip(tmp_path / "outer.zip", {"level0.zip": data})
+    dest = tmp_path / "out"
+    ingest_archives([archive], str(dest), max_nesting=2)
+    assert (dest / "outer" / "level0" / "level1" / "level2.zip").is_file()
+    assert not (dest / "outer" / "level0" / "level1" / "level2").exists()
+
+
+def test_parent_directory_members_are_rejected(tmp_path):
+    archive = _write_zip(tmp_path / "evil.zip", {"ok.py": b"", "../escape.py": b"x"})
+    with pytest.raises(ArchiveLimitExceeded, match="unsafe path"):
+        ingest_archives([archive], str(tmp_path / "out"))
+    with pytest.raises(ArchiveLimitExceeded, match="unsafe path"):
+        ZipFileSystem(archive)
+    assert not (tmp_path / "escape.py").exists()
+
+
+def test_compression_ratio_limit(tmp_path):
+    zeros = bytes(2 * RATIO_CHECK_MIN_BYTES)
+    archive = _write_zip(tmp_path / "bomb.zip", {"zeros.bin": zeros})
+    with pytest.raises(ArchiveLimitExceeded, match="compression ratio"):
+        ingest_archives([archive], str(tmp_path / "out"))
+    with pytest.raises(ArchiveLimitExceeded, match="compression ratio"):
+        ZipFileSystem(archive)
+    # Small members are exempt however well they compress.
+    small = _write_zip(tmp_path / "small.zip", {"zeros.bin": bytes(RATIO_CHECK_MIN_BYTES)})
+    fs = ZipFileSystem(small)
+    assert fs.read("zeros.bin") == bytes(RATIO_CHECK_MIN_BYTES)
+    fs.close()
+
+
+def test_declared_size_limit(tmp_path):
+    archive = _write_zip(tmp_path / "big.zip", {"a.py": b"a" * 600, "b.py": b"b" * 600})
+    with pytest.raises(ArchiveLimitExceeded, match="byte limit"):
+        ingest_archives([archive], str(tmp_path / "out"), max_bytes=1000)
+    assert ingest_archives([archive], str(tmp_path / "ok"), max_bytes=1200)
+
+    # Members small enough to skip the ratio check, declaring 1.1 GB in total.
+    forged = _write_zip(tmp_path / "forged.zip", {f"m{i}.py": b"a" for i in range(1100)})
+    _forge_declared_size(forged, RATIO_CHECK_MIN_BYTES)
+    with pytest.raises(ArchiveLimitExceeded, match="byte limit"):
+        ZipFileSystem(forged)
+
+
+def test_byte_budget_spans_nested_archives(tmp_path):
+    inner = _zip_bytes({"data.txt": b"x" * 600})
+    archive = _write_zip(tmp_path / "outer.zip", {"one.zip": inner, "two.zip": inner})
+    # Each archive passes its own declared-size check; together they do not.
+    with pytest.raises(ArchiveLimitExceeded):
+        ingest_archives([archive], str(tmp_path / "out"), max_bytes=1000)
+
+    budget = _ByteBudget(100)
+    budget.charge(60)
+    with pytest.raises(ArchiveLimitExceeded, match="uncompressed limit"):
+        budget.charge(41)
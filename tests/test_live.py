@@ -0,0 +1,132 @@
+import os
+import random
+
+import pytest
+
+from app.scanner.engine import scan_project
+from app.scanner.filetree import build_file_tree, tree_for
+from app.scanner.live import LiveProject
+
+TSCONFIGS = (
+    '{"compilerOptions": {"baseUrl": ".", "paths": {"@lib/*": ["src/*"]}}}',
+    '{"compilerOptions": {"baseUrl": "src"}}',
+    "{}",
+)
+
+
+def _tree(node) -> tuple:
+    return (
+        node.file_count,
+        sorted(node.files),
+        {name: _tree(child) for name, child in node.folders.items()},
+    )
+
+
+def _comparable(snapshot) -> dict:
+    data = dict(snapshot)
+    for key in ("snapshot_id", "timestamp"):
+        data.pop(key)
+    data["files"] = sorted(map(repr, snapshot["files"].to_records()))
+    data["architecture_violations"] = sorted(snapshot["architecture_violations"])
+    return data
+
+
+def _assert_matches_full_scan(root: str, snapshot) -> None:
+    full = scan_project(root, workers=1)
+    assert _comparable(snapshot) == _comparable(full)
+    assert _tree(tree_for(snapshot)) == _tree(build_file_tree(full["files"]))
+
+
+def _write(root: str, path: str, text: str) -> None:
+    full = os.path.join(root, path)
+    os.makedirs(os.path.dirname(full), exist_ok=True)
+    with open(full, "w") as f:
+        f.write(text)
+
+
+def _random_module(rng: random.Random, names: list[str]) -> str:
+    lines = []
+    for name in rng.sample(names, rng.choice([0, 0, 1, 2, 3])):
+        specifier = rng.choice([f"./{name}", f"@lib/{name}", name, f"./{name}.js"])
+        lines.append(f"import {{ x }} from '{specifier}'\n")
+    return "".join(lines) + f"export const x = {rng.randint(0, 9)}\n"
+
+
+@pytest.mark.parametrize("seed", [14, 95, 111, 116, 1, 2, 3])
+def test_live_js_project_matches_full_scan(tmp_path, seed):
+    rng = random.Random(seed)
+    root = str(tmp_path)
+    names = [f"m{i}" for i in range(8)]
+    entries = ["src/index.ts", "src/main.tsx", "src/a.test.ts"]
+    for name in names:
+        _write(root, f"src/{name}.ts", _random_module(rng, names))
+    for entry in entries:
+        _write(root, entry, _random_module(rng, names))
+    _write(root, "tsconfig.json", TSCONFIGS[0])
+    live = LiveProject(root)
+    _assert_matches_full_scan(root, live.start(workers=1))
+
+    for _ in range(25):
+        existing = sorted(live.results)
+        action = rng.choice(["edit", "edit", "add", "remove", "tsconfig"])
+        if action == "edit":
+            path = rng.choice(existing)
+            if path.endswith(".json"):
+                continue
+            _write(root, path, _random_module(rng, names))
+        elif action == "add":
+            path = rng.choice([f"src/{name}.ts" for name in names] + entries)
+            _write(root, path, _random_module(rng, names))
+        elif action == "remove":
+            path = rng.choice(existing)
+            os.remove(os.path.join(root, path))
+        else:
+            path = "tsconfig.json"
+            _write(root, path, rng.choice(TSCONFIGS))
+        snapshot = live.apply([path])
+        if snapshot is not None:
+            _assert_matches_full_scan(root, snapshot)
+
+
+def test_removing_the_last_entry_point_falls_back_to_importers(tmp_path):
+    root = str(tmp_path)
+    _write(root, "src/index.ts", "export const main = 1\n")
+    _write(root, "src/a.ts", "export const x = 1\n")
+    _write(root, "src/b.ts", "import { x } from './a'\n")
+    live = LiveProject(root)
+    live.start(workers=1)
+
+    os.remove(os.path.join(root, "src/index.ts"))
+    snapshot = live.apply(["src/index.ts"])
+    assert live.reached is None
+    assert snapshot["unused_components"] == ["src/b.ts"]
+    _assert_matches_full_scan(root, snapshot)
+
+    _write(root, "src/b.ts", "import { x } from './a'\nexport const y = 2\n")
+    snapshot = live.apply(["src/b.ts"])
+    _assert_matches_full_scan(root, snapshot)
+
+
+def test_live_python_project_matches_full_scan(tmp_path):
+    root = str(tmp_path)
+    _write(root, "app/app.py", "import app.pages.home\n")
+    _write(root, "app/__init__.py", "")
+    _write(root, "app/pages/__init__.py", "")
+    _write(root, "app/pages/home.py", "import app.util\n")
+    _write(root, "app/util.py", "x = 1\n")
+    live = LiveProject(root)
+    _assert_matches_full_scan(root, live.start(workers=1))
+
+    steps = [
+        ("app/util.py", "import app.pages.home\nimport requests\n"),
+        ("app/pages/extra.py", "import app.missing\n"),
+        ("app/missing.py", "from app.pages import extra\n"),
+        ("app/util.py", "x = 2\n"),
+    ]
+    for path, text in steps:
+        _write(root, path, text)
+        _assert_matches_full_scan(root, live.apply([path]))
+    os.remove(os.path.join(root, "app/missing.py"))
+    _assert_matches_full_scan(root, live.apply(["app/missing.py"]))
+    os.remove(os.path.join(root, "app/app.py"))
+    _assert_matches_full_scan(root, live.apply(["app/app.py"]))
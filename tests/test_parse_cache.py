@@ -0,0 +1,71 @@
+import pytest
+
+from app.scanner import analyzers, engine
+from app.scanner.engine import scan_project
+from app.scanner.parse_cache import ParseCache, ParseStore, RawImport
+
+SOURCE = "import os\nfrom app.util import helper\nfrom .helpers import build\n"
+
+
+@pytest.fixture
+def parses(tmp_path, monkeypatch):
+    """Scans use a fresh parse cache on a temporary store; returns the parsed trees."""
+    cache = ParseCache(store=ParseStore(str(tmp_path / "parse.sqlite3")))
+    monkeypatch.setattr(analyzers, "PARSE_CACHE", cache)
+    monkeypatch.setattr(engine, "PARSE_CACHE", cache)
+    parsed = []
+    raw_python_imports = analyzers.raw_python_imports
+
+    def counting(tree):
+        parsed.append(tree)
+        return raw_python_imports(tree)
+
+    monkeypatch.setattr(analyzers, "raw_python_imports", counting)
+    return parsed
+
+
+def _project(root, files: dict[str, str]) -> str:
+    for path, text in files.items():
+        (root / path).parent.mkdir(parents=True, exist_ok=True)
+        (root / path).write_text(text)
+    return str(root)
+
+
+def test_identical_files_parse_once_across_paths_and_uploads(tmp_path, parses):
+    first = _project(tmp_path / "upload1", {"app/a.py": SOURCE, "app/sub/b.py": SOURCE})
+    second = _project(tmp_path / "upload2", {"pkg/c.py": SOURCE})
+    snapshots = [scan_project(first, workers=1), scan_project(second, workers=1)]
+    assert len(parses) == 1
+    # The shared parse is still resolved against each file's own path.
+    graphs = [snapshot["dependency_graph"] for snapshot in snapshots]
+    assert graphs[0]["app/a.py"] == ["app.helpers", "app.util", "os"]
+    assert graphs[0]["app/sub/b.py"] == ["app.sub.helpers", "app.util", "os"]
+    assert graphs[1]["pkg/c.py"] == ["app.util", "os", "pkg.helpers"]
+
+
+def test_caches_share_parses_through_the_store(tmp_path):
+    path = str(tmp_path / "parse.sqlite3")
+    imports = (RawImport("os", 0, None), RawImport(None, 1, ("sibling",)))
+    worker_a = ParseCache(store=ParseStore(path))
+    worker_b = ParseCache(store=ParseStore(path))
+    assert worker_a.get_or_parse(b"digest", lambda: imports) == imports
+    worker_a.flush()
+    assert worker_b.get_or_parse(b"digest", lambda: pytest.fail("parsed twice")) == imports
+    assert (worker_b.hits, worker_b.misses) == (1, 0)
+
+
+def test_store_keeps_the_newest_rows(tmp_path):
+    store = ParseStore(str(tmp_path / "parse.sqlite3"), max_rows=2)
+    for i in range(5):
+        store.put(bytes([i]), (RawImport(f"m{i}", 0, None),))
+    store.flush()
+    assert [store.get(bytes([i])) is not None for i in range(5)] == [False] * 3 + [True] * 2
+
+
+def test_unusable_store_falls_back_to_parsing(tmp_path, caplog):
+    (tmp_path / "file").write_text("")
+    cache = ParseCache(store=ParseStore(str(tmp_path / "file" / "parse.sqlite3")))
+    imports = (RawImport("os", 0, None),)
+    assert cache.get_or_parse(b"digest", lambda: imports) == imports
+    cache.flush()
+    assert "disabled" in caplog.text
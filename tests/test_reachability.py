@@ -0,0 +1,66 @@
+from app.scanner.engine import analyze_files, walk_project
+from app.scanner.javascript import JsResolver
+from app.scanner.modules import ModuleIndex, resolve_import_graph
+from app.scanner.reachability import (
+    EntryPoints,
+    _adjacency,
+    analyze_reachability,
+    strongly_connected_components,
+)
+from app.scanner.vfs import LocalFileSystem
+from tests.test_engine import _generate_project
+
+
+def test_entry_points_match_files_directories_and_globs():
+    entry_points = EntryPoints(["app/app.py", "tests", "*conftest.py", "src/main.*"])
+    assert entry_points.matches("app/app.py")
+    assert entry_points.matches("tests/unit/test_a.py")
+    assert entry_points.matches("tests")
+    assert entry_points.matches("pkg/conftest.py")
+    assert entry_points.matches("src/main.tsx")
+    assert not entry_points.matches("app/app.pyc")
+    assert not entry_points.matches("testsuite/a.py")
+    assert not EntryPoints([]).matches("app/app.py")
+
+
+def test_components_with_leaves_are_reverse_topological():
+    # 0 -> 1 <-> 2 -> 3, 2 -> 4 (leaf), 5 alone
+    adjacency = [[1], [2], [1, 3, 4], [], [], []]
+    components = strongly_connected_components(adjacency)
+    assert sorted(map(sorted, components)) == [[0], [1, 2], [3], [4], [5]]
+    position = {node: i for i, component in enumerate(components) for node in component}
+    for node, successors in enumerate(adjacency):
+        for successor in successors:
+            assert position[successor] <= position[node]
+
+
+def test_analyze_reachability_follows_imports_and_packages():
+    graph = {
+        "app/app.py": ["app/pages/home.py"],
+        "app/__init__.py": [],
+        "app/pages/__init__.py": ["app/util.py"],
+        "app/pages/home.py": ["app/pages/card.py", "web/style.css"],
+        "app/pages/card.py": ["app/pages/home.py"],
+        "app/util.py": [],
+        "app/orphan.py": ["app/orphan_b.py"],
+        "app/orphan_b.py": ["app/orphan.py"],
+    }
+    unreachable, cycles = analyze_reachability(graph, ["app/app.py"])
+    assert unreachable == ["app/orphan.py", "app/orphan_b.py"]
+    assert cycles == [
+        ["app/orphan.py", "app/orphan_b.py"],
+        ["app/pages/card.py", "app/pages/home.py"],
+    ]
+    assert analyze_reachability(graph, ["main.py"])[0] is None
+
+
+def test_resolver_adjacency_matches_the_graph(tmp_path):
+    _generate_project(str(tmp_path))
+    fs = LocalFileSystem(str(tmp_path))
+    rel_paths = walk_project(fs)
+    results = analyze_files(fs, rel_paths, workers=1)
+    index = ModuleIndex(path for path in rel_paths if path.endswith(".py"))
+    graph, _, _, adjacency = resolve_import_graph(results, index, JsResolver(rel_paths, {}))
+    assert any(path.endswith(".tsx") for path in graph)
+    assert adjacency == _adjacency(graph, {path: i for i, path in enumerate(graph)})
+    assert analyze_reachability(graph, adjacency=adjacency) == analyze_reachability(graph)
@@ -0,0 +1,54 @@
+import asyncio
+import os
+
+from app.scanner.coordinator import ScanCoordinator
+from app.scanner.scheduler import run_scan_blocking
+
+FILE_COUNT = 3000
+TICK_SECONDS = 0.01
+MAX_LAG_SECONDS = 0.1
+
+
+def _generate_project(root: str) -> None:
+    for i in range(FILE_COUNT):
+        package = os.path.join(root, "app", f"pkg{i % 30}")
+        os.makedirs(package, exist_ok=True)
+        with open(os.path.join(package, f"mod{i}.py"), "w") as f:
+            f.write(f"import app.pkg{(i + 1) % 30}.mod{(i + 1) % FILE_COUNT}\n")
+            f.write("def handler(value):\n    return value * 2\n" * 20)
+    for i in range(30):
+        open(os.path.join(root, "app", f"pkg{i}", "__init__.py"), "w").close()
+
+
+async def _scan_with_ticker(root: str) -> tuple[dict, float, int]:
+    loop = asyncio.get_running_loop()
+    updates = []
+    lags = []
+
+    async def ticker():
+        while True:
+            expected = loop.time() + TICK_SECONDS
+            await asyncio.sleep(TICK_SECONDS)
+            lags.append(loop.time() - expected)
+
+    tick_task = asyncio.ensure_future(ticker())
+    try:
+        snapshot = await ScanCoordinator(ttl_seconds=0).run(
+            root,
+            lambda progress, control: run_scan_blocking(
+                root, workers=1, use_cache=False, progress=progress, control=control
+            ),
+            progress=lambda progress: loop.call_soon_threadsafe(updates.append, progress),
+        )
+    finally:
+        tick_task.cancel()
+    return snapshot, max(lags), len(lags)
+
+
+def test_scan_does_not_block_event_loop(tmp_path):
+    root = str(tmp_path)
+    _generate_project(root)
+    snapshot, max_lag, ticks = asyncio.run(_scan_with_ticker(root))
+    assert snapshot["total_files"] == FILE_COUNT + 30
+    assert ticks > 5
+    assert max_lag < MAX_LAG_SECONDS
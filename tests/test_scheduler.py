@@ -0,0 +1,86 @@
+import asyncio
+import json
+
+import pytest
+
+from app.scanner import scheduler
+from app.scanner.scheduler import (
+    load_config,
+    multiple_backend_workers,
+    run_configured_scheduler,
+)
+
+
+def _write_config(tmp_path, data) -> str:
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps(data))
+    return str(path)
+
+
+def test_malformed_projects_are_skipped(tmp_path, caplog):
+    path = _write_config(
+        tmp_path,
+        {
+            "projects": [
+                {"name": "good", "path": "good", "priority": 2},
+                {"name": "null-interval", "path": "a", "min_interval_seconds": None},
+                {"name": "list-path", "path": ["a"]},
+                {"name": "bad-priority", "path": "a", "priority": "high"},
+                {"name": "bad-roots", "path": "a", "source_roots": "src"},
+                {"name": "bad-budget", "path": "a", "budget": {"max_lines": 1}},
+                {"name": "good", "path": "duplicate"},
+                "not an object",
+                {"name": "budgeted", "path": "b", "budget": {"max_files": "10"}},
+            ]
+        },
+    )
+    settings, projects = load_config(path)
+    assert [project["name"] for project in projects] == ["good", "budgeted"]
+    assert projects[0]["path"] == str(tmp_path / "good")
+    assert projects[1]["budget"] == {"max_files": 10}
+    assert settings["max_concurrent"] >= 1
+    assert caplog.text.count("Skipping project") == 7
+
+
+@pytest.mark.parametrize(
+    "scheduler",
+    [{"max_concurrent": None}, {"max_queue": 0}, ["max_queue"], {"workers": "many"}],
+)
+def test_malformed_scheduler_settings_raise_value_error(tmp_path, scheduler):
+    path = _write_config(tmp_path, {"scheduler": scheduler, "projects": []})
+    with pytest.raises(ValueError):
+        load_config(path)
+
+
+def test_missing_config_means_no_projects(tmp_path):
+    _, projects = load_config(str(tmp_path / "missing.json"))
+    assert projects == []
+
+
+@pytest.mark.parametrize(
+    "env, expected",
+    [
+        ({}, False),
+        ({"GRANIAN_WORKERS": "1", "GUNICORN_CMD_ARGS": "--workers 1 --timeout 30"}, False),
+        ({"REFLEX_REDIS_URL": "redis://localhost"}, True),
+        ({"GRANIAN_WORKERS": "4"}, True),
+        ({"GUNICORN_CMD_ARGS": "--workers=3"}, True),
+        ({"GUNICORN_CMD_ARGS": "-w 2 --threads 4"}, True),
+    ],
+)
+def test_multiple_backend_workers(monkeypatch, env, expected):
+    for name in ("REFLEX_REDIS_URL", "GRANIAN_WORKERS", "WEB_CONCURRENCY"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.delenv("GUNICORN_CMD_ARGS", raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    assert multiple_backend_workers() is expected
+
+
+def test_scheduler_needs_a_leader_with_several_workers(tmp_path, monkeypatch, caplog):
+    path = _write_config(tmp_path, {"projects": [{"name": "web", "path": "web"}]})
+    monkeypatch.setenv("GRANIAN_WORKERS", "4")
+    monkeypatch.delenv("INDU_SCHEDULER_LEADER", raising=False)
+    asyncio.run(run_configured_scheduler(path))
+    assert "Not starting the project scheduler" in caplog.text
+    assert scheduler.SCHEDULER is None
@@ -0,0 +1,65 @@
+import pickle
+import time
+import zipfile
+
+from app.scanner import engine
+from app.scanner.engine import scan_project
+from app.scanner.vfs import ZipFileSystem
+
+MEMBER_COUNT = 5000
+
+
+def _write_archive(path: str, count: int = MEMBER_COUNT) -> None:
+    with zipfile.ZipFile(path, "w") as archive:
+        for i in range(count):
+            archive.writestr(
+                f"project/app/pkg{i % 50}/mod{i}.py",
+                f"import app.pkg{(i + 1) % 50}.mod{(i + 1) % count}\nvalue = {i}\n",
+            )
+        archive.writestr("project/app/app.py", "import app.pkg0.mod0\n")
+
+
+def _comparable(snapshot) -> dict:
+    data = dict(snapshot)
+    for key in ("snapshot_id", "timestamp"):
+        data.pop(key)
+    data["files"] = snapshot["files"].to_records()
+    return data
+
+
+def test_unpickled_archives_reuse_the_open_zip(tmp_path):
+    path = str(tmp_path / "project.zip")
+    _write_archive(path)
+    fs = ZipFileSystem(path)
+    payload = pickle.dumps(fs)
+    start = time.perf_counter()
+    first = pickle.loads(payload)
+    open_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    copies = [pickle.loads(payload) for _ in range(50)]
+    assert time.perf_counter() - start < max(open_seconds, 0.01)
+    assert all(copy._zip is first._zip for copy in copies)
+    assert copies[0].members is first.members
+    copies[0].close()
+    assert first.read("app/app.py") == b"import app.pkg0.mod0\n"
+    fs.close()
+
+
+def test_pool_scan_of_archive_matches_serial(tmp_path):
+    path = str(tmp_path / "project.zip")
+    _write_archive(path)
+    try:
+        start = time.perf_counter()
+        serial = scan_project(path, workers=1, batch_size=50)
+        serial_seconds = time.perf_counter() - start
+        scan_project(path, workers=2, batch_size=50)  # start the pool
+        start = time.perf_counter()
+        pool = scan_project(path, workers=2, batch_size=50)
+        pool_seconds = time.perf_counter() - start
+    finally:
+        engine.shutdown_executors()
+    assert serial["total_files"] == MEMBER_COUNT + 1
+    assert _comparable(serial) == _comparable(pool)
+    # Reopening the archive for each of the 100 batches cost several times
+    # the serial scan; with the per-process archive cache the pool keeps up.
+    assert pool_seconds < 2 * serial_seconds + 1